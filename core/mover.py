@@ -8,7 +8,9 @@ def move_unused_vars(addon_dir: Path, used_var_names: set):
 
     moved = []
 
-    for var_file in addon_dir.glob("*.var"):
+    for var_file in list(addon_dir.iterdir()):
+        if not var_file.name.lower().endswith(".var"):
+            continue
         if var_file.name not in used_var_names:
             shutil.move(str(var_file), target / var_file.name)
             moved.append(var_file.name)
@@ -1,5 +1,6 @@
+import os
 from pathlib import Path
-from core.scanner import scan_var
+from core.scan_cache import cached_scan_var
 
 def is_asset_var(var_name: str) -> bool:
     lname = var_name.lower()
@@ -10,13 +11,38 @@ def is_asset_var(var_name: str) -> bool:
     )
 
 
-def resolve_dependency(dep_name: str, all_vars: set[str]) -> list[str]:
+def is_protected_var(var_name: str) -> bool:
+    """
+    Never disabled by the keep-set logic: assets (see is_asset_var) and plugins.
+    """
+    return is_asset_var(var_name) or "[plugin]" in var_name.lower()
+
+
+def build_dependency_index(all_vars: set[str]) -> dict[str, list[str]]:
+    """
+    Map every dot-prefix of each VAR name to the names that start with prefix + ".".
+    Lets resolve_dependency answer "*.latest" with one dict lookup instead of
+    scanning all_vars (same matches as the startswith scan).
+    """
+    index: dict[str, list[str]] = {}
+    for v in all_vars:
+        if not v.endswith(".var"):
+            continue
+        i = v.find(".")
+        while i != -1:
+            index.setdefault(v[:i], []).append(v)
+            i = v.find(".", i + 1)
+    return index
+
+
+def resolve_dependency(dep_name: str, all_vars: set[str], index: dict[str, list[str]] | None = None) -> list[str]:
     """
     Resolve a VaM dependency string into actual .var filenames.
 
     Rules:
     - "*.latest" → match any VAR starting with base + "."
     - exact version → match exact VAR only
+    index: optional build_dependency_index(all_vars) for the "*.latest" case.
     """
     matches = []
 
@@ -28,6 +54,8 @@ def resolve_dependency(dep_name: str, all_vars: set[str]) -> list[str]:
 
     if dep_name.endswith(".latest"):
         base = dep_name[:-len(".latest")]
+        if index is not None:
+            return list(index.get(base, ()))
         matches = [
             v for v in all_vars
             if v.startswith(base + ".") and v.endswith(".var")
@@ -47,15 +75,18 @@ def collect_used_and_unused_vars(var_dir: Path):
     - Resolves dependencies recursively (VaM-correct)
     - Returns used & unused VARs
     """
-    all_vars = {v.name for v in var_dir.glob("*.var")}
+    # plain suffix test instead of glob's per-entry fnmatch (case-insensitive like Windows)
+    with os.scandir(var_dir) as it:
+        all_vars = {e.name for e in it if e.name.lower().endswith(".var")}
 
+    index = build_dependency_index(all_vars)
     used_vars = set()
     scene_vars = set()
     queue = []
 
     # 1️⃣ Seed from scene-containing VARs
     for var_name in all_vars:
-        info = scan_var(var_dir / var_name)
+        info = cached_scan_var(var_dir / var_name)
         if info.get("has_scene"):
             scene_vars.add(var_name)
             used_vars.add(var_name)
@@ -65,10 +96,10 @@ def collect_used_and_unused_vars(var_dir: Path):
     while queue:
         dep = queue.pop()
 
-        for matched_var in resolve_dependency(dep, all_vars):
+        for matched_var in resolve_dependency(dep, all_vars, index):
             if matched_var not in used_vars:
                 used_vars.add(matched_var)
-                info = scan_var(var_dir / matched_var)
+                info = cached_scan_var(var_dir / matched_var)
                 queue.extend(info.get("dependencies", []))
 
     protected_assets = {v for v in all_vars if is_asset_var(v)}
@@ -0,0 +1,105 @@
+# core/scan_cache.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from core.scanner import scan_var_meta_only
+
+# Meta-only scan results persisted across runs, one small JSON per VAR file.
+# Key = sha256 of (path, mtime_ns, size): a changed/moved file simply misses.
+# Off until configure() is called (the GUI points it at its app data dir).
+
+MAX_ENTRIES = 50_000
+
+_root: Path | None = None
+
+
+def configure(root: Path | None):
+    global _root
+    _root = root
+
+
+def _entry_path(path: Path, st: os.stat_result) -> Path | None:
+    if _root is None:
+        return None
+    h = hashlib.sha256(f"{os.fspath(path)}\0{st.st_mtime_ns}\0{st.st_size}".encode("utf-8")).hexdigest()
+    return _root / h[:2] / (h[2:] + ".json")
+
+
+def get(path: Path, st: os.stat_result | None = None) -> dict[str, Any] | None:
+    try:
+        ep = _entry_path(path, st or os.stat(path))
+        if ep is None:
+            return None
+        with open(ep, "rb") as f:
+            info = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    return info if isinstance(info, dict) else None
+
+
+def put(path: Path, info: dict[str, Any], st: os.stat_result | None = None):
+    # only complete scans: a locked/half-copied file must not stick for this stamp
+    if "package_name" not in info:
+        return
+    try:
+        ep = _entry_path(path, st or os.stat(path))
+        if ep is None:
+            return
+        ep.parent.mkdir(parents=True, exist_ok=True)
+        tmp = ep.with_suffix(".tmp")
+        tmp.write_text(json.dumps(info, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, ep)
+    except OSError:
+        pass
+
+
+def cached_scan_var(path: Path, st: os.stat_result | None = None) -> dict[str, Any]:
+    """
+    scan_var_meta_only through the disk cache (no zip open on a hit).
+    """
+    if st is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return scan_var_meta_only(path)
+    info = get(path, st)
+    if info is None:
+        info = scan_var_meta_only(path)
+        put(path, info, st)
+    return info
+
+
+def prune(max_entries: int = MAX_ENTRIES):
+    """
+    Drop the least recently written entries beyond max_entries.
+    One walk of the cache dir; meant for a background thread at startup.
+    """
+    if _root is None:
+        return
+    entries: list[tuple[int, str]] = []
+    try:
+        with os.scandir(_root) as top:
+            for d in top:
+                if not d.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(d.path) as it:
+                    for e in it:
+                        try:
+                            entries.append((e.stat().st_mtime_ns, e.path))
+                        except OSError:
+                            pass
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _mt, p in entries[:len(entries) - max_entries]:
+        try:
+            os.unlink(p)
+        except OSError:
+            pass
@@ -1,44 +1,58 @@
 import sys
 from datetime import datetime
 import os
-import sys
 import json
 import subprocess
 import shutil
 import zipfile
 import time
 import hashlib
-import urllib.request
-import ssl
 import re
-import tempfile
-import queue
-from collections import deque
+from collections import deque, OrderedDict
 from queue import PriorityQueue
 import itertools
+import functools
+import threading
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+# urllib.request / ssl / certifi are imported where the network calls are made:
+# they pull in http.client, email and the ssl stack, and most runs never go online
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# bytes in, no utf-8 decode pass first (stdlib json.loads takes bytes too)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 try:
-    import certifi
+    import psutil
 except Exception:
-    certifi = None
+    psutil = None
+
+try:
+    import xxhash
+except Exception:
+    xxhash = None
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton,
     QVBoxLayout, QFileDialog, QProgressBar, QMessageBox,
-    QScrollArea, QLineEdit, QListView, QListWidget, QListWidgetItem, QTabWidget,
+    QLineEdit, QListView, QListWidget, QListWidgetItem, QTabWidget,
     QHBoxLayout, QFrame, QCheckBox, QDialog, QTextEdit, QComboBox, QTextBrowser,
     QSpacerItem, QSizePolicy, QInputDialog, QStyledItemDelegate, QStyle
 )
 from PySide6.QtCore import QThread, Signal, Qt, QTimer, QEvent, QSize, QAbstractListModel, QSortFilterProxyModel, QModelIndex, QRect
-from PySide6.QtGui import QIcon, QDesktopServices, QPalette, QPixmap, QPainter, QColor, QFontMetrics, QImage
+from PySide6.QtGui import QIcon, QDesktopServices, QPalette, QPixmap, QPainter, QColor, QPen, QBrush, QFontMetrics, QImage, QShortcut, QKeySequence
 from PySide6.QtCore import QBuffer
 
 from PySide6.QtCore import QUrl
 
-from core.resolver import resolve_dependency, is_asset_var
-from core.scanner import scan_var_meta_only, read_file_from_var
+from core.resolver import resolve_dependency, build_dependency_index, is_protected_var
+from core.scanner import scan_var_meta_only, read_file_from_var, is_girl_looks_scene, path_stem
+from core import scan_cache
 
 
 def resource_path(rel_path: str) -> Path:
@@ -50,6 +64,28 @@ def resource_path(rel_path: str) -> Path:
     return Path(rel_path)
 
 
+@functools.lru_cache(maxsize=None)
+def _icon(rel_path: str) -> QIcon | None:
+    """
+    Bundled icon by relative path, loaded once and shared (None if missing).
+    Call only after the QApplication exists.
+    """
+    p = resource_path(rel_path)
+    return QIcon(str(p)) if p.exists() else None
+
+
+def _add_widgets(layout, *items):
+    """
+    layout.addWidget for each item: a widget, or a (widget, stretch[, alignment]) tuple.
+    Lets a row's contents be read in one place.
+    """
+    for it in items:
+        if isinstance(it, tuple):
+            layout.addWidget(*it)
+        else:
+            layout.addWidget(it)
+
+
 
 # ======================
 # App version + Updater (GitHub Releases)
@@ -60,6 +96,8 @@ GITHUB_OWNER = "bhhsj98sx-netizen"
 GITHUB_REPO = "simple_var_manager"
 GITHUB_LATEST_API = f"https://api.github.com/repos/bhhsj98sx-netizen/simple_var_manager/releases/latest"
 GITHUB_README_URL = f"https://raw.githubusercontent.com/bhhsj98sx-netizen/simple_var_manager/main/readme.md"
+# upper bound for any HTTP body this app reads (README, supporters json)
+HTTP_MAX_BYTES = 2 * 1024 * 1024
 
 PATREON_URL = "https://www.patreon.com/LQuest"
 
@@ -188,20 +226,26 @@ select them again next time.
 APP_VENDOR = "LQuest"
 APP_NAME = "VaM Scene Companion"
 
+# resolved (and mkdir'd) once per process; the folders are only removed by hand,
+# and preview writes recreate previews/ themselves if it goes missing
+@functools.lru_cache(maxsize=1)
 def app_data_dir() -> Path:
     base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
     p = base / APP_VENDOR / APP_NAME
     p.mkdir(parents=True, exist_ok=True)
     return p
 
+@functools.lru_cache(maxsize=1)
 def previews_dir() -> Path:
     p = app_data_dir() / "previews"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
+@functools.lru_cache(maxsize=1)
 def cache_path() -> Path:
     return app_data_dir() / "scene_cache.json"
 
+@functools.lru_cache(maxsize=1)
 def config_path() -> Path:
     return app_data_dir() / "launcher_config.json"
 
@@ -211,6 +255,46 @@ def config_path() -> Path:
 # ======================
 SUPPORTERS_URL = "https://raw.githubusercontent.com/bhhsj98sx-netizen/varapp-supporter/refs/heads/main/supporter.json"
 
+# one keep-alive connection reused across refreshes (skips the TLS handshake after the first);
+# the lock serializes requests on it since fetches run on the IO pool
+_supporters_conn = None
+_supporters_conn_lock = threading.Lock()
+
+def _supporters_get() -> bytes:
+    global _supporters_conn
+    import http.client
+    from urllib.parse import urlsplit
+    u = urlsplit(SUPPORTERS_URL)
+    with _supporters_conn_lock:
+        for attempt in (0, 1):
+            conn = _supporters_conn
+            if conn is None:
+                conn = _supporters_conn = http.client.HTTPSConnection(u.netloc, timeout=5)
+            try:
+                conn.request("GET", u.path, headers={"User-Agent": f"VSC/{APP_VERSION}"})
+                resp = conn.getresponse()
+                # error bodies are read too, so the socket stays usable after a 404/5xx
+                data = resp.read(HTTP_MAX_BYTES)
+            except (http.client.HTTPException, ConnectionError):
+                # stale keep-alive socket: retry once on a fresh connection
+                conn.close()
+                _supporters_conn = None
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                # transport failure (timeout, TLS, DNS): the socket state is unknown
+                conn.close()
+                _supporters_conn = None
+                raise
+            if resp.will_close or not resp.isclosed():
+                # server ends keep-alive, or body over the cap: don't reuse the socket
+                conn.close()
+                _supporters_conn = None
+            if resp.status != 200:
+                raise OSError(f"HTTP {resp.status}")
+            return data
+
 def supporters_cache_path() -> Path:
     return app_data_dir() / "supporters_cache.json"
 
@@ -246,42 +330,62 @@ def _normalize_supporters_payload(obj: dict) -> dict:
 
     return {"updated": str(updated), "supporters": norm}
 
-def load_supporters_cached(max_age_hours: float = 2.0) -> dict:
-    cache = supporters_cache_path()
-    fetched_at = datetime.now().strftime("%Y-%m-%d %H:%M")
+def _supporters_from_cache(obj) -> dict:
+    # caches written by fetch_supporters are already normalized (marked "normalized": 1);
+    # older raw-payload caches go through the normalizer
+    if isinstance(obj, dict) and obj.get("normalized") == 1 and isinstance(obj.get("supporters"), list):
+        return obj
+    return _normalize_supporters_payload(obj)
 
-    if cache.exists():
-        try:
-            age_seconds = time.time() - cache.stat().st_mtime
-            if age_seconds < max_age_hours * 3600:
-                obj = json.loads(cache.read_text(encoding="utf-8"))
-                return _normalize_supporters_payload(obj)
-        except Exception:
-            pass
+def _write_supporters_cache(cache: Path, norm: dict):
+    cache.write_text(json.dumps({**norm, "normalized": 1}, separators=(",", ":")), encoding="utf-8")
 
+def read_supporters_cache(max_age_hours: float = 2.0) -> tuple[dict | None, bool]:
+    """
+    Disk only: (payload or None, fresh). fresh=False means a fetch is due.
+    """
+    cache = supporters_cache_path()
     try:
-        req = urllib.request.Request(
-            SUPPORTERS_URL,
-            headers={"User-Agent": f"VSC/{APP_VERSION}"}
-        )
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            data = resp.read().decode("utf-8", errors="ignore")
-        obj = json.loads(data)
+        st = cache.stat()
+        obj = _json_loads(cache.read_bytes())
+    except Exception:
+        return None, False
+    fresh = (time.time() - st.st_mtime) < max_age_hours * 3600
+    return _supporters_from_cache(obj), fresh
+
+def fetch_supporters() -> dict:
+    """
+    Network fetch + cache write (blocking, up to the 5 s timeout; run it off the GUI thread).
+    On failure the cached copy is re-stamped so the next fetch waits max_age again.
+    """
+    cache = supporters_cache_path()
+    fetched_at = datetime.now().strftime("%Y-%m-%d %H:%M")
+    try:
+        obj = _json_loads(_supporters_get())
         obj["updated"] = fetched_at
 
-        cache.write_text(json.dumps(obj, indent=2), encoding="utf-8")
-        return _normalize_supporters_payload(obj)
+        # normalized once here; cache hits return it as stored
+        norm = _normalize_supporters_payload(obj)
+        _write_supporters_cache(cache, norm)
+        return norm
     except Exception:
         if cache.exists():
             try:
-                obj = json.loads(cache.read_text(encoding="utf-8"))
-                obj["updated"] = fetched_at
-                cache.write_text(json.dumps(obj, indent=2), encoding="utf-8")
-                return _normalize_supporters_payload(obj)
+                norm = dict(_supporters_from_cache(_json_loads(cache.read_bytes())))
+                norm["updated"] = fetched_at
+                norm.pop("normalized", None)
+                _write_supporters_cache(cache, norm)
+                return norm
             except Exception:
                 return {"updated": "unknown", "supporters": []}
         return {"updated": "unknown", "supporters": []}
 
+def load_supporters_cached(max_age_hours: float = 2.0) -> dict:
+    data, fresh = read_supporters_cache(max_age_hours)
+    if fresh and data is not None:
+        return data
+    return fetch_supporters()
+
 
 # ======================
 # Config helpers (in app_data_dir)
@@ -290,7 +394,7 @@ def load_config() -> dict:
     p = config_path()
     if p.exists():
         try:
-            return json.loads(p.read_text(encoding="utf-8"))
+            return _json_loads(p.read_bytes())
         except Exception:
             return {}
     return {}
@@ -299,22 +403,111 @@ def save_config(cfg: dict):
     config_path().write_text(json.dumps(cfg, indent=2), encoding="utf-8")
 
 
+# ======================
+# Scene cache file helpers
+# ======================
+def _dumps_cache_bytes(obj: dict) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except Exception:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+
+def write_scene_cache(cache_obj: dict) -> tuple[int, int]:
+    """
+    Write scene cache to a temp file next to it, then os.replace (atomic swap).
+    A crash mid-write never leaves a truncated scene_cache.json behind.
+    Returns the written file's (mtime_ns, size).
+    """
+    dst = cache_path()
+    tmp = dst.with_name(dst.name + ".tmp")
+    data = _dumps_cache_bytes(cache_obj)
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, dst)
+    st = os.stat(dst)
+    return (st.st_mtime_ns, st.st_size)
+
+def read_scene_cache() -> dict:
+    """
+    Parse the scene cache straight from bytes (orjson when available; stdlib
+    json.loads accepts bytes too), skipping a separate utf-8 decode pass.
+    Missing or unreadable cache -> {}.
+    """
+    try:
+        with open(cache_path(), "rb") as f:
+            raw = f.read()
+    except OSError:
+        return {}
+    try:
+        obj = _json_loads(raw)
+    except Exception:
+        return {}
+    return obj if isinstance(obj, dict) else {}
+
+
 # ======================
 # Preview cache helpers
 # ======================
+@functools.lru_cache(maxsize=1 << 17)
 def _safe_preview_key(var_name: str, scene_name: str) -> str:
+    # file name only, not security: xxh3-64 when available, else SHA-1.
+    # Memoized: the loader's cache probe and the write after a miss hash the same pair
     raw = f"{var_name}::{scene_name}".encode("utf-8", errors="ignore")
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(raw)
     return hashlib.sha1(raw).hexdigest()
 
+def _legacy_preview_key(var_name: str, scene_name: str) -> str | None:
+    # SHA-1 name written before xxhash was installed; None when that's the current key
+    if xxhash is None:
+        return None
+    return hashlib.sha1(f"{var_name}::{scene_name}".encode("utf-8", errors="ignore")).hexdigest()
+
+def _migrate_legacy_preview(var_name: str, scene_name: str, rel: str) -> bytes | None:
+    """
+    Look up the SHA-1 named preview; on a hit rename it to rel so the next lookup is direct.
+    """
+    old = _legacy_preview_key(var_name, scene_name)
+    if old is None:
+        return None
+    old_rel = f"previews/{old}.bin"
+    data = read_preview_bytes(old_rel)
+    if data:
+        try:
+            os.replace(app_data_dir() / old_rel, app_data_dir() / rel)
+        except OSError:
+            pass
+    return data
+
+@functools.lru_cache(maxsize=1)
+def _app_data_root() -> str:
+    # str form for the per-preview read/write paths: no Path join per call
+    return os.fspath(app_data_dir())
+
+_PREVIEW_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_PREVIEW_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
 def write_preview_bytes(var_name: str, scene_name: str, image_bytes: bytes | None) -> str:
     if not image_bytes:
         return ""
     key = _safe_preview_key(var_name, scene_name)
     rel = f"previews/{key}.bin"
-    fp = app_data_dir() / rel
+    fp = os.path.join(_app_data_root(), "previews", key + ".bin")
     try:
-        fp.parent.mkdir(parents=True, exist_ok=True)
-        fp.write_bytes(image_bytes)
+        # raw fd write; only mkdir if the folder went missing (e.g. cache cleared)
+        try:
+            fd = os.open(fp, _PREVIEW_WRITE_FLAGS, 0o644)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(fp), exist_ok=True)
+            fd = os.open(fp, _PREVIEW_WRITE_FLAGS, 0o644)
+        try:
+            view = memoryview(image_bytes)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         return rel
     except Exception:
         return ""
@@ -322,46 +515,54 @@ def write_preview_bytes(var_name: str, scene_name: str, image_bytes: bytes | Non
 def read_preview_bytes(rel_path: str) -> bytes | None:
     if not rel_path:
         return None
-    fp = app_data_dir() / rel_path
+    # open and catch a miss instead of an exists() stat first
     try:
-        if fp.exists():
-            return fp.read_bytes()
-    except Exception:
+        fd = os.open(os.path.join(_app_data_root(), rel_path), _PREVIEW_READ_FLAGS)
+    except OSError:
         return None
-    return None
+    try:
+        chunks = []
+        while True:
+            b = os.read(fd, 1 << 20)
+            if not b:
+                break
+            chunks.append(b)
+        return b"".join(chunks)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+def _read_zip_entry(z: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+    """
+    Read one member through z.open(ZipInfo): no second name lookup, and a single
+    read sized from the central directory (stored previews seek straight to the data).
+    """
+    with z.open(info) as f:
+        return f.read(info.file_size)
 
 def _read_preview_from_var(var_path: Path, scene_name: str, inner_hint: str) -> tuple[bytes | None, str]:
     """
     Best-effort read for scene preview image from a var zip.
     Tries hint, common paths, then case-insensitive scan (single zip open).
+    Guesses are NameToInfo dict lookups; read() only runs on a confirmed name.
     """
     try:
         with zipfile.ZipFile(var_path, "r") as z:
-            if inner_hint:
-                try:
-                    return z.read(inner_hint), inner_hint
-                except Exception:
-                    pass
+            names = z.NameToInfo
+            if inner_hint and inner_hint in names:
+                return _read_zip_entry(z, names[inner_hint]), inner_hint
 
             for ext in (".png", ".jpg", ".jpeg"):
                 cand = f"Saves/scene/{scene_name}{ext}"
-                try:
-                    return z.read(cand), cand
-                except Exception:
-                    pass
+                if cand in names:
+                    return _read_zip_entry(z, names[cand]), cand
 
             base = scene_name.lower()
-            for name in z.namelist():
+            for name, info in names.items():
                 ln = name.lower()
-                if not ln.startswith("saves/scene/"):
-                    continue
-                if not (ln.endswith(".png") or ln.endswith(".jpg") or ln.endswith(".jpeg")):
-                    continue
-                if Path(ln).stem == base:
-                    try:
-                        return z.read(name), name
-                    except Exception:
-                        pass
+                if ln.startswith("saves/scene/") and ln.endswith((".png", ".jpg", ".jpeg")) and path_stem(ln) == base:
+                    return _read_zip_entry(z, info), name
     except Exception:
         return None, ""
 
@@ -383,6 +584,21 @@ ROLE_LOOKS = Qt.UserRole + 9
 ROLE_LOOSE = Qt.UserRole + 10
 ROLE_SELECTION_MODE = Qt.UserRole + 11
 
+# SceneListModel.data: role -> item key, one dict lookup instead of an if-chain
+_ROLE_TO_KEY: dict[int, str] = {
+    int(Qt.DisplayRole): "scene_name",
+    ROLE_SCENE: "scene_name",
+    ROLE_VAR: "var_name",
+    ROLE_SOURCE: "source",
+    ROLE_PREVIEW_REL: "preview_relpath",
+    ROLE_PREVIEW_INNER: "preview_inner",
+    ROLE_PREVIEW_PIXMAP: "preview_pixmap",
+    ROLE_SELECTED: "selected",
+    ROLE_ACTIVE: "active",
+    ROLE_LOOKS: "is_girl_looks",
+    ROLE_LOOSE: "loose_relpath",
+}
+
 
 class SceneListModel(QAbstractListModel):
     def __init__(self, parent=None):
@@ -401,32 +617,14 @@ class SceneListModel(QAbstractListModel):
         if not index.isValid():
             return None
         item = self._items[index.row()]
-        if role == Qt.DisplayRole:
-            return item.get("scene_name", "")
-        if role == Qt.ToolTipRole:
-            return f"{item.get('scene_name', '')}\n{item.get('var_name', '')}"
-        if role == ROLE_SCENE:
-            return item.get("scene_name", "")
-        if role == ROLE_VAR:
-            return item.get("var_name", "")
-        if role == ROLE_SOURCE:
-            return item.get("source", "var")
-        if role == ROLE_PREVIEW_REL:
-            return item.get("preview_relpath", "")
-        if role == ROLE_PREVIEW_INNER:
-            return item.get("preview_inner", "")
-        if role == ROLE_PREVIEW_PIXMAP:
-            return item.get("preview_pixmap", None)
-        if role == ROLE_SELECTED:
-            return bool(item.get("selected", False))
-        if role == ROLE_ACTIVE:
-            return bool(item.get("active", False))
-        if role == ROLE_LOOKS:
-            return item.get("is_girl_looks", None)
-        if role == ROLE_LOOSE:
-            return item.get("loose_relpath", "")
+        # every key is set in set_entries (selected/active already stored as bool)
+        key = _ROLE_TO_KEY.get(role)
+        if key is not None:
+            return item[key]
         if role == ROLE_SELECTION_MODE:
             return self._selection_mode
+        if role == Qt.ToolTipRole:
+            return f"{item['scene_name']}\n{item['var_name']}"
         return None
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:  # type: ignore[override]
@@ -434,14 +632,21 @@ class SceneListModel(QAbstractListModel):
             return Qt.NoItemFlags
         return Qt.ItemIsEnabled
 
+    @staticmethod
+    def _item_key(item: dict) -> tuple:
+        return (item["source"], item["var_name"], item["scene_name"], item["loose_relpath"])
+
     def set_entries(self, entries: list[dict]):
+        # Filter/page changes reset the model; rows that survive keep their decoded
+        # thumbnail instead of going back through the preview loader.
+        old_pix = {
+            self._item_key(it): it["preview_pixmap"]
+            for it in self._items
+            if it["preview_pixmap"] is not None
+        }
         self.beginResetModel()
-        self._items = []
-        self._rows_by_var = {}
-        self._active_row = -1
-
-        for e in entries:
-            item = {
+        self._items = [
+            {
                 "scene_name": e.get("scene_name", "") or "",
                 "var_name": e.get("var_name", "") or "",
                 "source": e.get("source", "var") or "var",
@@ -454,10 +659,29 @@ class SceneListModel(QAbstractListModel):
                 "is_girl_looks": e.get("is_girl_looks", None),
                 "loose_relpath": e.get("loose_relpath", "") or "",
             }
-            self._items.append(item)
+            for e in entries
+        ]
+        # looks_map key, formatted once per row instead of per looks pass
+        for item in self._items:
+            item["looks_key"] = (
+                f"{item['var_name']}::{item['scene_name']}" if item["source"] == "var" else ""
+            )
+        self._rows_by_var = {}
+        self._active_row = -1
+
+        if old_pix:
+            for item in self._items:
+                item["preview_pixmap"] = old_pix.get(self._item_key(item))
+
+        rows_by_var = self._rows_by_var
+        for row, item in enumerate(self._items):
             var_name = item["var_name"]
-            if var_name and item.get("source", "var") == "var":
-                self._rows_by_var.setdefault(var_name, []).append(len(self._items) - 1)
+            if var_name and item["source"] == "var":
+                rows = rows_by_var.get(var_name)
+                if rows is None:
+                    rows_by_var[var_name] = [row]
+                else:
+                    rows.append(row)
         self.endResetModel()
 
     def set_selection_mode(self, enabled: bool):
@@ -473,6 +697,9 @@ class SceneListModel(QAbstractListModel):
     def var_names(self) -> set[str]:
         return set(self._rows_by_var.keys())
 
+    def rows_with_preview(self) -> list[int]:
+        return [r for r, it in enumerate(self._items) if it["preview_pixmap"] is not None]
+
     def get_item(self, row: int) -> dict:
         if 0 <= row < len(self._items):
             return self._items[row]
@@ -488,6 +715,13 @@ class SceneListModel(QAbstractListModel):
         bottom = self.index(max(rows), 0)
         self.dataChanged.emit(top, bottom, [ROLE_SELECTED])
 
+    def set_selected_for_vars(self, var_names, selected: bool):
+        # one dataChanged for the whole batch instead of one per var
+        rows = []
+        for v in var_names:
+            rows.extend(self._rows_by_var.get(v, ()))
+        self.set_selected_for_rows(rows, selected)
+
     def set_selected_for_rows(self, rows: list[int], selected: bool):
         if not rows:
             return
@@ -521,14 +755,28 @@ class SceneListModel(QAbstractListModel):
     def set_looks_map(self, looks_map: dict):
         if not isinstance(looks_map, dict):
             return
+        changed: list[int] = []
         for i, item in enumerate(self._items):
-            if item.get("source", "var") != "var":
-                continue
-            k = f"{item.get('var_name', '')}::{item.get('scene_name', '')}"
-            if k in looks_map:
-                item["is_girl_looks"] = looks_map.get(k, False)
-                idx = self.index(i, 0)
-                self.dataChanged.emit(idx, idx, [ROLE_LOOKS])
+            k = item["looks_key"]
+            if k and k in looks_map:
+                val = looks_map.get(k, False)
+                if item["is_girl_looks"] != val:
+                    item["is_girl_looks"] = val
+                    changed.append(i)
+        if not changed:
+            return
+        # rows come in ascending order: one dataChanged per contiguous run,
+        # or a single span when most rows changed anyway
+        if len(changed) > len(self._items) // 2:
+            self.dataChanged.emit(self.index(changed[0], 0), self.index(changed[-1], 0), [ROLE_LOOKS])
+            return
+        start = prev = changed[0]
+        for r in changed[1:]:
+            if r != prev + 1:
+                self.dataChanged.emit(self.index(start, 0), self.index(prev, 0), [ROLE_LOOKS])
+                start = r
+            prev = r
+        self.dataChanged.emit(self.index(start, 0), self.index(prev, 0), [ROLE_LOOKS])
 
 
 class SceneFilterProxy(QSortFilterProxyModel):
@@ -575,6 +823,21 @@ class SceneFilterProxy(QSortFilterProxyModel):
 
 
 class SceneDelegate(QStyledItemDelegate):
+    # paint() runs per visible card on every repaint: colors/pens are built once here
+    _BG = QColor(255, 255, 255, 6)
+    _BORDER = QPen(QColor(0, 0, 0, 0))
+    _SEL_BG = QColor(39, 174, 96, 50)
+    _SEL_BORDER = QPen(QColor(39, 174, 96))
+    _ACTIVE_BG = QColor(61, 174, 233, 24)
+    _ACTIVE_BORDER = QPen(QColor(61, 174, 233))
+    _HOVER_BG = QColor(255, 255, 255, 10)
+    _HOVER_BORDER = QPen(QColor(100, 100, 100))
+    _IMG_BRUSH = QBrush(QColor(34, 34, 34))
+    _IMG_PEN = QPen(QColor(68, 68, 68))
+    _NO_PREVIEW_PEN = QPen(QColor(120, 120, 120))
+    _SCENE_PEN = QPen(QColor(230, 230, 230))
+    _VAR_PEN = QPen(QColor(160, 160, 160))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.card_w = 220
@@ -583,6 +846,9 @@ class SceneDelegate(QStyledItemDelegate):
         self.img_h = 130
         self.pad = 10
         self.text_h = 44
+        # QFontMetrics for the last painter font (rebuilt when font().key() changes)
+        self._fm: QFontMetrics | None = None
+        self._fm_key = ""
 
     def set_card_width(self, width: int):
         w = max(140, int(width))
@@ -608,104 +874,107 @@ class SceneDelegate(QStyledItemDelegate):
         active = bool(index.data(ROLE_ACTIVE)) and not selection_mode
         hovered = bool(option.state & QStyle.State_MouseOver)
 
-        bg_color = QColor(255, 255, 255, 6)
-        border_color = QColor(0, 0, 0, 0)
         if selected:
-            border_color = QColor(39, 174, 96)
-            bg_color = QColor(39, 174, 96, 50)
+            bg_color, border_pen = self._SEL_BG, self._SEL_BORDER
         elif active:
-            border_color = QColor(61, 174, 233)
-            bg_color = QColor(61, 174, 233, 24)
+            bg_color, border_pen = self._ACTIVE_BG, self._ACTIVE_BORDER
         elif hovered:
-            border_color = QColor(100, 100, 100)
-            bg_color = QColor(255, 255, 255, 10)
+            bg_color, border_pen = self._HOVER_BG, self._HOVER_BORDER
+        else:
+            bg_color, border_pen = self._BG, self._BORDER
 
         painter.setBrush(bg_color)
-        painter.setPen(border_color)
+        painter.setPen(border_pen)
         painter.drawRoundedRect(rect, 8, 8)
 
         img_rect = QRect(rect.left() + self.pad, rect.top() + self.pad, self.img_w, self.img_h)
-        painter.setBrush(QColor(34, 34, 34))
-        painter.setPen(QColor(68, 68, 68))
+        painter.setBrush(self._IMG_BRUSH)
+        painter.setPen(self._IMG_PEN)
         painter.drawRoundedRect(img_rect, 6, 6)
 
         pix = index.data(ROLE_PREVIEW_PIXMAP)
         if isinstance(pix, QPixmap) and not pix.isNull():
             painter.drawPixmap(img_rect, pix, pix.rect())
         else:
-            painter.setPen(QColor(120, 120, 120))
+            painter.setPen(self._NO_PREVIEW_PEN)
             painter.drawText(img_rect, Qt.AlignCenter, "No Preview")
 
         scene_name = index.data(ROLE_SCENE) or ""
         var_name = index.data(ROLE_VAR) or ""
         text_rect = QRect(rect.left() + self.pad, img_rect.bottom() + 8, rect.width() - self.pad * 2, 40)
 
-        painter.setPen(QColor(230, 230, 230))
-        fm = QFontMetrics(painter.font())
+        painter.setPen(self._SCENE_PEN)
+        font = painter.font()
+        fkey = font.key()
+        fm = self._fm
+        if fm is None or fkey != self._fm_key:
+            fm = self._fm = QFontMetrics(font)
+            self._fm_key = fkey
         scene_elide = fm.elidedText(str(scene_name), Qt.ElideRight, text_rect.width())
         painter.drawText(text_rect, Qt.AlignTop | Qt.AlignLeft, scene_elide)
 
-        painter.setPen(QColor(160, 160, 160))
+        painter.setPen(self._VAR_PEN)
         small_rect = QRect(text_rect.left(), text_rect.top() + 18, text_rect.width(), 20)
         var_elide = fm.elidedText(str(var_name), Qt.ElideRight, small_rect.width())
         painter.drawText(small_rect, Qt.AlignLeft | Qt.AlignTop, var_elide)
 
         painter.restore()
 
-def _var_signature(p: Path) -> str:
+def _var_signature(p: Path | os.DirEntry) -> str:
+    # DirEntry.stat() reuses the stat data scandir already fetched on Windows
     try:
         st = p.stat()
         return f"{st.st_size}:{int(st.st_mtime)}"
     except Exception:
         return "0:0"
 
-def _file_signature(p: Path) -> str:
-    try:
-        st = p.stat()
-        return f"{st.st_size}:{int(st.st_mtime)}"
-    except Exception:
-        return "0:0"
+# same "size:mtime" format; loose scene files share the signature with VARs
+_file_signature = _var_signature
 
 
 # ======================
 # VaM-like helpers
 # ======================
+def _walk_vars(addon_dir: Path, include_disabled: bool, exclude_dir_names: set[str] | None = None):
+    """
+    Yields (orig_var_name, path_str) from a single os.walk (top level included;
+    walk yields each file once, so no seen-set). Names are only sliced/joined for
+    matches; *.var.disabled is normalized to the original *.var name.
+    """
+    exclude = {d.lower() for d in (exclude_dir_names or ())}
+    suffixes = (".var", ".var.disabled") if include_disabled else (".var",)
+    cut = len(DISABLED_SUFFIX)
+    join = os.path.join
+    for root, dirs, files in os.walk(addon_dir):
+        if exclude:
+            dirs[:] = [d for d in dirs if d.lower() not in exclude]
+        for fname in files:
+            low = fname.lower()
+            if not low.endswith(suffixes):
+                continue
+            if low.endswith(".var"):
+                yield fname, join(root, fname)
+            else:
+                yield fname[:-cut], join(root, fname)
+
+
 def fast_list_vars(addon_dir: Path) -> list[Path]:
     """
     Faster than Path.glob('*.var') for huge folders.
     Returns list of Path for *.var only (enabled), including subfolders.
     """
-    out: list[Path] = []
-    seen: set[str] = set()
-    try:
-        has_dirs = False
-        with os.scandir(addon_dir) as it:
-            for e in it:
-                if e.is_dir():
-                    has_dirs = True
-                    continue
-                if not e.is_file():
-                    continue
-                name = e.name
-                if name.lower().endswith(".var"):
-                    if e.path not in seen:
-                        seen.add(e.path)
-                        out.append(Path(e.path))
-        if has_dirs:
-            for root, _dirs, files in os.walk(addon_dir):
-                for fname in files:
-                    low = fname.lower()
-                    if not low.endswith(".var"):
-                        continue
-                    fp = os.path.join(root, fname)
-                    if fp in seen:
-                        continue
-                    seen.add(fp)
-                    out.append(Path(fp))
-    except Exception:
-        # fallback
-        out = list(addon_dir.rglob("*.var"))
-    return out
+    return [Path(fp) for (_name, fp) in _walk_vars(addon_dir, include_disabled=False)]
+
+def _list_var_files(addon_dir: Path, exclude_dir_names: set[str] | None = None) -> list[tuple[str, str]]:
+    """
+    Returns list of (orig_var_name, actual_path_str) for:
+    - *.var
+    - *.var.disabled  -> normalized to orig *.var name
+    """
+    # names from here end up in all_vars/keep/state maps and the .disabled and
+    # .var spellings of one package would otherwise be separate string objects
+    intern = sys.intern
+    return [(intern(n), fp) for (n, fp) in _walk_vars(addon_dir, True, exclude_dir_names)]
 
 def fast_list_vars_all_states(addon_dir: Path, exclude_dir_names: set[str] | None = None) -> list[tuple[str, Path]]:
     """
@@ -713,65 +982,331 @@ def fast_list_vars_all_states(addon_dir: Path, exclude_dir_names: set[str] | Non
     - *.var
     - *.var.disabled  -> normalized to orig *.var name
     """
-    out: list[tuple[str, Path]] = []
-    seen: set[str] = set()
-    exclude = {d.lower() for d in (exclude_dir_names or set())}
+    return [(name, Path(fp)) for (name, fp) in _list_var_files(addon_dir, exclude_dir_names)]
+
+
+def _path_key(p) -> str:
+    # comparable path string (case/separator-insensitive on Windows)
+    return os.path.normcase(os.fspath(p))
+
+
+def rename_no_replace(src: Path, dst: Path):
+    """
+    Rename without overwriting dst and without exists() pre-checks: raises
+    FileNotFoundError if src is gone, FileExistsError if dst is taken.
+    Windows os.rename already refuses to replace; elsewhere link + unlink
+    gives the same guarantee (link fails if dst exists).
+    """
+    if os.name == "nt":
+        os.rename(src, dst)
+        return
+    try:
+        os.link(src, dst)
+    except (FileExistsError, FileNotFoundError):
+        raise
+    except OSError:
+        # filesystem without hard links: checked rename
+        if os.path.lexists(dst):
+            raise FileExistsError(dst)
+        os.rename(src, dst)
+        return
+    os.unlink(src)
+
+
+def path_is_under(path: Path, root: Path) -> bool:
+    try:
+        pp = path.resolve()
+        wp = root.resolve()
+        return pp == wp or wp in pp.parents
+    except Exception:
+        return False
+
+
+class _JournalWriter:
+    """
+    Appends manifest journal records one line at a time, flushed per record, so
+    renames already done survive a close or crash mid-apply. ok turns False if
+    the journal can't be opened or a write fails.
+    """
+
+    def __init__(self, path: Path | None):
+        self._f = None
+        self.ok = False
+        if path is None:
+            return
+        try:
+            self._f = open(path, "a", encoding="utf-8")
+            self.ok = True
+        except OSError:
+            pass
+
+    def record(self, rec: dict):
+        if self._f is None:
+            return
+        try:
+            self._f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+            self._f.flush()
+        except OSError:
+            self.ok = False
+
+    def close(self):
+        if self._f is not None:
+            try:
+                self._f.close()
+            except OSError:
+                self.ok = False
+            self._f = None
+
+
+def live_apply_renames(addon_dir: Path, keep_set: set[str], tool_items: list[dict],
+                       whitelist_dir: Path | None, progress=None, journal: Path | None = None,
+                       should_stop=None) -> tuple[list[dict], int, int, list[str], bool]:
+    """
+    Rename work of a live apply (no Qt, safe on a worker thread):
+    - Restore anything that should now be kept (if currently disabled by our tool)
+    - Disable anything not in keep_set (but only if currently enabled)
+    progress(done, total) is called every 64 files when given.
+    journal: manifest journal path; each rename/restore is appended as it happens.
+    should_stop(): checked per file; when True the pass ends early (done renames stay journaled).
+    Returns: (remaining tool items for the manifest, disabled_count, restored_count, failed,
+              journaled = every rename of this pass is in the journal)
+    """
+    jw = _JournalWriter(journal)
+    try:
+        result = _live_apply_pass(addon_dir, keep_set, tool_items, whitelist_dir, progress, jw.record, should_stop)
+    finally:
+        jw.close()
+    return result + (jw.ok,)
+
+
+def restore_renames(addon_dir: Path, items: list, progress=None, journal: Path | None = None,
+                    should_stop=None) -> tuple[int, bool]:
+    """
+    Rename work of a restore (no Qt, safe on a worker thread): every manifest
+    "renamed" item goes back from to_rel to from_rel. Each restored file is
+    journaled as {"del": key}, so a close mid-restore leaves manifest + journal
+    listing only what is still disabled. progress/should_stop as in live_apply_renames.
+    Returns: (restored_count, finished = not stopped early)
+    """
+    jw = _JournalWriter(journal)
+    restored = 0
+    total = len(items)
     try:
-        has_dirs = False
+        for done, item in enumerate(items, 1):
+            if should_stop is not None and should_stop():
+                return restored, False
+            if progress is not None and done % 64 == 0:
+                progress(done, total)
+            if not isinstance(item, dict):
+                continue
+            src_name = item.get("to_rel") or item.get("to")
+            dst_name = item.get("from_rel") or item.get("from")
+            if not src_name or not dst_name:
+                continue
+
+            src = addon_dir / str(src_name)
+            dst = addon_dir / str(dst_name)
+            # missing src / taken dst surface as errors from the rename itself
+            try:
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                rename_no_replace(src, dst)
+                forget_exists(src, dst)
+                jw.record({"del": _manifest_item_key(item)})
+                restored += 1
+            except OSError:
+                pass
+    finally:
+        jw.close()
+    if progress is not None:
+        progress(total, total)
+    return restored, True
+
+
+def _live_apply_pass(addon_dir: Path, keep_set: set[str], tool_items: list[dict], whitelist_dir: Path | None,
+                     progress, record, should_stop) -> tuple[list[dict], int, int, list[str]]:
+    disabled_count = 0
+    restored_count = 0
+    failed: list[str] = []
+
+    # one listing up front replaces the per-file exists() probes in both passes;
+    # present is kept in step with our own renames
+    var_items = fast_list_vars_all_states(addon_dir, exclude_dir_names={WHITELIST_DIR_NAME})
+    present = {_path_key(p) for (_n, p) in var_items}
+
+    total = len(tool_items) + len(var_items)
+    done = 0
+
+    # 1) Restore tool-disabled vars that are now in keep_set
+    remaining: list[dict] = []
+    stopped = False
+    for pos, item in enumerate(tool_items):
+        if should_stop is not None and should_stop():
+            remaining.extend(tool_items[pos:])
+            stopped = True
+            break
+        done += 1
+        if progress is not None and done % 64 == 0:
+            progress(done, total)
+        orig = item.get("from", "")
+        if orig not in keep_set:
+            remaining.append(item)
+            continue
+        src = addon_dir / item.get("to_rel", "")
+        dst = addon_dir / item.get("from_rel", "")
+        src_key = _path_key(src)
+        dst_key = _path_key(dst)
+        if src_key in present and dst_key not in present:
+            try:
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                rename_no_replace(src, dst)
+                present.discard(src_key)
+                present.add(dst_key)
+                forget_exists(src, dst)
+                record({"del": _manifest_item_key(item)})
+                restored_count += 1
+            except Exception:
+                remaining.append(item)
+        else:
+            remaining.append(item)
+
+    # 2) Disable vars NOT in keep_set (only if currently enabled)
+    # (files restored in step 1 were listed as .disabled, so they're skipped here)
+    disabled_by_tool = {item.get("from") for item in remaining if item.get("from")}
+    for orig, actual_path in var_items:
+        if stopped or (should_stop is not None and should_stop()):
+            break
+        done += 1
+        if progress is not None and done % 64 == 0:
+            progress(done, total)
+        if whitelist_dir is not None and path_is_under(actual_path, whitelist_dir):
+            continue
+        if not actual_path.name.lower().endswith(".var"):
+            continue
+        src = actual_path
+        if orig in keep_set:
+            continue
+        if orig in disabled_by_tool:
+            continue
+        dst = src.with_name(orig + DISABLED_SUFFIX)
+        dst_key = _path_key(dst)
+        if dst_key in present:
+            continue
+        try:
+            rel_from = src.relative_to(addon_dir)
+            rel_to = dst.relative_to(addon_dir)
+            rename_no_replace(src, dst)
+            present.discard(_path_key(src))
+            present.add(dst_key)
+            forget_exists(src, dst)
+            item = {
+                "from": orig,
+                "from_rel": str(rel_from).replace("\\", "/"),
+                "to_rel": str(rel_to).replace("\\", "/"),
+            }
+            remaining.append(item)
+            record({"add": {"from": orig, "to": dst.name, "from_rel": item["from_rel"], "to_rel": item["to_rel"]}})
+            disabled_count += 1
+        except Exception:
+            failed.append(orig)
+
+    if progress is not None:
+        progress(total, total)
+    return remaining, disabled_count, restored_count, failed
+
+
+# Short-lived Path.exists() cache for probes repeated during refresh/apply/deps.
+# Rename/move sites call forget_exists() on both ends so results never outlive our own changes.
+# Shared by the GUI thread and the workers; the lock covers the dict, never the filesystem probe.
+_EXISTS_TTL_NS = 2_000_000_000
+_EXISTS_CACHE_MAX = 8192
+_exists_cache: dict[str, tuple[bool, int]] = {}
+_exists_lock = threading.Lock()
+
+def cached_exists(p: Path) -> bool:
+    key = os.fspath(p)
+    now = time.monotonic_ns()
+    with _exists_lock:
+        hit = _exists_cache.get(key)
+    if hit is not None and hit[1] > now:
+        return hit[0]
+    ok = os.path.exists(key)
+    with _exists_lock:
+        if len(_exists_cache) >= _EXISTS_CACHE_MAX:
+            _exists_cache.clear()
+        _exists_cache[key] = (ok, now + _EXISTS_TTL_NS)
+    return ok
+
+def forget_exists(*paths: Path):
+    with _exists_lock:
+        for p in paths:
+            _exists_cache.pop(os.fspath(p), None)
+
+
+# meta-only scans keyed by path; an entry is valid while (mtime_ns, size) match.
+# Filled from the GUI thread and the workers; the lock covers the dict, not the scan.
+_SCAN_MEMO_MAX = 4096
+_scan_memo: dict[str, tuple[tuple[int, int], dict]] = {}
+_scan_memo_lock = threading.Lock()
+
+def cached_scan_var_meta(p: Path) -> dict:
+    """
+    scan_var_meta_only with a per-file memo: repeat visits (keep-set traversal,
+    dependency panel clicks) cost one stat instead of a zip open + meta.json parse.
+    Misses go through the on-disk scan_cache, so a restart doesn't reopen zips either.
+    "dependencies" is a frozenset of str (deduped; sort at display time).
+    The returned dict is shared; don't mutate it.
+    """
+    key = os.fspath(p)
+    try:
+        st = os.stat(key)
+    except OSError:
+        with _scan_memo_lock:
+            _scan_memo.pop(key, None)
+        info = scan_var_meta_only(p)
+        info["dependencies"] = frozenset(d for d in info.get("dependencies", []) if isinstance(d, str))
+        return info
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _scan_memo_lock:
+        hit = _scan_memo.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    info = scan_cache.cached_scan_var(p, st)
+    deps = info.get("dependencies")
+    info["dependencies"] = frozenset(sys.intern(d) for d in deps if isinstance(d, str)) if isinstance(deps, list) else frozenset()
+    with _scan_memo_lock:
+        if len(_scan_memo) >= _SCAN_MEMO_MAX:
+            _scan_memo.clear()
+        _scan_memo[key] = (stamp, info)
+    return info
+
+
+def has_any_var_file(addon_dir: Path) -> bool:
+    """
+    True as soon as one *.var is found (top level first, then subfolders).
+    For folder validation, where a full listing would be wasted work.
+    """
+    try:
+        subdirs = []
         with os.scandir(addon_dir) as it:
             for e in it:
+                if e.name.lower().endswith(".var") and e.is_file():
+                    return True
                 if e.is_dir():
-                    if e.name.lower() in exclude:
-                        continue
-                    has_dirs = True
-                    continue
-                if not e.is_file():
-                    continue
-                name = e.name
-                low = name.lower()
-                if low.endswith(".var"):
-                    if e.path not in seen:
-                        seen.add(e.path)
-                        out.append((name, Path(e.path)))
-                elif low.endswith(".var.disabled"):
-                    orig = name[:-len(DISABLED_SUFFIX)]  # strip ".disabled"
-                    if e.path not in seen:
-                        seen.add(e.path)
-                        out.append((orig, Path(e.path)))
-        if has_dirs:
-            for root, dirs, files in os.walk(addon_dir):
-                if exclude:
-                    dirs[:] = [d for d in dirs if d.lower() not in exclude]
-                for fname in files:
-                    low = fname.lower()
-                    if low.endswith(".var"):
-                        fp = os.path.join(root, fname)
-                        if fp in seen:
-                            continue
-                        seen.add(fp)
-                        out.append((fname, Path(fp)))
-                    elif low.endswith(".var.disabled"):
-                        fp = os.path.join(root, fname)
-                        if fp in seen:
-                            continue
-                        seen.add(fp)
-                        orig = fname[:-len(DISABLED_SUFFIX)]
-                        out.append((orig, Path(fp)))
-    except Exception:
-        # fallback (slower)
-        for root, dirs, files in os.walk(addon_dir):
-            if exclude:
-                dirs[:] = [d for d in dirs if d.lower() not in exclude]
-            for fname in files:
-                low = fname.lower()
-                if low.endswith(".var"):
-                    fp = os.path.join(root, fname)
-                    out.append((fname, Path(fp)))
-                elif low.endswith(".var.disabled"):
-                    fp = os.path.join(root, fname)
-                    orig = fname[:-len(DISABLED_SUFFIX)]
-                    out.append((orig, Path(fp)))
-    return out
+                    subdirs.append(e.path)
+        for d in subdirs:
+            for _root, _dirs, files in os.walk(d):
+                if any(f.lower().endswith(".var") for f in files):
+                    return True
+    except OSError:
+        pass
+    return False
+
+
+def fast_var_names_all_states(addon_dir: Path, exclude_dir_names: set[str] | None = None) -> set[str]:
+    """
+    Names only (orig *.var names, disabled included); skips building a Path per file.
+    """
+    return {name for (name, _fp) in _list_var_files(addon_dir, exclude_dir_names)}
 
 
 
@@ -786,49 +1321,96 @@ def _parse_var_base_and_version(var_filename: str) -> tuple[str, str]:
     base = ".".join(parts[:-1])
     return base, version
 
+def _version_key(v: str, nm: str) -> tuple[int, str, str]:
+    # numeric version first, so "x.10.var" sorts above "x.9.var"
+    try:
+        vnum = int(v)
+    except Exception:
+        vnum = -1
+    return (vnum, v, nm)
+
+def var_version_key(nm: str) -> tuple[int, str, str]:
+    _b, v = _parse_var_base_and_version(nm)
+    return _version_key(v, nm)
+
 def _choose_latest_vars(all_var_names: list[str]) -> set[str]:
-    best: dict[str, tuple[int, str, str]] = {}
+    # highest var_version_key per base: one C-level sort of plain tuples,
+    # then a dict build where the last row of each base wins
+    rows = []
     for fn in all_var_names:
         base, ver = _parse_var_base_and_version(fn)
+        rows.append((base, _version_key(ver, fn)))
+    rows.sort()
+    return set({base: key[2] for base, key in rows}.values())
 
-        ver_num = -1
+def iter_scene_jsons(root: Path):
+    """
+    Walk Saves/scene with os.scandir and yield (entry, rel_path, is_hidden) for every *.json.
+    rel_path is relative to root with forward slashes, sliced from the entry's string path
+    (no Path objects in the loop). Hidden state comes from <name>.json.hide siblings seen
+    in the same listing, so no extra exists() call per scene.
+    """
+    root_str = os.fspath(root)
+    len_root = len(root_str.rstrip("/\\")) + 1
+    stack = [root_str]
+    while stack:
+        d = stack.pop()
+        jsons: list[os.DirEntry] = []
+        hidden: set[str] = set()
         try:
-            ver_num = int(ver)
-        except Exception:
-            ver_num = -1
-
-        current = best.get(base)
-        cand = (ver_num, ver, fn)
-        if current is None:
-            best[base] = cand
-        else:
-            if cand[0] > current[0]:
-                best[base] = cand
-            elif cand[0] == current[0]:
-                if cand[1] > current[1]:
-                    best[base] = cand
-                elif cand[1] == current[1]:
-                    if cand[2] > current[2]:
-                        best[base] = cand
-
-    return {t[2] for t in best.values()}
-
-def _is_hidden_sidecar(json_path: Path) -> bool:
-    try:
-        return (Path(str(json_path) + ".hide")).exists()
-    except Exception:
-        return False
+            with os.scandir(d) as it:
+                for e in it:
+                    try:
+                        # don't follow links/junctions: one pointing at a parent would loop forever
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                            continue
+                    except OSError:
+                        continue
+                    low = e.name.lower()
+                    if low.endswith(".json"):
+                        jsons.append(e)
+                    elif low.endswith(".json.hide"):
+                        hidden.add(low[:-5])
+        except OSError:
+            continue
+        for e in jsons:
+            yield e, e.path[len_root:].replace("\\", "/"), (e.name.lower() in hidden)
+
+def dir_mtime_map(*roots: Path | None) -> dict[str, int]:
+    """
+    Returns { dir_path: st_mtime_ns } for each root and every folder below it.
+    Only directories are stat'ed, so this is much cheaper than a per-file signature pass.
+    A folder's mtime moves whenever a direct child is added, removed or renamed.
+    """
+    out: dict[str, int] = {}
+    stack = [os.fspath(r) for r in roots if r]
+    while stack:
+        d = stack.pop()
+        try:
+            out[d] = os.stat(d).st_mtime_ns
+            with os.scandir(d) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return out
 
 def _should_count_loose_scene(relp: str) -> bool:
     rp = (relp or "").replace("\\", "/").strip()
     if not rp:
         return False
 
-    name = Path(rp).name.lower()
-    stem = Path(rp).stem
-
-    if name == "default.json":
+    name = rp.rsplit("/", 1)[-1]
+    if name.lower() == "default.json":
         return False
+
+    dot = name.rfind(".")
+    stem = name[:dot] if dot > 0 else name
     if stem.isdigit():
         return False
 
@@ -836,6 +1418,41 @@ def _should_count_loose_scene(relp: str) -> bool:
 
 
 
+# ======================
+# Scene entry builders (shared by scan + cache paths)
+# ======================
+LOOSE_SCENE_VAR_LABEL = "(Saves/scene)"
+
+def _var_scene_entry(var_name: str, scene: dict) -> dict:
+    return {
+        "source": "var",
+        "scene_name": scene.get("scene_name", ""),
+        "var_name": var_name,
+        "preview_relpath": scene.get("preview_relpath", ""),
+        "preview_inner": scene.get("preview_inner", ""),
+        "scene_path": scene.get("scene_path", ""),
+        "loose_relpath": "",
+        "is_girl_looks": scene.get("is_girl_looks", None),
+    }
+
+def _loose_scene_entry(relp: str, scene_name: str) -> dict:
+    # loose scenes don't have a var zip preview path
+    return {
+        "source": "loose",
+        "scene_name": scene_name,
+        "var_name": LOOSE_SCENE_VAR_LABEL,
+        "preview_relpath": "",
+        "preview_inner": "",
+        "scene_path": "",
+        "loose_relpath": relp,
+        "is_girl_looks": None,
+    }
+
+def scene_entry_sort_key(e: dict) -> tuple[str, str, str]:
+    # display order: source, var, scene name (case-insensitive); entries come from the builders above
+    return (e["source"], e["var_name"], str(e["scene_name"]).lower())
+
+
 # ======================
 # Disable-by-rename helpers
 # ======================
@@ -848,6 +1465,79 @@ def disabled_name(original: str) -> str:
 def manifest_path_for(vam_dir: Path) -> Path:
     return vam_dir / "_vam_temp_manifest.json"
 
+def manifest_journal_path(mp: Path) -> Path:
+    # live applies append their renames/restores here instead of rewriting the manifest
+    return mp.with_suffix(".jsonl")
+
+def _manifest_item_key(item: dict) -> str:
+    return str(item.get("from_rel") or item.get("from") or "")
+
+def write_manifest_file(mp: Path, manifest: dict):
+    """
+    Compact dump straight to the file (orjson bytes when available, else
+    json.dump streaming into the handle); no indent=2 string is built first.
+    A full write folds in and drops the journal.
+    """
+    if orjson is not None:
+        mp.write_bytes(orjson.dumps(manifest))
+    else:
+        with open(mp, "w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(manifest, f, separators=(",", ":"))
+    manifest_journal_path(mp).unlink(missing_ok=True)
+
+def append_manifest_journal(mp: Path, added: list[dict], removed: list[str]):
+    """
+    JSON-Lines delta next to the manifest: {"del": from_rel} per restored file,
+    {"add": item} per newly renamed one. Costs O(changes), not O(renamed).
+    """
+    lines = [json.dumps({"del": k}, separators=(",", ":")) for k in removed]
+    lines += [json.dumps({"add": i}, separators=(",", ":")) for i in added]
+    if not lines:
+        return
+    with open(manifest_journal_path(mp), "a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+def read_manifest_file(mp: Path) -> dict:
+    """
+    Manifest with its journal (if any) replayed over "renamed".
+    Raises like json.loads/open when the manifest itself is unreadable.
+    """
+    with open(mp, "rb") as f:
+        manifest = _json_loads(f.read())
+    try:
+        jf = open(manifest_journal_path(mp), "r", encoding="utf-8")
+    except OSError:
+        return manifest
+    base = manifest.get("renamed", [])
+    renamed = {_manifest_item_key(i): i for i in base if isinstance(i, dict)} if isinstance(base, list) else {}
+    with jf:
+        for line in jf:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue  # torn tail from an interrupted append
+            if not isinstance(rec, dict):
+                continue
+            add = rec.get("add")
+            if isinstance(add, dict):
+                renamed[_manifest_item_key(add)] = add
+            elif isinstance(rec.get("del"), str):
+                renamed.pop(rec["del"], None)
+    manifest["renamed"] = list(renamed.values())
+    return manifest
+
+def manifest_stamp(mp: Path) -> tuple | None:
+    """(manifest mtime_ns, size, journal mtime_ns, size), None without a manifest."""
+    try:
+        st = os.stat(mp)
+    except OSError:
+        return None
+    try:
+        jst = os.stat(manifest_journal_path(mp))
+        return (st.st_mtime_ns, st.st_size, jst.st_mtime_ns, jst.st_size)
+    except OSError:
+        return (st.st_mtime_ns, st.st_size, 0, 0)
+
 
 
 # ======================
@@ -865,9 +1555,6 @@ class LoadingPopup(QDialog):
         self.setModal(False)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
 
-        self._base_text = "Loading"
-        self._dots = 0
-
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 14, 14, 14)
 
@@ -912,22 +1599,12 @@ class LoadingPopup(QDialog):
 
         root.addWidget(box)
 
-        self._timer = QTimer(self)
-        self._timer.setInterval(180)
-        self._timer.timeout.connect(self._tick)
-
+        # busy indicator is the indeterminate bar (animated by Qt itself, no Python tick)
         self.resize(320, 110)
 
-    def _tick(self):
-        self._dots = (self._dots + 1) % 4
-        self.label.setText(self._base_text + ("." * self._dots))
-
     def start(self, text: str = "Loading", sub: str = "Please wait"):
-        self._base_text = text or "Loading"
+        self.label.setText(f"{text or 'Loading'}...")
         self.sub.setText(sub or "")
-        self._dots = 0
-        self.label.setText(self._base_text)
-        self._timer.start()
 
         if self.parent():
             p = self.parent().frameGeometry()
@@ -937,7 +1614,6 @@ class LoadingPopup(QDialog):
         QApplication.processEvents()
 
     def stop(self):
-        self._timer.stop()
         self.hide()
         QApplication.processEvents()
 
@@ -967,6 +1643,7 @@ class HelpDialog(QDialog):
 # ======================
 class DonationDialog(QDialog):
     PATREON_URL = "https://www.patreon.com/c/LQuest"
+    _fetching = False  # one supporters fetch in flight across dialog instances
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -979,27 +1656,24 @@ class DonationDialog(QDialog):
         title.setStyleSheet("font-weight: bold; font-size: 12pt;")
         layout.addWidget(title)
 
-        data = load_supporters_cached(max_age_hours=2.0)
-        supporters = data.get("supporters", [])
-        if supporters:
-            lines = []
-            for s in supporters:
-                name = (s.get("name") or "Anonymous").strip()
-                tier = (s.get("tier") or "").strip()
-                if tier:
-                    lines.append(f"• {name}  ({tier})")
-                else:
-                    lines.append(f"• {name}")
-            text = "\n".join(lines)
-        else:
-            text = "(No supporters yet)"
-
         self.text = QTextEdit()
         self.text.setReadOnly(True)
-        updated = data.get("updated", "unknown")
-        self.text.setPlainText(text + f"\n\nLast updated: {updated}")
         layout.addWidget(self.text, 1)
 
+        # cached copy right away; a stale/missing cache is refetched on the IO pool
+        data, fresh = read_supporters_cache(max_age_hours=2.0)
+        if data is not None:
+            self._render(data)
+        else:
+            self.text.setPlainText("Loading supporters...")
+        if not fresh and not DonationDialog._fetching:
+            submit = getattr(parent, "_submit_io", None)
+            if submit is None:
+                self._render(fetch_supporters())
+            else:
+                DonationDialog._fetching = True
+                submit(self._on_supporters_fetched, fetch_supporters)
+
         row = QHBoxLayout()
         row.addStretch(1)
 
@@ -1013,6 +1687,34 @@ class DonationDialog(QDialog):
 
         layout.addLayout(row)
 
+    def _render(self, data: dict):
+        supporters = data.get("supporters", [])
+        if supporters:
+            lines = []
+            for s in supporters:
+                name = (s.get("name") or "Anonymous").strip()
+                tier = (s.get("tier") or "").strip()
+                if tier:
+                    lines.append(f"• {name}  ({tier})")
+                else:
+                    lines.append(f"• {name}")
+            text = "\n".join(lines)
+        else:
+            text = "(No supporters yet)"
+        updated = data.get("updated", "unknown")
+        self.text.setPlainText(text + f"\n\nLast updated: {updated}")
+
+    def _on_supporters_fetched(self, fut):
+        DonationDialog._fetching = False
+        try:
+            data = fut.result()
+        except Exception:
+            return
+        try:
+            self._render(data)
+        except RuntimeError:
+            pass  # dialog already destroyed
+
     def open_patreon(self):
         QDesktopServices.openUrl(QUrl(self.PATREON_URL))
 
@@ -1194,6 +1896,8 @@ class AnalyzeWorker(QThread):
         self.old_cache = old_cache or {}
 
     def run(self):
+        # stamp before listing: anything changing during the scan forces a full check next time
+        dir_mtimes = dir_mtime_map(self.addon_dir, self.saves_scene_dir)
         var_items = fast_list_vars_all_states(self.addon_dir)  # [(orig_name, actual_path)]
         total_var_count = len([1 for (n, p) in var_items if str(p).lower().endswith(".var")])  # optional: count enabled only
         show_hidden = True
@@ -1213,8 +1917,12 @@ class AnalyzeWorker(QThread):
                 if actual_path.name.lower().endswith(".var"):
                     var_paths[name] = rel
 
-        old_vars = (self.old_cache.get("vars") or {}) if isinstance(self.old_cache, dict) else {}
-        old_loose = (self.old_cache.get("loose") or {}) if isinstance(self.old_cache, dict) else {}
+        old_cache = self.old_cache if isinstance(self.old_cache, dict) else {}
+        old_vars = old_cache.get("vars") or {}
+        old_loose = old_cache.get("loose") or {}
+        # cold cache: skip per-item lookups entirely
+        has_var_cache = isinstance(old_vars, dict) and bool(old_vars)
+        has_loose_cache = isinstance(old_loose, dict) and bool(old_loose)
 
         all_infos: dict[str, dict] = {}
         all_sigs: dict[str, str] = {}
@@ -1222,6 +1930,12 @@ class AnalyzeWorker(QThread):
 
         scene_entries: list[dict] = []
 
+        # Once the looks filter has been used, detect looks for re-scanned vars in the
+        # same zip open instead of letting LooksWorker reopen them later.
+        old_looks = old_cache.get("looks")
+        detect_looks = isinstance(old_looks, dict) and bool(old_looks)
+        new_looks: dict[str, bool] = dict(old_looks) if detect_looks else {}
+
         # 3) Thread count (reasonable)
         max_workers = min(16, (os.cpu_count() or 8) * 2)
 
@@ -1233,14 +1947,15 @@ class AnalyzeWorker(QThread):
                 sig = _var_signature(actual_path)
                 all_sigs[name] = sig
 
-                cached = old_vars.get(name) if isinstance(old_vars, dict) else None
-                if isinstance(cached, dict) and cached.get("sig") == sig:
-                    if "dependencies" not in cached:
-                        cached["dependencies"] = []
-                    all_infos[name] = cached
-                    continue
+                if has_var_cache:
+                    cached = old_vars.get(name)
+                    if isinstance(cached, dict) and cached.get("sig") == sig:
+                        if "dependencies" not in cached:
+                            cached["dependencies"] = []
+                        all_infos[name] = cached
+                        continue
 
-                futures[ex.submit(scan_var_meta_only, actual_path)] = (name, actual_path, sig)
+                futures[ex.submit(scan_var_meta_only, actual_path, True, detect_looks)] = (name, actual_path, sig)
 
             # 5) Collect results
             for fut in as_completed(futures):
@@ -1258,13 +1973,16 @@ class AnalyzeWorker(QThread):
                     scene_name = scene.get("scene_name", "") or ""
                     preview_inner = scene.get("preview_path", "") or ""
                     scene_inner = scene.get("scene_path", "") or ""
+                    looks = scene.get("is_girl_looks")
+                    if looks is not None:
+                        new_looks[f"{name}::{scene_name}"] = bool(looks)
 
                     scenes_out.append({
                         "scene_name": scene_name,
                         "preview_relpath": "",
                         "preview_inner": preview_inner, 
                         "scene_path": scene_inner, 
-                        "is_girl_looks": None,
+                        "is_girl_looks": looks,
                     })
 
                 deps = info.get("dependencies", [])
@@ -1278,17 +1996,9 @@ class AnalyzeWorker(QThread):
             base, _ver = _parse_var_base_and_version(name)
             by_base.setdefault(base, []).append(name)
 
-        def _version_key(nm: str) -> tuple[int, str, str]:
-            _b, v = _parse_var_base_and_version(nm)
-            try:
-                vnum = int(v)
-            except Exception:
-                vnum = -1
-            return (vnum, v, nm)
-
         selected_names: set[str] = set()
         for base, names in by_base.items():
-            ordered = sorted(names, key=_version_key, reverse=True)
+            ordered = sorted(names, key=var_version_key, reverse=True)
             chosen = None
             for nm in ordered:
                 info = all_infos.get(nm) or {}
@@ -1309,16 +2019,7 @@ class AnalyzeWorker(QThread):
                 for s in scenes:
                     if not isinstance(s, dict):
                         continue
-                    scene_entries.append({
-                        "source": "var",
-                        "scene_name": s.get("scene_name", ""),
-                        "var_name": name,
-                        "preview_relpath": s.get("preview_relpath", ""),
-                        "preview_inner": s.get("preview_inner", ""),  
-                        "scene_path": s.get("scene_path", ""),  
-                        "loose_relpath": "",
-                        "is_girl_looks": None,
-                    })
+                    scene_entries.append(_var_scene_entry(name, s))
 
         all_deps: dict[str, list[str]] = {}
         for name, info in all_infos.items():
@@ -1330,47 +2031,24 @@ class AnalyzeWorker(QThread):
             all_deps[name] = [d for d in deps if isinstance(d, str)]
 
         if self.saves_scene_dir and self.saves_scene_dir.exists():
-            for sp in self.saves_scene_dir.rglob("*.json"):
-                if (not show_hidden) and _is_hidden_sidecar(sp):
+            for sp, relp, is_hidden in iter_scene_jsons(self.saves_scene_dir):
+                if (not show_hidden) and is_hidden:
                     continue
 
-                try:
-                    relp = str(sp.relative_to(self.saves_scene_dir)).replace("\\", "/")
-                except Exception:
-                    relp = sp.name
-
                 if not _should_count_loose_scene(relp):
                     continue
 
                 sig = _file_signature(sp)
 
-                cached = old_loose.get(relp) if isinstance(old_loose, dict) else None
+                cached = old_loose.get(relp) if has_loose_cache else None
                 if isinstance(cached, dict) and cached.get("sig") == sig:
                     scene_name = cached.get("scene_name") or relp
-                    scene_entries.append({
-                        "source": "loose",
-                        "scene_name": scene_name,
-                        "var_name": "(Saves/scene)",
-                        "preview_relpath": "",
-                        "preview_inner": "",  
-                        "scene_path": "",
-                        "loose_relpath": relp,
-                        "is_girl_looks": None,
-                    })
+                    scene_entries.append(_loose_scene_entry(relp, scene_name))
                     new_loose[relp] = cached
                     continue
 
                 scene_name = relp
-                scene_entries.append({
-                    "source": "loose",
-                    "scene_name": scene_name,
-                    "var_name": "(Saves/scene)",
-                    "preview_relpath": "",
-                    "preview_inner": "",  
-                    "scene_path": "",
-                    "loose_relpath": relp,
-                    "is_girl_looks": None,
-                })
+                scene_entries.append(_loose_scene_entry(relp, scene_name))
                 new_loose[relp] = {"sig": sig, "scene_name": scene_name}
 
         # 7) Build cache object
@@ -1382,41 +2060,75 @@ class AnalyzeWorker(QThread):
             "var_paths": var_paths,
             "all_deps": all_deps,
             "loose": new_loose,
-            "looks": self.old_cache.get("looks", {}) if isinstance(self.old_cache, dict) else {},
+            "dir_mtimes": dir_mtimes,
+            "looks": new_looks,
             "saved_at": time.time(),
             "only_latest_always": True,
             "show_hidden_always": True,
         }
 
+        # sorted here, off the GUI thread; the window shows entries in this order
+        scene_entries.sort(key=scene_entry_sort_key)
         self.finished.emit(scene_entries, total_var_count, cache_obj)
 
 
+# ======================
+# RenameWorker (apply / launch / restore renames)
+# ======================
+class RenameWorker(QThread):
+    """
+    Runs one rename pass, fn(**kwargs, progress=..., should_stop=...), off the GUI
+    thread: live_apply_renames for Apply and Launch, restore_renames for Restore.
+    """
+    progress = Signal(int, int)  # done, total
+    # fn's return value or the Exception it raised;
+    # not named finished, so QThread.finished still marks the thread's real end
+    done = Signal(object)
+
+    def __init__(self, fn, kwargs: dict, parent=None):
+        super().__init__(parent)
+        self.fn = fn
+        self.kwargs = kwargs
+
+    def run(self):
+        try:
+            result = self.fn(
+                progress=self.progress.emit, should_stop=self.isInterruptionRequested, **self.kwargs
+            )
+        except Exception as e:
+            result = e
+        self.done.emit(result)
+
+
 # ======================
 # UnusedCountWorker
 # ======================
 class UnusedCountWorker(QThread):
     finished = Signal(int)  # unused_count
 
-    def __init__(self, addon_dir: Path, scene_vars: set[str], deps_map: dict[str, list[str]] | None = None):
+    def __init__(self, addon_dir: Path, scene_vars: set[str], deps_map: dict[str, list[str]] | None = None,
+                 var_files: list[tuple[str, str]] | None = None):
         super().__init__()
         self.addon_dir = addon_dir
         self.scene_vars = set(scene_vars)
         self.deps_map = deps_map or {}
+        # (orig_name, path_str) listing the caller already has; scanned in run() if None
+        self.var_files = var_files
 
-    def _deps_for(self, var_name: str, path: Path | None) -> list[str]:
+    def _deps_for(self, var_name: str, path: Path | None) -> list[str] | frozenset[str]:
         deps = self.deps_map.get(var_name)
         if isinstance(deps, list):
             return [d for d in deps if isinstance(d, str)]
         if path:
-            info = scan_var_meta_only(path)
-            deps = info.get("dependencies", [])
-            if isinstance(deps, list):
-                return [d for d in deps if isinstance(d, str)]
+            return cached_scan_var_meta(path)["dependencies"]
         return []
 
     def run(self):
         try:
-            var_items = fast_list_vars_all_states(self.addon_dir)
+            if self.var_files is not None:
+                var_items = [(name, Path(fp)) for (name, fp) in self.var_files]
+            else:
+                var_items = fast_list_vars_all_states(self.addon_dir)
 
             var_paths: dict[str, Path] = {}
             enabled_vars: set[str] = set()
@@ -1429,11 +2141,12 @@ class UnusedCountWorker(QThread):
                         var_paths[name] = actual_path
 
             all_vars = set(var_paths.keys())
-            protected = {v for v in all_vars if is_asset_var(v)}
-            protected |= {v for v in all_vars if "[plugin]" in v.lower()}
+            protected = {v for v in all_vars if is_protected_var(v)}
 
             keep = set(protected)
-            queue: list[str] = []
+            queue: deque[str] = deque()
+            seen_deps: set[str] = set()
+            index = build_dependency_index(all_vars)
 
             for scene_var in self.scene_vars:
                 if scene_var in all_vars:
@@ -1441,8 +2154,11 @@ class UnusedCountWorker(QThread):
                     queue.extend(self._deps_for(scene_var, var_paths.get(scene_var)))
 
             while queue:
-                dep = queue.pop()
-                for matched_var in resolve_dependency(dep, all_vars):
+                dep = queue.popleft()
+                if dep in seen_deps:
+                    continue
+                seen_deps.add(dep)
+                for matched_var in resolve_dependency(dep, all_vars, index):
                     if matched_var not in keep:
                         keep.add(matched_var)
                         queue.extend(self._deps_for(matched_var, var_paths.get(matched_var)))
@@ -1454,26 +2170,35 @@ class UnusedCountWorker(QThread):
 
 
 # ======================
-# CacheSaveWorker
+# VamStateWorker
 # ======================
-class CacheSaveWorker(QThread):
-    def __init__(self, cache_obj: dict):
-        super().__init__()
-        self.cache_obj = cache_obj
+class VamStateWorker(QThread):
+    """
+    Polls whether VaM.exe is running (lean session monitoring) so the
+    process probe never runs on the GUI thread. Emits every interval.
+    """
+    state = Signal(bool)
+
+    def __init__(self, interval_ms: int = 1000, parent=None):
+        super().__init__(parent)
+        self.interval_ms = interval_ms
 
     def run(self):
-        try:
-            cache_path().write_text(
-                json.dumps(self.cache_obj, separators=(",", ":"), ensure_ascii=True),
-                encoding="utf-8",
-            )
-        except Exception:
-            pass
+        while not self.isInterruptionRequested():
+            self.state.emit(is_process_running(VAM_EXE))
+            # sleep in slices so stop/close doesn't wait a full interval
+            waited = 0
+            while waited < self.interval_ms and not self.isInterruptionRequested():
+                self.msleep(100)
+                waited += 100
 
 
 # ======================
 # PreviewLoader (background)
 # ======================
+PREVIEW_ZIP_BUFFER = 256 * 1024
+
+
 class PreviewLoader(QThread):
     result = Signal(object)  
 
@@ -1483,8 +2208,9 @@ class PreviewLoader(QThread):
         self._counter = itertools.count()
         self._stop = False
         self._max_queue = 20000
-        self._zip_cache: dict[str, zipfile.ZipFile] = {}
-        self._zip_order = deque()
+        # open var zips, least recently used first (move_to_end on hit):
+        # path -> [(mtime_ns, size), ZipFile, {lower stem: image name} or None until needed, file]
+        self._zip_cache: OrderedDict[str, list] = OrderedDict()
         self._zip_cache_limit = 32
 
     def enqueue(self, task: dict, priority: int = 0) -> bool:
@@ -1505,74 +2231,92 @@ class PreviewLoader(QThread):
         except Exception:
             pass
         try:
-            for z in self._zip_cache.values():
-                try:
-                    z.close()
-                except Exception:
-                    pass
+            for entry in self._zip_cache.values():
+                self._close_zip_entry(entry)
             self._zip_cache.clear()
-            self._zip_order.clear()
         except Exception:
             pass
 
-    def _get_zip(self, var_path: Path) -> zipfile.ZipFile | None:
+    @staticmethod
+    def _close_zip_entry(entry: list):
+        # ZipFile doesn't close a file object it was handed
+        for h in (entry[1], entry[3]):
+            try:
+                h.close()
+            except Exception:
+                pass
+
+    def _get_zip(self, var_path: Path) -> list | None:
+        """
+        Cached [sig, ZipFile, stem index] for var_path; the central directory is
+        parsed once per file version (a changed mtime/size reopens it).
+        """
         key = str(var_path)
-        z = self._zip_cache.get(key)
-        if z is not None:
-            if key in self._zip_order:
-                try:
-                    self._zip_order.remove(key)
-                except Exception:
-                    pass
-            self._zip_order.append(key)
-            return z
         try:
-            z = zipfile.ZipFile(var_path, "r")
+            st = os.stat(key)
+        except OSError:
+            st = None
+        hit = self._zip_cache.pop(key, None)
+        if hit is not None:
+            if st is not None and hit[0] == (st.st_mtime_ns, st.st_size):
+                self._zip_cache[key] = hit
+                return hit
+            self._close_zip_entry(hit)
+        if st is None:
+            return None
+        # larger Python-level buffer: a member's local header and (typically) the
+        # whole preview image come in with one read instead of 8 KiB steps
+        try:
+            f = open(key, "rb", buffering=PREVIEW_ZIP_BUFFER)
+        except OSError:
+            return None
+        try:
+            z = zipfile.ZipFile(f, "r")
         except Exception:
+            f.close()
             return None
-        self._zip_cache[key] = z
-        self._zip_order.append(key)
-        if len(self._zip_order) > self._zip_cache_limit:
-            old_key = self._zip_order.popleft()
-            old = self._zip_cache.pop(old_key, None)
-            if old:
-                try:
-                    old.close()
-                except Exception:
-                    pass
-        return z
+        entry = [(st.st_mtime_ns, st.st_size), z, None, f]
+        self._zip_cache[key] = entry
+        if len(self._zip_cache) > self._zip_cache_limit:
+            _old_key, old = self._zip_cache.popitem(last=False)
+            self._close_zip_entry(old)
+        return entry
+
+    @staticmethod
+    def _scene_image_index(z: zipfile.ZipFile) -> dict[str, str]:
+        # lower-case stem -> first Saves/scene image with that stem (zip order, as the old scan)
+        idx: dict[str, str] = {}
+        for name in z.NameToInfo:
+            ln = name.lower()
+            if ln.startswith("saves/scene/") and ln.endswith((".png", ".jpg", ".jpeg")):
+                idx.setdefault(path_stem(ln), name)
+        return idx
 
     def _read_preview_from_var_cached(self, var_path: Path, scene_name: str, inner_hint: str) -> tuple[bytes | None, str]:
-        z = self._get_zip(var_path)
-        if not z:
+        entry = self._get_zip(var_path)
+        if not entry:
+            return None, ""
+        z = entry[1]
+        names = z.NameToInfo  # dict lookups instead of read() + KeyError per guess
+        name = None
+        if inner_hint and inner_hint in names:
+            name = inner_hint
+        else:
+            for ext in (".png", ".jpg", ".jpeg"):
+                cand = f"Saves/scene/{scene_name}{ext}"
+                if cand in names:
+                    name = cand
+                    break
+        if name is None:
+            if entry[2] is None:
+                entry[2] = self._scene_image_index(z)
+            name = entry[2].get(scene_name.lower())
+        if name is None:
             return None, ""
-        if inner_hint:
-            try:
-                return z.read(inner_hint), inner_hint
-            except Exception:
-                pass
-        for ext in (".png", ".jpg", ".jpeg"):
-            cand = f"Saves/scene/{scene_name}{ext}"
-            try:
-                return z.read(cand), cand
-            except Exception:
-                pass
-        base = scene_name.lower()
         try:
-            for name in z.namelist():
-                ln = name.lower()
-                if not ln.startswith("saves/scene/"):
-                    continue
-                if not (ln.endswith(".png") or ln.endswith(".jpg") or ln.endswith(".jpeg")):
-                    continue
-                if Path(ln).stem == base:
-                    try:
-                        return z.read(name), name
-                    except Exception:
-                        pass
+            return _read_zip_entry(z, names[name]), name
         except Exception:
             return None, ""
-        return None, ""
 
     def _make_thumb_bytes(self, image_bytes: bytes, width: int, height: int) -> bytes | None:
         if not image_bytes or width <= 0 or height <= 0:
@@ -1614,10 +2358,14 @@ class PreviewLoader(QThread):
 
             # Try cache path first (even if preview_rel missing)
             rel_try = preview_rel
+            keyed = False
             if not rel_try and var_name and scene_name:
                 rel_try = f"previews/{_safe_preview_key(var_name, scene_name)}.bin"
+                keyed = True
             if rel_try:
                 img_bytes = read_preview_bytes(rel_try)
+                if not img_bytes and keyed:
+                    img_bytes = _migrate_legacy_preview(var_name, scene_name, rel_try)
                 if img_bytes:
                     rel_used = rel_try
 
@@ -1646,23 +2394,27 @@ class PreviewLoader(QThread):
 # ChangeCheckWorker
 # ======================
 class ChangeCheckWorker(QThread):
-    finished = Signal(bool)  # needs_rescan?
+    # needs_rescan?, refreshed dir_mtimes stamp (or None) for the GUI thread to persist
+    finished = Signal(bool, object)
 
-    def __init__(self, addon_dir: Path, saves_scene_dir: Path | None, cache_obj: dict):
+    def __init__(self, addon_dir: Path, saves_scene_dir: Path | None, cache_obj: dict, full_check: bool = False):
         super().__init__()
         self.addon_dir = addon_dir
         self.saves_scene_dir = saves_scene_dir
         self.cache_obj = cache_obj or {}
+        # skip the dir-mtime fast path (explicit Refresh): a file overwritten
+        # in place leaves its folder's mtime unchanged
+        self.full_check = full_check
 
     def run(self):
         try:
             if not isinstance(self.cache_obj, dict):
-                self.finished.emit(True)
+                self.finished.emit(True, None)
                 return
 
             cached_addon = self.cache_obj.get("addon_dir")
             if str(self.addon_dir) != str(cached_addon):
-                self.finished.emit(True)
+                self.finished.emit(True, None)
                 return
 
             cached_vars = self.cache_obj.get("vars", {}) if isinstance(self.cache_obj.get("vars"), dict) else {}
@@ -1670,7 +2422,13 @@ class ChangeCheckWorker(QThread):
 
             cached_all = self.cache_obj.get("all_var_sigs")
             if not isinstance(cached_all, dict):
-                self.finished.emit(True)
+                self.finished.emit(True, None)
+                return
+
+            # Fast path: no folder gained/lost/renamed an entry since the last scan
+            mtimes_now = dir_mtime_map(self.addon_dir, self.saves_scene_dir)
+            if not self.full_check and mtimes_now and self.cache_obj.get("dir_mtimes") == mtimes_now:
+                self.finished.emit(False, None)
                 return
 
             var_items = fast_list_vars_all_states(self.addon_dir)
@@ -1679,41 +2437,39 @@ class ChangeCheckWorker(QThread):
                 current_sigs[name] = _var_signature(actual_path)
 
             if set(current_sigs.keys()) != set(cached_all.keys()):
-                self.finished.emit(True)
+                self.finished.emit(True, None)
                 return
 
             for name, sig_now in current_sigs.items():
                 if cached_all.get(name) != sig_now:
-                    self.finished.emit(True)
+                    self.finished.emit(True, None)
                     return
 
             show_hidden = True
             loose_now: dict[str, str] = {}
             if self.saves_scene_dir and self.saves_scene_dir.exists():
-                for sp in self.saves_scene_dir.rglob("*.json"):
-                    if (not show_hidden) and _is_hidden_sidecar(sp):
+                for sp, relp, is_hidden in iter_scene_jsons(self.saves_scene_dir):
+                    if (not show_hidden) and is_hidden:
                         continue
-                    try:
-                        relp = str(sp.relative_to(self.saves_scene_dir)).replace("\\", "/")
-                    except Exception:
-                        relp = sp.name
                     if not _should_count_loose_scene(relp):
                         continue
                     loose_now[relp] = _file_signature(sp)
 
             if set(loose_now.keys()) != set(cached_loose.keys()):
-                self.finished.emit(True)
+                self.finished.emit(True, None)
                 return
 
             for relp, sig_now in loose_now.items():
                 sig_cached = (cached_loose.get(relp) or {}).get("sig")
                 if sig_now != sig_cached:
-                    self.finished.emit(True)
+                    self.finished.emit(True, None)
                     return
 
-            self.finished.emit(False)
+            # Nothing changed (e.g. disable/restore renames): hand the new stamp back so the
+            # GUI thread saves it and the next check can take the fast path again.
+            self.finished.emit(False, mtimes_now)
         except Exception:
-            self.finished.emit(True)
+            self.finished.emit(True, None)
 
 
 # ======================
@@ -1749,15 +2505,7 @@ class LooksWorker(QThread):
         except Exception:
             return False
 
-        try:
-            blob = raw.lower()
-        except Exception:
-            try:
-                blob = raw.decode("utf-8", errors="ignore").lower().encode("utf-8", errors="ignore")
-            except Exception:
-                return False
-
-        return (b"/female" in blob) and (b"/male" not in blob)
+        return is_girl_looks_scene(raw)
 
 
     def run(self):
@@ -1783,7 +2531,7 @@ class LooksWorker(QThread):
                                 continue
                             if not ln.endswith(".json"):
                                 continue
-                            stem = Path(ln).stem
+                            stem = path_stem(ln)
                             if stem not in json_map:
                                 json_map[stem] = name
                     except Exception:
@@ -1807,62 +2555,187 @@ class LooksWorker(QThread):
 
 
 # ======================
-# Dependency row widget
+# Dependency list (model + delegate)
 # ======================
-class DependencyRow(QWidget):
-    def __init__(self, text: str, present: bool, dark: bool = True):
-        super().__init__()
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 6, 8, 6)
-        layout.setSpacing(10)
-
-        strip = QFrame()
-        strip.setFixedWidth(10)
-        strip.setMinimumHeight(18)
-        strip.setStyleSheet(
-            "background-color: #2ecc71; border-radius: 3px;" if present
-            else "background-color: #e74c3c; border-radius: 3px;"
-        )
-        layout.addWidget(strip)
-
-        label = QLabel(text)
-        label.setWordWrap(True)
-        label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        layout.addWidget(label, 1)
-
-        self._strip = strip
-        self._label = label
-        self._present = present
-        self._apply_style(dark)
-        self.setLayout(layout)
-
-    def _apply_style(self, dark: bool):
-        if dark:
-            self.setStyleSheet("border-radius: 6px;")
-            self._label.setStyleSheet("color: #9be28c;" if self._present else "color: #ff8b8b;")
+ROLE_DEP_PRESENT = Qt.UserRole + 12
+
+
+class DependencyListModel(QAbstractListModel):
+    """
+    Rows of (text, present) for the dependency panel. present is None for a
+    plain message row ("—", "(missing on disk)").
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple[str, bool | None]] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        text, present = self._rows[index.row()]
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return text
+        if role == ROLE_DEP_PRESENT:
+            return present
+        return None
+
+    def set_rows(self, rows: list[tuple[str, bool | None]]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
+class DependencyDelegate(QStyledItemDelegate):
+    """
+    Paints a dependency row: colored strip (present/missing) + wrapped text.
+    Only visible rows are painted; no widget per dependency.
+    """
+    STRIP_W = 10
+    PAD_X = 8
+    PAD_Y = 6
+    GAP = 10
+    ROW_GAP = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.dark = True
+
+    def _text_width(self, option) -> int:
+        view = self.parent()
+        width = view.viewport().width() if view is not None else option.rect.width()
+        return max(40, width - self.PAD_X * 2 - self.STRIP_W - self.GAP)
+
+    def sizeHint(self, option, index):  
+        fm = QFontMetrics(option.font)
+        w = self._text_width(option)
+        text = index.data(Qt.DisplayRole) or ""
+        h = fm.boundingRect(QRect(0, 0, w, 100000), Qt.TextWordWrap, text).height()
+        return QSize(w, max(18, h) + self.PAD_Y * 2 + self.ROW_GAP)
+
+    def paint(self, painter: QPainter, option, index):  
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = option.rect.adjusted(0, 0, 0, -self.ROW_GAP)
+        text = index.data(Qt.DisplayRole) or ""
+        present = index.data(ROLE_DEP_PRESENT)
+
+        if present is None:
+            painter.setPen(QColor("#aaa"))
+            painter.drawText(rect.adjusted(self.PAD_X, self.PAD_Y, -self.PAD_X, -self.PAD_Y),
+                             Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, text)
+            painter.restore()
+            return
+
+        if not self.dark:
+            painter.setBrush(QColor("#f0e8db"))
+            painter.setPen(QColor("#e0d7c8"))
+            painter.drawRoundedRect(rect, 6, 6)
+        if option.state & QStyle.State_Selected:
+            painter.setBrush(QColor(61, 174, 233, 40))
+            painter.setPen(Qt.NoPen)
+            painter.drawRoundedRect(rect, 6, 6)
+
+        inner = rect.adjusted(self.PAD_X, self.PAD_Y, -self.PAD_X, -self.PAD_Y)
+        strip = QRect(inner.left(), inner.top(), self.STRIP_W, max(18, inner.height()))
+        painter.setBrush(QColor("#2ecc71") if present else QColor("#e74c3c"))
+        painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(strip, 3, 3)
+
+        if self.dark:
+            color = "#9be28c" if present else "#ff8b8b"
         else:
-            self.setStyleSheet("background-color: #f0e8db; border: 1px solid #e0d7c8; border-radius: 6px;")
-            self._label.setStyleSheet("color: #2d2d2d;" if self._present else "color: #7a1e12;")
-    
-    def set_theme(self, dark: bool):
-        self._apply_style(dark)
+            color = "#2d2d2d" if present else "#7a1e12"
+        painter.setPen(QColor(color))
+        text_rect = inner.adjusted(self.STRIP_W + self.GAP, 0, 0, 0)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, text)
+
+        painter.restore()
+
+
+# event types MainWindow.eventFilter acts on for the scene viewport
+_VIEWPORT_FILTER_EVENTS = frozenset((
+    QEvent.Resize,
+    QEvent.MouseButtonPress,
+    QEvent.MouseMove,
+    QEvent.MouseButtonRelease,
+    QEvent.Leave,
+))
+
+# scene grid geometry (QListView spacing is set once from this)
+SCENE_GRID_SPACING = 10
+SCENE_MIN_CARD_W = 170
+
+
+# ======================
+# Process helpers
+# ======================
+VAM_EXE = "VaM.exe"
+VD_STREAMER_EXE = "VirtualDesktop.Streamer.exe"
+# seconds a VaM.exe probe result is reused for UI checks (MainWindow.is_vam_running)
+VAM_STATE_TTL = 1.0
+
+
+def _find_process_psutil(image_name: str, attrs: list[str] | None = None) -> dict | None:
+    """
+    psutil only: info dict of the first process whose name matches image_name
+    (case-insensitive), or None. Avoids spawning tasklist/PowerShell.
+    """
+    target = image_name.lower()
+    try:
+        for proc in psutil.process_iter(attrs or ["name"]):
+            name = proc.info.get("name")
+            if name and name.lower() == target:
+                return proc.info
+    except Exception:
+        pass
+    return None
+
+
+def is_process_running(image_name: str) -> bool:
+    # psutil enumerates in-process; otherwise fall back to tasklist.exe
+    if psutil is not None:
+        return _find_process_psutil(image_name) is not None
+    try:
+        out = subprocess.check_output(
+            ["tasklist", "/FI", f"IMAGENAME eq {image_name}"],
+            creationflags=subprocess.CREATE_NO_WINDOW
+        ).decode(errors="ignore").lower()
+        return image_name.lower() in out and "no tasks are running" not in out
+    except Exception:
+        return False
 
 
 # ======================
 # Main GUI
 # ======================
+_dark_mode_cache: bool | None = None
+
 def is_dark_mode(app: QApplication) -> bool:
-    pal = app.palette()
+    # palette lookups happen once per palette; MainWindow.changeEvent invalidates
+    global _dark_mode_cache
+    if _dark_mode_cache is None:
+        pal = app.palette()
 
-    win = pal.color(QPalette.Window).value()
-    txt = pal.color(QPalette.WindowText).value()
-  
-    return win < 128 and txt > 128
+        win = pal.color(QPalette.Window).value()
+        txt = pal.color(QPalette.WindowText).value()
 
-def build_btn_css(dark: bool) -> str:
-    if not dark:
-        #light mode
-        return """
+        _dark_mode_cache = win < 128 and txt > 128
+    return _dark_mode_cache
+
+def invalidate_dark_mode():
+    global _dark_mode_cache
+    _dark_mode_cache = None
+
+# Stylesheets are constant per theme: build once at import, hand out by lookup.
+_BTN_CSS = {
+    #light mode
+    False: """
         QPushButton, QComboBox {
             min-height: 26px;
             padding: 6px 14px;
@@ -1874,10 +2747,9 @@ def build_btn_css(dark: bool) -> str:
             background-color: #f0f0f0;
             border: 1px solid #cfcfcf;
         }
-        """
-    else:
-        #darkmode
-        return """
+        """,
+    #darkmode
+    True: """
         QPushButton, QComboBox {
             min-height: 26px;
             padding: 6px 14px;
@@ -1903,11 +2775,11 @@ def build_btn_css(dark: bool) -> str:
             border: 1px solid rgba(255,255,255,0.08);
             color: #777;
         }
-        """
+        """,
+}
 
-def build_scrollbar_css(dark: bool) -> str:
-    if dark:
-        return """
+_SB_CSS = {
+    True: """
         QScrollBar:vertical {
             width: 18px;
             background: rgba(255,255,255,0.05);
@@ -1930,9 +2802,8 @@ def build_scrollbar_css(dark: bool) -> str:
         QScrollBar::sub-page:vertical {
             background: none;
         }
-        """
-    else:
-        return """
+        """,
+    False: """
         QScrollBar:vertical {
             width: 18px;
             background: rgba(0,0,0,0.06);
@@ -1955,38 +2826,50 @@ def build_scrollbar_css(dark: bool) -> str:
         QScrollBar::sub-page:vertical {
             background: none;
         }
-        """
-
-
-
+        """,
+}
+
+_APPLY_PULSE_ON_CSS = """
+    QPushButton#applyPulse {
+        border: 2px solid rgba(255, 215, 64, 0.95);
+        background-color: rgba(255, 215, 64, 0.20);
+        font-weight: 700;
+    }
+"""
 
-class MainWindow(QWidget):
-    def _set_dim_label(self, label: QLabel, dark_hex: str):
-        if self._dark:
-            label.setStyleSheet(f"color: {dark_hex};")
-        else:
-            label.setStyleSheet("")
+_APPLY_PULSE_OFF_CSS = """
+    QPushButton#applyPulse {
+        border: 2px solid rgba(255, 215, 64, 0.55);
+        background-color: rgba(255, 215, 64, 0.10);
+        font-weight: 700;
+    }
+"""
 
-    def _card_header_css(self, dark: bool) -> str:
-        if dark:
-            return """
+_CARD_HEADER_CSS = {
+    True: """
             QWidget {
                 background: rgba(255,255,255,0.03);
                 border: 1px solid rgba(255,255,255,0.08);
                 border-radius: 8px;
             }
-            """
-        return """
+            """,
+    False: """
         QWidget {
             background: rgba(0,0,0,0.03);
             border: 1px solid rgba(0,0,0,0.08);
             border-radius: 8px;
         }
-        """
+        """,
+}
 
-    def _progress_css(self, dark: bool) -> str:
-        if dark:
-            return """
+# The card header carries its own sheet, so the button rules are appended to it.
+# Composite sheets are joined once here; don't grow them with += at call sites.
+_CARD_HEADER_SHEET = {
+    dark: "".join((_CARD_HEADER_CSS[dark], _BTN_CSS[dark])) for dark in (True, False)
+}
+
+_PROGRESS_CSS = {
+    True: """
             QProgressBar {
                 border: 1px solid rgba(255,255,255,0.25);
                 border-radius: 6px;
@@ -1997,8 +2880,8 @@ class MainWindow(QWidget):
                 background-color: #3daee9;
                 border-radius: 6px;
             }
-            """
-        return """
+            """,
+    False: """
         QProgressBar {
             border: 1px solid rgba(0,0,0,0.2);
             border-radius: 6px;
@@ -2009,7 +2892,58 @@ class MainWindow(QWidget):
             background-color: #3daee9;
             border-radius: 6px;
         }
-        """
+        """,
+}
+
+_VLINE_CSS = {
+    True: "color: rgba(255,255,255,0.14);",
+    False: "color: rgba(0,0,0,0.18);",
+}
+
+# Dim labels are matched by a "dim" property (hex without '#'), set only in dark mode;
+# one window-level sheet instead of an inline sheet per label.
+_DIM_LABEL_CSS = """
+    QLabel[dim="aaa"] { color: #aaa; }
+    QLabel[dim="bbb"] { color: #bbb; }
+    QLabel[dim="777"] { color: #777; }
+"""
+
+def build_btn_css(dark: bool) -> str:
+    return _BTN_CSS[bool(dark)]
+
+def build_scrollbar_css(dark: bool) -> str:
+    return _SB_CSS[bool(dark)]
+
+
+
+
+class MainWindow(QWidget):
+    # (callback, future) from _io_pool threads, delivered on the GUI thread
+    _io_done = Signal(object, object)
+
+    MAX_PRESETS = 5
+    _PRESET_KEYS = tuple(f"preset_{i}" for i in range(1, MAX_PRESETS + 1))
+
+    def _set_dim_label(self, label: QLabel, dark_hex: str):
+        value = dark_hex.lstrip("#") if self._dark else ""
+        if label.property("dim") == value:
+            return
+        label.setProperty("dim", value)
+        # property selectors are only re-evaluated on repolish
+        label.style().unpolish(label)
+        label.style().polish(label)
+
+    @property
+    def loading(self) -> LoadingPopup:
+        if self._loading is None:
+            self._loading = LoadingPopup(self)
+        return self._loading
+
+    def _card_header_css(self, dark: bool) -> str:
+        return _CARD_HEADER_SHEET[bool(dark)]
+
+    def _progress_css(self, dark: bool) -> str:
+        return _PROGRESS_CSS[bool(dark)]
 
     def _apply_theme(self):
         app = QApplication.instance()
@@ -2027,13 +2961,13 @@ class MainWindow(QWidget):
         self._dark = is_dark_mode(QApplication.instance())
         self._btn_css = build_btn_css(self._dark)
 
+        # one sheet for every button/combo in the left panel (selectors cascade to children)
+        if hasattr(self, "left_panel"):
+            self.left_panel.setStyleSheet(self._btn_css)
         for btn in self.findChildren(QPushButton):
-            btn.setStyleSheet(self._btn_css)
             btn.setCursor(Qt.PointingHandCursor)
         for chk in self.findChildren(QCheckBox):
             chk.setCursor(Qt.PointingHandCursor)
-        for combo in self.findChildren(QComboBox):
-            combo.setStyleSheet(self._btn_css)
 
         if hasattr(self, "scene_view"):
             self.scene_view.setStyleSheet(build_scrollbar_css(self._dark))
@@ -2043,10 +2977,7 @@ class MainWindow(QWidget):
         if hasattr(self, "progress"):
             self.progress.setStyleSheet(self._progress_css(self._dark))
         if hasattr(self, "vline"):
-            if self._dark:
-                self.vline.setStyleSheet("color: rgba(255,255,255,0.14);")
-            else:
-                self.vline.setStyleSheet("color: rgba(0,0,0,0.18);")
+            self.vline.setStyleSheet(_VLINE_CSS[self._dark])
 
         if hasattr(self, "status"):
             self.status.setStyleSheet("font-size: 10pt;")
@@ -2073,9 +3004,10 @@ class MainWindow(QWidget):
             else:
                 self.dep_title.setStyleSheet("font-weight: bold; font-size: 11pt;")
 
-        if hasattr(self, "dep_container"):
-            for row in self.dep_container.findChildren(DependencyRow):
-                row.set_theme(self._dark)
+        if hasattr(self, "dep_view"):
+            self.dep_delegate.dark = self._dark
+            self.dep_view.setStyleSheet(build_scrollbar_css(self._dark))
+            self.dep_view.viewport().update()
 
         if getattr(self, "selection_dirty", False):
             self.set_apply_attention(True)
@@ -2084,6 +3016,8 @@ class MainWindow(QWidget):
 
     def changeEvent(self, event):  # type: ignore[override]
         if event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            if event.type() == QEvent.PaletteChange:
+                invalidate_dark_mode()
             try:
                 self._apply_theme()
             except Exception:
@@ -2094,6 +3028,7 @@ class MainWindow(QWidget):
 
         _ = app_data_dir()
         self.cfg = load_config()
+        self._normalize_preset_cfg()
         self._one_time_cache_reset()
         _ = previews_dir()
 
@@ -2112,10 +3047,44 @@ class MainWindow(QWidget):
         self.scene_proxy.setDynamicSortFilter(True)
         self._var_path_cache: dict[str, Path] = {}
         self._var_path_cache_ready = False
+        # one AddonPackages listing shared by the name/state/count helpers, see _addon_var_files
+        self._addon_scan_stamp: tuple[str, dict[str, int]] | None = None
+        self._addon_scan: list[tuple[str, str]] = []
+        self._addon_enabled: set[str] = set()
+        self._addon_disabled: set[str] = set()
+        self._dep_index: dict[str, list[str]] = {}
+        self._dep_index_src: list | None = None
+        self._state_map: dict[str, str] = {}
+        self._state_map_src: list | None = None
+        self._protected: frozenset[str] = frozenset()
+        self._protected_src: list | None = None
+        # see _dep_targets_resolver
+        self._dep_targets_memo: dict[str, frozenset[str]] = {}
+        self._dep_resolved_memo: dict[str, frozenset[str]] = {}
+        self._dep_targets_src: tuple[list, dict] | None = None
+        # (scene_vars, var names, deps cache, whitelist, keep set) of the last compute_keep_set_for_scene_vars
+        self._keep_memo: tuple[frozenset, frozenset, dict, frozenset, frozenset] | None = None
+        self._dep_all_vars: set[str] = set()
         self._var_deps_cache: dict[str, list[str]] = {}
         self._unused_worker: UnusedCountWorker | None = None
+        # shared pool for blocking network calls (update check); see _submit_io
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="vsc-io")
+        self._io_done.connect(lambda cb, fut: cb(fut))
         self._unused_req_id = 0
-        self._cache_save_worker: CacheSaveWorker | None = None
+        # scene cache writes: one thread, so writes land in order and never share the .tmp file
+        self._cache_io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vsc-cache")
+        # created on first use by _prefetch_var_scans
+        self._scan_pool: ThreadPoolExecutor | None = None
+        # persistent meta-only scans (see cached_scan_var_meta); trimmed once per run
+        scan_cache.configure(app_data_dir() / "scan_cache")
+        self._cache_io.submit(scan_cache.prune)
+        # last parsed scene cache, keyed by the file's (mtime_ns, size)
+        self._cache_memo: tuple[tuple[int, int], dict] | None = None
+        self._vam_running_cache: tuple[float, bool] | None = None
+        # ((path, mtime_ns, size), manifest) of the lean-session manifest; see _read_manifest
+        self._manifest_memo: tuple[tuple, dict] | None = None
+        # (keep_set, _apply_stamp()) of the last clean live apply
+        self._last_applied: tuple[frozenset[str], tuple | None] | None = None
         self._preview_loaders: list[PreviewLoader] = []
         self._preview_loader_index = 0
         self._preview_pending: set[int] = set()
@@ -2144,12 +3113,24 @@ class MainWindow(QWidget):
         self.page_size = 4000
         self.page_index = 0
         self._filtered_entries: list[dict] = []
+        self._filtered_idx: list[int] = []
+        self._filter_idx_src: tuple[list[dict], str] | None = None
+        self._page_entries: list[dict] = []
+        # lowercased "scene\nvar" per scene entry, rebuilt when scene_entries is replaced
+        self._search_keys: list[str] = []
+        self._search_keys_src: list[dict] | None = None
+        self._looks_keys: list[str] = []
+        self._looks_keys_src: list[dict] | None = None
+        # 1 per scene entry that passes "looks only", rebuilt when scene_entries or looks change
+        self._looks_mask = bytearray()
+        self._looks_mask_src: list[dict] | None = None
+        self._last_filter_q: str | None = None
         self._total_pages = 1
         self.use_pagination = False
         self._thumb_target = QSize(180, 120)
 
         #apply button variable
-        self.session_baseline_scene_vars: set[str] = set()
+        self.session_baseline_scene_vars: frozenset[str] = frozenset()
         self.selection_dirty = False
 
         self._apply_attention_timer = QTimer(self)
@@ -2174,16 +3155,32 @@ class MainWindow(QWidget):
         # lean session state
         self.lean_active = False
         self.vam_seen_running = False
-
-        self.poll_timer = QTimer(self)
-        self.poll_timer.setInterval(1000)
-        self.poll_timer.timeout.connect(self.check_vam_state)
+        # apply/launch/restore renames run one at a time in a RenameWorker (see _start_rename_job);
+        # _rename_job names the running one ("" = idle), the rest is held for the done slots
+        self.rename_worker: RenameWorker | None = None
+        self._rename_job = ""
+        self._rename_on_done = None
+        self._apply_keep_set: set[str] = set()
+        self._apply_tool_items: list[dict] = []
+        self._apply_scene_vars: frozenset[str] = frozenset()
+        self._apply_was_running = False
+        self._launch_then = None
+        self._restore_after_vam_closed = False
+
+        # VaM.exe monitoring runs in VamStateWorker while a lean session is active
+        self.vam_state_worker: VamStateWorker | None = None
 
         self._resize_timer = QTimer(self)
         self._resize_timer.setSingleShot(True)
         self._resize_timer.setInterval(100)
         self._resize_timer.timeout.connect(self._update_scene_view_grid)
 
+        # search box: one filter pass after typing pauses, not one per keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(180)
+        self._search_timer.timeout.connect(self._on_search_settled)
+
                 # drag-to-scroll (touch-like)
         self._drag_scroll_active = False
         self._drag_scroll_start_pos = None
@@ -2200,9 +3197,10 @@ class MainWindow(QWidget):
 
         self._dark = is_dark_mode(QApplication.instance())
         self._btn_css = build_btn_css(self._dark)
+        self.setStyleSheet(_DIM_LABEL_CSS)
 
 
-        self.loading = LoadingPopup(self)
+        self._loading: LoadingPopup | None = None  # built on first use, see loading
 
         root = QHBoxLayout(self)
         root.setContentsMargins(10, 10, 10, 10)
@@ -2212,41 +3210,42 @@ class MainWindow(QWidget):
         # LEFT
         # ------------------
         left = QWidget()
+        self.left_panel = left
         self.left_layout = QVBoxLayout(left)
         self.left_layout.setSpacing(8)
 
         row_head = QHBoxLayout()
         self.title = QLabel("")
-        row_head.addWidget(self.title, 1)
 
         self.btn_help = QPushButton("Help")
-        icon_path = resource_path("icons/qmark.png")
-        if icon_path.exists():
-            self.btn_help.setIcon(QIcon(str(icon_path)))
+        ic = _icon("icons/qmark.png")
+        if ic:
+            self.btn_help.setIcon(ic)
             self.btn_help.setIconSize(QSize(18, 18))
-        self.btn_help.setStyleSheet(self._btn_css)
         self.btn_help.clicked.connect(self.open_help)
-        row_head.addWidget(self.btn_help, 0, Qt.AlignRight)
 
         self.btn_check_update = QPushButton(" Check New Release")
-        icon_path = resource_path("icons/update.png")
-        if icon_path.exists():
-            self.btn_check_update.setIcon(QIcon(str(icon_path)))
+        ic = _icon("icons/update.png")
+        if ic:
+            self.btn_check_update.setIcon(ic)
             self.btn_check_update.setIconSize(QSize(18, 18))
         self.btn_check_update.setToolTip("Show latest update notes from GitHub README.")
-        self.btn_check_update.setStyleSheet(self._btn_css)
         self.btn_check_update.clicked.connect(self.check_update_clicked)
-        row_head.addWidget(self.btn_check_update, 0, Qt.AlignRight)
 
         self.btn_donate = QPushButton(" Support Me")
-        icon_path = resource_path("icons/donation.png")
-        if icon_path.exists():
-            self.btn_donate.setIcon(QIcon(str(icon_path)))
+        ic = _icon("icons/donation.png")
+        if ic:
+            self.btn_donate.setIcon(ic)
             self.btn_donate.setIconSize(QSize(18, 18))
-        self.btn_donate.setStyleSheet(self._btn_css)
         self.btn_donate.clicked.connect(self.open_donation)
-        row_head.addWidget(self.btn_donate, 0, Qt.AlignRight)
 
+        _add_widgets(
+            row_head,
+            (self.title, 1),
+            (self.btn_help, 0, Qt.AlignRight),
+            (self.btn_check_update, 0, Qt.AlignRight),
+            (self.btn_donate, 0, Qt.AlignRight),
+        )
         self.left_layout.addLayout(row_head)
 
         self.status = QLabel("Starting...")
@@ -2288,63 +3287,64 @@ class MainWindow(QWidget):
 
         self.btn_refresh = QPushButton("Refresh")
         self.btn_refresh.setToolTip("Check for changes in the current VaM folder and update if needed.")
-        self.btn_refresh.setStyleSheet(self._btn_css)
         self.btn_refresh.clicked.connect(self.refresh_clicked)
-        row_top.addWidget(self.btn_refresh, 1)
 
         self.btn_select = QPushButton("Select VaM Directory")
-        self.btn_select.setStyleSheet(self._btn_css)
         self.btn_select.clicked.connect(self.select_folder)
-        icon_path = resource_path("icons/folder.png")
-        if icon_path.exists():
-            self.btn_select.setIcon(QIcon(str(icon_path)))
+        ic = _icon("icons/folder.png")
+        if ic:
+            self.btn_select.setIcon(ic)
             self.btn_select.setIconSize(QSize(18, 18))
-        row_top.addWidget(self.btn_select, 2)
 
-        ctl_left_lay.addLayout(row_top)
 
         self.btn_restore = QPushButton("Restore Disabled VARs")
-        self.btn_restore.setStyleSheet(self._btn_css)
         self.btn_restore.setEnabled(False)
-        self.btn_restore.clicked.connect(self.restore_offloaded_vars)
-        row_top.addWidget(self.btn_restore, 1)
+        self.btn_restore.clicked.connect(lambda: self.restore_offloaded_vars())
         
         self.btn_apply_now = QPushButton("Update Scene Selection")
+        self.btn_apply_now.setObjectName("applyPulse")
         self.btn_apply_now.setToolTip("Apply your current selection while VaM is running (VaM needs in-game refresh).")
-        self.btn_apply_now.setStyleSheet(self._btn_css)
         self.btn_apply_now.setEnabled(False)
         self.btn_apply_now.clicked.connect(self.apply_selection_now_clicked)
-        row_top.addWidget(self.btn_apply_now, 1)  
+
+        _add_widgets(
+            row_top,
+            (self.btn_refresh, 1),
+            (self.btn_select, 2),
+            (self.btn_restore, 1),
+            (self.btn_apply_now, 1),
+        )
+        ctl_left_lay.addLayout(row_top)
 
         row_launch = QHBoxLayout()
 
-        icon_path = resource_path("icons/playbtn.png")
-        icon_obj = QIcon(str(icon_path)) if icon_path.exists() else None
+        icon_obj = _icon("icons/playbtn.png")
 
         self.btn_launch_vam = QPushButton("  Launch VaM.exe")
         if icon_obj:
             self.btn_launch_vam.setIcon(icon_obj)
             self.btn_launch_vam.setIconSize(QSize(13, 13))
-        self.btn_launch_vam.setStyleSheet(self._btn_css)
         self.btn_launch_vam.clicked.connect(self.launch_vam_exe_lean)
-        row_launch.addWidget(self.btn_launch_vam, 1)
 
         self.btn_launch_vd = QPushButton("  Launch VaM (Virtual Desktop)")
         if icon_obj:
             self.btn_launch_vd.setIcon(icon_obj)
             self.btn_launch_vd.setIconSize(QSize(13, 13))
-        self.btn_launch_vd.setStyleSheet(self._btn_css)
         self.btn_launch_vd.clicked.connect(self.launch_vam_vd_lean)
-        row_launch.addWidget(self.btn_launch_vd, 1)
 
 
         self.btn_launch_launcher = QPushButton("  Launch VaM Launcher")
         if icon_obj:
             self.btn_launch_launcher.setIcon(icon_obj)
             self.btn_launch_launcher.setIconSize(QSize(13, 13))
-        self.btn_launch_launcher.setStyleSheet(self._btn_css)
         self.btn_launch_launcher.clicked.connect(self.launch_vam_launcher_lean)
-        row_launch.addWidget(self.btn_launch_launcher, 1)
+
+        _add_widgets(
+            row_launch,
+            (self.btn_launch_vam, 1),
+            (self.btn_launch_vd, 1),
+            (self.btn_launch_launcher, 1),
+        )
 
         
         
@@ -2355,10 +3355,7 @@ class MainWindow(QWidget):
         self.vline = QFrame()
         self.vline.setFrameShape(QFrame.VLine)
         self.vline.setFrameShadow(QFrame.Sunken)
-        if self._dark:
-            self.vline.setStyleSheet("color: rgba(255,255,255,0.14);")
-        else:
-            self.vline.setStyleSheet("color: rgba(0,0,0,0.18);")
+        self.vline.setStyleSheet(_VLINE_CSS[self._dark])
 
         ctl_right = QWidget()
         ctl_right_lay = QVBoxLayout(ctl_right)
@@ -2370,20 +3367,16 @@ class MainWindow(QWidget):
         self.chk_select_mode.setEnabled(False)
 
         row_preset = QHBoxLayout()
-        self.MAX_PRESETS = 5  
         self.preset_combo = QComboBox()
         self.preset_combo.addItems([f"Scene Selection Preset {i}" for i in range(1, self.MAX_PRESETS + 1)])
         self.preset_combo.setMinimumHeight(32)
-        self.preset_combo.setStyleSheet(self._btn_css)
         row_preset.addWidget(self.preset_combo, 1)
 
         self.btn_save_preset = QPushButton("Save")
-        self.btn_save_preset.setStyleSheet(self._btn_css)
         self.btn_save_preset.clicked.connect(self.save_preset)
         row_preset.addWidget(self.btn_save_preset, 0)
 
         self.btn_load_preset = QPushButton("Load")
-        self.btn_load_preset.setStyleSheet(self._btn_css)
         self.btn_load_preset.clicked.connect(self.load_preset)
         row_preset.addWidget(self.btn_load_preset, 0)
 
@@ -2393,7 +3386,6 @@ class MainWindow(QWidget):
         row_whitelist.setSpacing(8)
         self.btn_whitelist_add = QPushButton("Whitelist VARs")
         self.btn_whitelist_add.setToolTip("Move selected .var files into AddonPackages/Whitelist so they are never disabled.")
-        self.btn_whitelist_add.setStyleSheet(self._btn_css)
         self.btn_whitelist_add.setEnabled(True)
         self.btn_whitelist_add.clicked.connect(self.add_vars_to_whitelist)
         row_whitelist.addWidget(self.btn_whitelist_add, 1)
@@ -2417,9 +3409,7 @@ class MainWindow(QWidget):
             btn.setMinimumHeight(uniform_h)
         self.preset_combo.setMinimumHeight(uniform_h)
 
-        row_controls.addWidget(ctl_left, 3)
-        row_controls.addWidget(self.vline, 0)
-        row_controls.addWidget(ctl_right, 2)
+        _add_widgets(row_controls, (ctl_left, 3), (self.vline, 0), (ctl_right, 2))
 
         self.left_layout.addLayout(row_controls)
 
@@ -2452,7 +3442,7 @@ class MainWindow(QWidget):
         self.search.setPlaceholderText("Search scene name / var name / creator...")
         self.search.setMinimumHeight(32)
         self.search.setEnabled(False)
-        self.search.textChanged.connect(self.apply_filter)
+        self.search.textChanged.connect(lambda _=None: self._search_timer.start())
         row_search.addWidget(self.search, 1)
         self.left_layout.addLayout(row_search)
 
@@ -2463,7 +3453,6 @@ class MainWindow(QWidget):
 
         self.btn_page_prev = QPushButton("Prev")
         self.btn_page_prev.setEnabled(False)
-        self.btn_page_prev.setStyleSheet(self._btn_css)
         self.btn_page_prev.clicked.connect(lambda: self._change_page(-1))
         row_page.addWidget(self.btn_page_prev)
 
@@ -2473,7 +3462,6 @@ class MainWindow(QWidget):
 
         self.btn_page_next = QPushButton("Next")
         self.btn_page_next.setEnabled(False)
-        self.btn_page_next.setStyleSheet(self._btn_css)
         self.btn_page_next.clicked.connect(lambda: self._change_page(1))
         row_page.addWidget(self.btn_page_next)
 
@@ -2495,13 +3483,11 @@ class MainWindow(QWidget):
         self.btn_select_all = QPushButton("Select All (Visible)")
         self.btn_select_all.setEnabled(False)
         self.btn_select_all.clicked.connect(self.select_all_visible)
-        self.btn_select_all.setStyleSheet(self._btn_css)
         header_layout.addWidget(self.btn_select_all)
 
         self.btn_clear_sel = QPushButton("Clear Selection")
         self.btn_clear_sel.setEnabled(False)
         self.btn_clear_sel.clicked.connect(self.clear_selection)
-        self.btn_clear_sel.setStyleSheet(self._btn_css)
         header_layout.addWidget(self.btn_clear_sel)
 
         header_layout.addStretch(1)
@@ -2524,7 +3510,7 @@ class MainWindow(QWidget):
         self.scene_view.setMovement(QListView.Static)
         self.scene_view.setWrapping(True)
         self.scene_view.setFlow(QListView.LeftToRight)
-        self.scene_view.setSpacing(10)
+        self.scene_view.setSpacing(SCENE_GRID_SPACING)
         self.scene_view.setUniformItemSizes(True)
         self.scene_view.setLayoutMode(QListView.Batched)
         self.scene_view.setBatchSize(200)
@@ -2536,7 +3522,10 @@ class MainWindow(QWidget):
         self.scene_view.setModel(self.scene_model)
         self.scene_view.setMouseTracking(True)
         self.scene_view.clicked.connect(self.on_scene_clicked)
-        self.scene_view.viewport().installEventFilter(self)
+        self._scene_viewport = self.scene_view.viewport()
+        self._scene_vscroll = self.scene_view.verticalScrollBar()
+        self._scene_grid_w = 0
+        self._scene_viewport.installEventFilter(self)
         self.scene_view.verticalScrollBar().valueChanged.connect(self._schedule_visible_previews)
 
         self._update_scene_view_grid()
@@ -2563,22 +3552,29 @@ class MainWindow(QWidget):
         self._set_dim_label(self.dep_summary, "#aaa")
         self.right_layout.addWidget(self.dep_summary)
 
-        self.dep_scroll = QScrollArea()
-        self.dep_scroll.setWidgetResizable(True)
-
-        self.dep_container = QWidget()
-        self.dep_list_layout = QVBoxLayout(self.dep_container)
-        self.dep_list_layout.setContentsMargins(10, 10, 10, 10)
-        self.dep_list_layout.setSpacing(6)
-
-        self.dep_scroll.setWidget(self.dep_container)
-        self.right_layout.addWidget(self.dep_scroll, 1)
+        # model/delegate list: rows are painted, only the visible ones
+        self.dep_model = DependencyListModel(self)
+        self.dep_view = QListView()
+        self.dep_view.setUniformItemSizes(False)
+        self.dep_view.setResizeMode(QListView.Adjust)
+        self.dep_view.setWordWrap(True)
+        self.dep_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.dep_view.setSelectionMode(QListView.ExtendedSelection)
+        self.dep_view.setFrameShape(QFrame.NoFrame)
+        self.dep_view.setViewportMargins(10, 10, 10, 10)
+        self.dep_view.setStyleSheet(build_scrollbar_css(self._dark))
+        self.dep_delegate = DependencyDelegate(self.dep_view)
+        self.dep_delegate.dark = self._dark
+        self.dep_view.setItemDelegate(self.dep_delegate)
+        self.dep_view.setModel(self.dep_model)
+        # rows used to be selectable labels; Ctrl+C copies the selected rows' text
+        QShortcut(QKeySequence.Copy, self.dep_view, activated=self._copy_selected_deps)
+        self.right_layout.addWidget(self.dep_view, 1)
 
         right.setMinimumWidth(380)
         right.setMaximumWidth(560)
 
-        root.addWidget(left, 3)
-        root.addWidget(right, 1)
+        _add_widgets(root, (left, 3), (right, 1))
 
         self.setLayout(root)
 
@@ -2613,9 +3609,13 @@ class MainWindow(QWidget):
         current = self.preset_combo.currentIndex()
         self.preset_combo.blockSignals(True)
         try:
+            names = self._preset_names_map()
+            items = [
+                (names.get(self._preset_key(i)) or "").strip() or self._default_preset_name(i)
+                for i in range(1, self.MAX_PRESETS + 1)
+            ]
             self.preset_combo.clear()
-            for i in range(1, self.MAX_PRESETS + 1):
-                self.preset_combo.addItem(self.get_preset_name(i))
+            self.preset_combo.addItems(items)
         finally:
             self.preset_combo.blockSignals(False)
         if 0 <= current < self.preset_combo.count():
@@ -2642,26 +3642,12 @@ class MainWindow(QWidget):
 
 
     def _apply_btn_normal_style(self):
-        self.btn_apply_now.setStyleSheet(self._btn_css)
+        # base look comes from the left panel sheet
+        self.btn_apply_now.setStyleSheet("")
 
     def _apply_btn_attention_style(self, phase: bool):
-        # phase True/False to “pulse”
-        if phase:
-            self.btn_apply_now.setStyleSheet(self._btn_css + """
-                QPushButton {
-                    border: 2px solid rgba(255, 215, 64, 0.95);
-                    background-color: rgba(255, 215, 64, 0.20);
-                    font-weight: 700;
-                }
-            """)
-        else:
-            self.btn_apply_now.setStyleSheet(self._btn_css + """
-                QPushButton {
-                    border: 2px solid rgba(255, 215, 64, 0.55);
-                    background-color: rgba(255, 215, 64, 0.10);
-                    font-weight: 700;
-                }
-            """)
+        # phase True/False to “pulse”; only the delta is set on the button
+        self.btn_apply_now.setStyleSheet(_APPLY_PULSE_ON_CSS if phase else _APPLY_PULSE_OFF_CSS)
 
     def _tick_apply_attention(self):
         self._apply_attention_on = not self._apply_attention_on
@@ -2724,14 +3710,14 @@ class MainWindow(QWidget):
             self._scene_select_glow_timer.stop()
         self.chk_select_mode.setStyleSheet("")
 
-    
-    def _preset_key(self, idx: int) -> str:
-        return f"preset_{idx}"
+
+    def _normalize_preset_cfg(self):
+        # done once at load so preset lookups can index cfg directly
+        for k in ("presets", "preset_names"):
+            if not isinstance(self.cfg.get(k), dict):
+                self.cfg[k] = {}
 
     def _preset_names_map(self) -> dict:
-        self.cfg.setdefault("preset_names", {})
-        if not isinstance(self.cfg["preset_names"], dict):
-            self.cfg["preset_names"] = {}
         return self.cfg["preset_names"]
 
     def _default_preset_name(self, idx: int) -> str:
@@ -2744,11 +3730,14 @@ class MainWindow(QWidget):
         return name if name else self._default_preset_name(idx)
 
     def set_preset_name(self, idx: int, name: str):
+        key = self._preset_key(idx)
+        if not key:
+            return
         names = self._preset_names_map()
         clean = (name or "").strip()
         if not clean:
             clean = self._default_preset_name(idx)
-        names[self._preset_key(idx)] = clean
+        names[key] = clean
         save_config(self.cfg)
 
 
@@ -2760,7 +3749,30 @@ class MainWindow(QWidget):
         if not self.addon_dir:
             return set()
 
-        return {name for (name, _p) in fast_list_vars_all_states(self.addon_dir)}
+        enabled, disabled = self._addon_var_states()
+        return enabled | disabled
+
+    def _protected_vars(self, scan: list[tuple[str, str]] | None = None) -> frozenset[str]:
+        """
+        Assets/plugins are protected by name; kept per AddonPackages listing
+        (same invalidation as _dependency_index) instead of per keep-set pass.
+        scan: a listing the caller just took with _addon_var_files() (skips another stamp walk).
+        """
+        if scan is None:
+            scan = self._addon_var_files()
+        if self._protected_src is not scan:
+            self._protected = frozenset(v for v in (self._addon_enabled | self._addon_disabled) if is_protected_var(v))
+            self._protected_src = scan
+        return self._protected
+
+    def _dependency_index(self, scan: list[tuple[str, str]] | None = None) -> dict[str, list[str]]:
+        # rebuilt whenever _addon_var_files produced a new listing; scan as in _protected_vars
+        if scan is None:
+            scan = self._addon_var_files()
+        if self._dep_index_src is not scan:
+            self._dep_index = build_dependency_index(self._addon_enabled | self._addon_disabled)
+            self._dep_index_src = scan
+        return self._dep_index
 
     # ======================
     # Whitelist helpers
@@ -2784,12 +3796,7 @@ class MainWindow(QWidget):
         p = self._whitelist_dir()
         if not p:
             return False
-        try:
-            pp = path.resolve()
-            wp = p.resolve()
-            return pp == wp or wp in pp.parents
-        except Exception:
-            return False
+        return path_is_under(path, p)
 
     def whitelist_var_names(self) -> set[str]:
         p = self._whitelist_dir()
@@ -2857,11 +3864,7 @@ class MainWindow(QWidget):
             return
 
         whitelisted = set(self.whitelist_var_names())
-        available = set(
-            name for (name, _p) in fast_list_vars_all_states(
-                self.addon_dir, exclude_dir_names={WHITELIST_DIR_NAME}
-            )
-        )
+        available = fast_var_names_all_states(self.addon_dir, exclude_dir_names={WHITELIST_DIR_NAME})
         available -= whitelisted
 
         if not available and not whitelisted:
@@ -2894,6 +3897,7 @@ class MainWindow(QWidget):
                 continue
             try:
                 shutil.move(str(p), str(dst))
+                forget_exists(p, dst)
                 remove_moved += 1
             except Exception:
                 skipped.append(name)
@@ -2918,6 +3922,7 @@ class MainWindow(QWidget):
 
             try:
                 shutil.move(str(p), str(dst))
+                forget_exists(p, dst)
                 add_moved += 1
             except Exception:
                 skipped.append(name)
@@ -2925,11 +3930,10 @@ class MainWindow(QWidget):
         if add_moved or remove_moved:
             self.refresh_clicked()
 
-        msg = f"Whitelisted {add_moved} VAR(s)."
-        msg += f"\nRemoved {remove_moved} VAR(s) from whitelist."
+        lines = [f"Whitelisted {add_moved} VAR(s).", f"Removed {remove_moved} VAR(s) from whitelist."]
         if skipped:
-            msg += f"\n\nSkipped: {len(skipped)}"
-        QMessageBox.information(self, "Whitelist", msg)
+            lines.append(f"\nSkipped: {len(skipped)}")
+        QMessageBox.information(self, "Whitelist", "\n".join(lines))
 
     def add_vars_to_whitelist(self):
         self._open_whitelist_dialog(initial_tab=0)
@@ -2985,7 +3989,11 @@ class MainWindow(QWidget):
     # Presets
     # ======================
     def _preset_key(self, idx: int) -> str:
-        return f"preset_{idx}"
+        # "" when idx is out of range (e.g. empty combo -> currentIndex() -1 -> idx 0),
+        # never a negative index onto another preset
+        if 1 <= idx <= len(self._PRESET_KEYS):
+            return self._PRESET_KEYS[idx - 1]
+        return ""
 
     def save_preset(self):
         if not self.is_selection_mode():
@@ -2993,6 +4001,8 @@ class MainWindow(QWidget):
 
         idx = self.preset_combo.currentIndex() + 1
         key = self._preset_key(idx)
+        if not key:
+            return
 
         # default / current name
         current_name = self.get_preset_name(idx)
@@ -3012,11 +4022,9 @@ class MainWindow(QWidget):
             name = self._default_preset_name(idx)
 
         # save selection
-        self.cfg.setdefault("presets", {})
         self.cfg["presets"][key] = sorted(self.selected_scene_vars)
 
         # save name
-        self.cfg.setdefault("preset_names", {})
         self.cfg["preset_names"][key] = name
 
         self.cfg["last_preset"] = idx
@@ -3034,9 +4042,10 @@ class MainWindow(QWidget):
             return
         idx = self.preset_combo.currentIndex() + 1
         key = self._preset_key(idx)
+        if not key:
+            return
 
-        presets = self.cfg.get("presets", {})
-        items = presets.get(key, [])
+        items = self.cfg["presets"].get(key, [])
         if not items:
             QMessageBox.information(self, "Empty Preset", f"Preset {idx} is empty.\nSave a selection first.")
             return
@@ -3049,12 +4058,8 @@ class MainWindow(QWidget):
 
         self._begin_batch_selection()
         try:
-            # turn off removed
-            for var_name in to_turn_off:
-                self._set_var_selected(var_name, False)
-            # turn on added
-            for var_name in to_turn_on:
-                self._set_var_selected(var_name, True)
+            self._set_vars_selected(to_turn_off, False)
+            self._set_vars_selected(to_turn_on, True)
 
             # update the internal set exactly
             self.selected_scene_vars = new_set
@@ -3082,8 +4087,11 @@ class MainWindow(QWidget):
 
     
     def eventFilter(self, obj, event):
-        if obj == self.scene_view.viewport():
+        if obj is self._scene_viewport:
             et = event.type()
+            # viewport sees every hover move/paint; bail before any branch work
+            if et not in _VIEWPORT_FILTER_EVENTS:
+                return False
 
             if et == QEvent.Resize:
                 self._resize_timer.start()
@@ -3092,16 +4100,15 @@ class MainWindow(QWidget):
             if et == QEvent.MouseButtonPress and event.button() == Qt.MiddleButton:
                 self._drag_scroll_active = True
                 self._drag_scroll_start_pos = event.globalPosition().toPoint()
-                self._drag_scroll_start_value = self.scene_view.verticalScrollBar().value()
+                self._drag_scroll_start_value = self._scene_vscroll.value()
                 obj.setCursor(Qt.ClosedHandCursor)
                 event.accept()
                 return True
 
             if et == QEvent.MouseMove and self._drag_scroll_active:
-                cur = event.globalPosition().toPoint()
-                dy = cur.y() - self._drag_scroll_start_pos.y()
+                dy = event.globalPosition().y() - self._drag_scroll_start_pos.y()
 
-                self.scene_view.verticalScrollBar().setValue(self._drag_scroll_start_value - dy)
+                self._scene_vscroll.setValue(int(self._drag_scroll_start_value - dy))
                 event.accept()
                 return True
 
@@ -3118,17 +4125,17 @@ class MainWindow(QWidget):
     def _update_scene_view_grid(self):
         if not hasattr(self, "scene_delegate"):
             return
-        spacing = self.scene_view.spacing()
-        avail = max(1, self.scene_view.viewport().width())
-        min_card_w = 170
-        cols = max(1, (avail + spacing) // (min_card_w + spacing))
+        spacing = SCENE_GRID_SPACING
+        avail = max(1, self._scene_viewport.width())
+        cols = max(1, (avail + spacing) // (SCENE_MIN_CARD_W + spacing))
         card_w = int((avail - spacing * (cols - 1)) / cols)
 
-        self.scene_delegate.set_card_width(card_w)
-        grid_w = card_w
-        grid_h = self.scene_delegate.card_h
-        self.scene_view.setGridSize(QSize(grid_w, grid_h))
-        self.scene_view.doItemsLayout()
+        # height-only resizes keep the same grid; just top up previews
+        if card_w != self._scene_grid_w:
+            self._scene_grid_w = card_w
+            self.scene_delegate.set_card_width(card_w)
+            self.scene_view.setGridSize(QSize(card_w, self.scene_delegate.card_h))
+            self.scene_view.doItemsLayout()
         self._schedule_visible_previews()
 
     def is_selection_mode(self) -> bool:
@@ -3146,6 +4153,13 @@ class MainWindow(QWidget):
         return self.vam_dir / "VaM_Updater.exe"
     
     def find_running_vd_streamer_path(self) -> Path | None:
+        if psutil is not None:
+            info = _find_process_psutil(VD_STREAMER_EXE, ["name", "exe"])
+            p = (info or {}).get("exe") or ""
+            if not p:
+                return None
+            pp = Path(p)
+            return pp if pp.is_file() else None
         try:
             cmd = [
                 "powershell",
@@ -3167,20 +4181,16 @@ class MainWindow(QWidget):
 
 
     def _is_process_running_windows(self, image_name: str) -> bool:
-        try:
-            out = subprocess.check_output(
-                ["tasklist", "/FI", f"IMAGENAME eq {image_name}"],
-                creationflags=subprocess.CREATE_NO_WINDOW
-            ).decode(errors="ignore").lower()
-            return image_name.lower() in out and "no tasks are running" not in out
-        except Exception:
-            return False
+        return is_process_running(image_name)
         
     def is_vd_streamer_running(self) -> bool:
         """
         Robust check using PowerShell Get-Process.
         Looks for VirtualDesktop.Streamer process by name (no .exe).
+        Uses psutil instead when it is installed.
         """
+        if psutil is not None:
+            return _find_process_psutil(VD_STREAMER_EXE) is not None
         try:
             cmd = [
                 "powershell",
@@ -3215,28 +4225,26 @@ class MainWindow(QWidget):
         if not self._var_path_cache_ready:
             self._refresh_var_path_cache()
         cached = self._var_path_cache.get(var_name)
-        if cached and cached.exists():
+        if cached and cached_exists(cached):
             return cached
         p1 = self._var_enabled_path(var_name)
-        if p1.exists():
+        if cached_exists(p1):
             self._var_path_cache[var_name] = p1
             return p1
         p2 = self._var_disabled_path(var_name)
-        if p2.exists():
+        if cached_exists(p2):
             self._var_path_cache[var_name] = p2
             return p2
         return None
 
-    def _deps_for_var_name(self, var_name: str) -> list[str]:
+    def _deps_for_var_name(self, var_name: str) -> list[str] | frozenset[str]:
         deps = self._var_deps_cache.get(var_name)
         if isinstance(deps, list):
             return [d for d in deps if isinstance(d, str)]
         p = self.get_var_existing_path(var_name)
         if p:
-            info = scan_var_meta_only(p)
-            deps = info.get("dependencies", [])
-            if isinstance(deps, list):
-                return [d for d in deps if isinstance(d, str)]
+            # scanned deps are already a str-only frozenset, shared with the memo
+            return cached_scan_var_meta(p)["dependencies"]
         return []
 
     def _refresh_var_path_cache(self):
@@ -3244,37 +4252,91 @@ class MainWindow(QWidget):
             self._var_path_cache = {}
             self._var_path_cache_ready = False
             return
-        self._var_path_cache = {name: path for (name, path) in fast_list_vars_all_states(self.addon_dir)}
+        self._var_path_cache = {name: Path(fp) for (name, fp) in self._addon_var_files()}
         self._var_path_cache_ready = True
 
+    def _invalidate_addon_scan(self):
+        self._addon_scan_stamp = None
+
+    def _addon_var_files(self) -> list[tuple[str, str]]:
+        """
+        (orig_name, path_str) for every *.var / *.var.disabled under AddonPackages.
+        Reused while no folder under AddonPackages changed mtime (dir_mtime_map
+        stats directories only, so a VAR added/removed/renamed in any subfolder
+        is seen); our own rename passes and Refresh also call _invalidate_addon_scan().
+        """
+        if not self.addon_dir:
+            return []
+        mtimes = dir_mtime_map(self.addon_dir)
+        stamp = (str(self.addon_dir), mtimes) if mtimes else None
+        if stamp is None or stamp != self._addon_scan_stamp:
+            files = _list_var_files(self.addon_dir)
+            enabled: set[str] = set()
+            disabled: set[str] = set()
+            for name, fp in files:
+                (enabled if fp.lower().endswith(".var") else disabled).add(name)
+            self._addon_scan = files
+            self._addon_enabled = enabled
+            self._addon_disabled = disabled
+            self._addon_scan_stamp = stamp
+        return self._addon_scan
+
+    def _warm_scan_has_enabled_var(self, addon: Path) -> bool:
+        # answers from the cached listing only; never triggers a scan
+        stamp = self._addon_scan_stamp
+        if stamp is None or stamp[0] != str(addon):
+            return False
+        if dir_mtime_map(addon) != stamp[1]:
+            return False
+        return bool(self._addon_enabled)
+
+    def _addon_var_states(self) -> tuple[set[str], set[str]]:
+        # (enabled, disabled) orig names; a name can be in both if both files exist
+        self._addon_var_files()
+        return self._addon_enabled, self._addon_disabled
+
+    def _enabled_var_file_count(self) -> int:
+        return sum(1 for (_n, fp) in self._addon_var_files() if fp.lower().endswith(".var"))
+
     def list_var_state_map(self) -> dict[str, str]:
         """
         Returns mapping: { "OrigName.var": "enabled" | "disabled" }
         It normalizes both *.var and *.var.disabled to orig var name.
         """
-        out: dict[str, str] = {}
         if not self.addon_dir:
-            return out
-
-        for orig_name, actual_path in fast_list_vars_all_states(self.addon_dir):
-            if actual_path.name.lower().endswith(".var"):
-                out[orig_name] = "enabled"
-            else:
-                if orig_name not in out:
-                    out[orig_name] = "disabled"
+            return {}
 
-        return out
+        # rebuilt only when _addon_var_files produced a new listing (renames and
+        # Refresh invalidate it); callers must not mutate the returned dict
+        scan = self._addon_var_files()
+        if self._state_map_src is not scan:
+            enabled, disabled = self._addon_var_states()
+            out = dict.fromkeys(disabled, "disabled")
+            out.update(dict.fromkeys(enabled, "enabled"))
+            self._state_map = out
+            self._state_map_src = scan
+        return self._state_map
 
     def all_var_names_catalog(self) -> set[str]:
         """
         Catalog of VAR names we know about from scene scan UI.
         This does NOT depend on current file extension (.var vs .disabled).
         """
-        return {e.get("var_name", "") for e in self.scene_entries if e.get("source") == "var" and e.get("var_name")}
+        return {v for e in self.scene_entries if e.get("source") == "var" and (v := e.get("var_name"))}
 
 
-    def is_vam_running(self) -> bool:
-        return self._is_process_running_windows("VaM.exe")
+    def is_vam_running(self, max_age: float = VAM_STATE_TTL) -> bool:
+        """
+        Process probe with a short TTL: selection clicks and button refreshes
+        reuse a recent answer (also fed by VamStateWorker). max_age=0 forces a probe.
+        """
+        cached = self._vam_running_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < max_age:
+            return cached[1]
+        running = self._is_process_running_windows(VAM_EXE)
+        self._vam_running_cache = (now, running)
+        return running
 
     # ======================
     # Update checker (GitHub)
@@ -3288,16 +4350,39 @@ class MainWindow(QWidget):
     def _is_newer(self, latest: str, current: str) -> bool:
         return self._parse_version_tuple(latest) > self._parse_version_tuple(current)
 
-    def _http_get_json(self, url: str, timeout: int = 10) -> dict:
+    def _http_get_bytes(self, url: str, timeout: int = 10) -> bytes:
+        # bounded read: a README/JSON endpoint never needs more than HTTP_MAX_BYTES
+        import urllib.request
         req = urllib.request.Request(url, headers={"User-Agent": f"VSC/{APP_VERSION}"})
         with urllib.request.urlopen(req, timeout=timeout, context=self._ssl_context()) as resp:
-            data = resp.read().decode("utf-8", errors="ignore")
-        return json.loads(data)
+            return resp.read(HTTP_MAX_BYTES)
+
+    def _http_get_json(self, url: str, timeout: int = 10) -> dict:
+        # parsed straight from the response bytes, no intermediate str
+        return _json_loads(self._http_get_bytes(url, timeout))
 
     def _http_get_text(self, url: str, timeout: int = 10) -> str:
-        req = urllib.request.Request(url, headers={"User-Agent": f"VSC/{APP_VERSION}"})
-        with urllib.request.urlopen(req, timeout=timeout, context=self._ssl_context()) as resp:
-            return resp.read().decode("utf-8", errors="ignore")
+        return self._http_get_bytes(url, timeout).decode("utf-8", errors="ignore")
+
+    def _http_get_text_conditional(self, url: str, etag: str = "", timeout: int = 10) -> tuple[str | None, str]:
+        """
+        GET with If-None-Match. Returns (text, etag); text is None on 304 Not Modified.
+        """
+        import urllib.request
+        import urllib.error
+        headers = {"User-Agent": f"VSC/{APP_VERSION}"}
+        if etag:
+            headers["If-None-Match"] = etag
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout, context=self._ssl_context()) as resp:
+                data = resp.read(HTTP_MAX_BYTES)
+                new_etag = resp.headers.get("ETag", "") or ""
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None, etag
+            raise
+        return data.decode("utf-8", errors="ignore"), new_etag
 
     def _extract_latest_update(self, readme_text: str) -> str:
         lines = (readme_text or "").splitlines()
@@ -3334,33 +4419,61 @@ class MainWindow(QWidget):
     def _current_exe_path(self) -> Path:
         return Path(sys.executable).resolve()
 
-    def _ssl_context(self) -> ssl.SSLContext:
+    def _ssl_context(self):
+        import ssl
+        try:
+            import certifi
+        except Exception:
+            certifi = None
         if certifi:
             return ssl.create_default_context(cafile=certifi.where())
         return ssl.create_default_context()
 
-    def check_update_clicked(self):
-        try:
-            if self._startup_in_progress or self._refresh_in_progress:
-                QMessageBox.information(self, "Busy", "Please wait for current loading/refresh to finish.")
-                return
-
-            self.loading.start("Checking Update", "Please wait...")
-
-            readme_text = self._http_get_text(GITHUB_README_URL)
-            notes = self._extract_latest_update(readme_text)
-            self.loading.stop()
+    def _submit_io(self, on_done, fn, *args):
+        """
+        Run fn(*args) on the IO pool; on_done(future) is called on the GUI thread.
+        """
+        fut = self._io_pool.submit(fn, *args)
+        fut.add_done_callback(lambda f: self._io_done.emit(on_done, f))
+        return fut
 
-            if not notes:
-                QMessageBox.information(self, "Update", "Could not read update notes from README.")
-                return
+    def check_update_clicked(self):
+        if self._startup_in_progress or self._refresh_in_progress:
+            QMessageBox.information(self, "Busy", "Please wait for current loading/refresh to finish.")
+            return
 
-            dlg = UpdateNotesDialog(notes, self)
-            dlg.exec()
+        self.loading.start("Checking Update", "Please wait...")
+        self.btn_check_update.setEnabled(False)
+        # revalidate against the last README we parsed; unchanged -> 304, no body
+        etag = self.cfg.get("update_etag", "") if self.cfg.get("update_notes") else ""
+        self._submit_io(self._check_update_done, self._http_get_text_conditional, GITHUB_README_URL, etag)
 
+    def _check_update_done(self, fut):
+        if fut.cancelled():  # window closing
+            return
+        self.loading.stop()
+        self.refresh_refresh_button()
+        try:
+            text, etag = fut.result()
         except Exception as e:
-            self.loading.stop()
             QMessageBox.warning(self, "Update", f"Update check failed:\n{e}")
+            return
+
+        if text is None:
+            notes = str(self.cfg.get("update_notes", ""))
+        else:
+            notes = self._extract_latest_update(text)
+            if etag and notes:
+                self.cfg["update_etag"] = etag
+                self.cfg["update_notes"] = notes
+                save_config(self.cfg)
+
+        if not notes:
+            QMessageBox.information(self, "Update", "Could not read update notes from README.")
+            return
+
+        dlg = UpdateNotesDialog(notes, self)
+        dlg.exec()
 
 
     # ======================
@@ -3371,54 +4484,66 @@ class MainWindow(QWidget):
         if not p:
             return None
         pp = Path(p)
-        return pp if pp.exists() else None
+        return pp if cached_exists(pp) else None
 
     def refresh_refresh_button(self):
         enabled = (self.vam_dir is not None) or (self.last_vam_dir() is not None)
-        if self._startup_in_progress or self._refresh_in_progress:
+        if self._startup_in_progress or self._refresh_in_progress or self._renames_running():
             enabled = False
         self.btn_refresh.setEnabled(enabled)
         self.btn_check_update.setEnabled(not (self._startup_in_progress or self._refresh_in_progress))
 
     def validate_vam_folder(self, folder: Path) -> tuple[bool, str]:
-        if not folder.exists() or not folder.is_dir():
+        if not folder.is_dir():
             return False, "Folder does not exist."
 
         vam_exe = folder / "VaM.exe"
-        if not vam_exe.exists():
+        if not cached_exists(vam_exe):
             return False, "VaM.exe not found in this folder.\nPlease select the VaM directory where VaM.exe is located."
 
         addon = folder / "AddonPackages"
-        if not addon.exists() or not addon.is_dir():
+        if not addon.is_dir():
             return False, "AddonPackages folder not found inside this VaM directory."
 
-        var_count = len(fast_list_vars(addon))
-        if var_count == 0:
+        if not (self._warm_scan_has_enabled_var(addon) or has_any_var_file(addon)):
             return False, "No .var files found in AddonPackages.\nMake sure this is the correct VaM folder."
 
         return True, ""
 
     def _load_scene_cache(self) -> dict:
-        p = cache_path()
-        if not p.exists():
-            return {}
+        """
+        Startup/refresh paths load the cache several times in a row; reparse only
+        when the file changed on disk. Callers get a shallow copy, so top-level
+        assignments (e.g. cache_obj["looks"] = ...) don't leak into the memo.
+        """
         try:
-            return json.loads(p.read_text(encoding="utf-8"))
-        except Exception:
+            st = os.stat(cache_path())
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            self._cache_memo = None
             return {}
-
-    def _save_scene_cache(self, cache_obj: dict):
-        try:
-            cache_path().write_text(
-                json.dumps(cache_obj, separators=(",", ":"), ensure_ascii=True),
-                encoding="utf-8",
-            )
-        except Exception:
-            pass
+        memo = self._cache_memo
+        if memo is not None and memo[0] == stamp:
+            return dict(memo[1])
+        obj = read_scene_cache()
+        self._cache_memo = (stamp, obj) if obj else None
+        return dict(obj)
 
     def _start_cache_save(self, cache_obj: dict):
-        self._cache_save_worker = CacheSaveWorker(cache_obj)
-        self._cache_save_worker.start()
+        """
+        Write the scene cache on the cache thread. Once written, the memo is
+        pointed at cache_obj so the next _load_scene_cache doesn't reparse it.
+        """
+        self._cache_memo = None
+        fut = self._cache_io.submit(write_scene_cache, cache_obj)
+        fut.add_done_callback(
+            lambda f: self._io_done.emit(lambda f2: self._cache_saved(f2, cache_obj), f)
+        )
+
+    def _cache_saved(self, fut, cache_obj: dict):
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        self._cache_memo = (fut.result(), cache_obj)
 
     def _set_var_path_cache_from_cache(self, cache_obj: dict):
         if not self.addon_dir or not isinstance(cache_obj, dict):
@@ -3443,7 +4568,7 @@ class MainWindow(QWidget):
             for name, deps in deps_map.items():
                 if not isinstance(name, str) or not isinstance(deps, list):
                     continue
-                self._var_deps_cache[name] = [d for d in deps if isinstance(d, str)]
+                self._var_deps_cache[sys.intern(name)] = [sys.intern(d) for d in deps if isinstance(d, str)]
             return
 
         vars_map = cache_obj.get("vars")
@@ -3455,12 +4580,16 @@ class MainWindow(QWidget):
             deps = info.get("dependencies", [])
             if not isinstance(deps, list):
                 continue
-            self._var_deps_cache[name] = [d for d in deps if isinstance(d, str)]
+            self._var_deps_cache[sys.intern(name)] = [sys.intern(d) for d in deps if isinstance(d, str)]
 
     # ======================
     # Refresh behavior
     # ======================
     def refresh_clicked(self):
+        if self._warn_if_renaming():
+            return
+        self._last_applied = None
+        self._keep_memo = None
         target = self.vam_dir or self.last_vam_dir()
         if not target:
             QMessageBox.information(self, "No folder", "No VaM folder selected yet.\nClick 'Select VaM Directory' first.")
@@ -3481,6 +4610,7 @@ class MainWindow(QWidget):
         self._refresh_in_progress = True
         self.refresh_refresh_button()
         self.loading.start("Refreshing", "Checking for changes...")
+        self._invalidate_addon_scan()
 
         cache_obj = self._load_scene_cache()
         if self._can_use_cache_for_current_folder(cache_obj):
@@ -3490,11 +4620,10 @@ class MainWindow(QWidget):
                 self._update_scene_entries_looks()
                 self.total_scene_files_found = len(self.scene_entries)
                 try:
-                    self.total_vars_count = len(fast_list_vars(self.addon_dir)) if self.addon_dir else 0
+                    self.total_vars_count = self._enabled_var_file_count()
                 except Exception:
                     self.total_vars_count = 0
 
-                self.populate_scene_cards_from_entries()
                 self.apply_filter(self.search.text())
                 self.update_selection_ui()
 
@@ -3509,7 +4638,7 @@ class MainWindow(QWidget):
             self.chk_select_mode.setEnabled(True)
             self.chk_selected_only.setEnabled(self.is_selection_mode())
 
-        self._start_change_check(cache_obj)
+        self._start_change_check(cache_obj, full_check=True)
 
     # ======================
     # Startup cache-first
@@ -3544,7 +4673,7 @@ class MainWindow(QWidget):
             self.total_scene_files_found = len(self.scene_entries)
 
             try:
-                self.total_vars_count = len(fast_list_vars(self.addon_dir)) if self.addon_dir else 0
+                self.total_vars_count = self._enabled_var_file_count()
             except Exception:
                 self.total_vars_count = 0
 
@@ -3559,7 +4688,6 @@ class MainWindow(QWidget):
             self.chk_select_mode.setEnabled(True)
             self.chk_selected_only.setEnabled(self.is_selection_mode())
 
-            self.populate_scene_cards_from_entries()
             self.apply_filter(self.search.text())
             self.update_selection_ui()
 
@@ -3610,16 +4738,7 @@ class MainWindow(QWidget):
                     if not isinstance(s, dict):
                         continue
 
-                    out.append({
-                        "source": "var",
-                        "scene_name": s.get("scene_name", ""),
-                        "var_name": var_name,
-                        "preview_relpath": s.get("preview_relpath", ""),
-                        "preview_inner": s.get("preview_inner", ""),  
-                        "scene_path": s.get("scene_path", ""),  
-                        "loose_relpath": "",
-                        "is_girl_looks": s.get("is_girl_looks", None),
-                    })
+                    out.append(_var_scene_entry(var_name, s))
 
 
         # --- loose scenes (Saves/scene on disk) ---
@@ -3630,40 +4749,30 @@ class MainWindow(QWidget):
 
                 scene_name = (linfo.get("scene_name") or relp) or ""
 
-                out.append({
-                    "source": "loose",
-                    "scene_name": scene_name,
-                    "var_name": "(Saves/scene)",
-                    "preview_relpath": "",
-                    "preview_inner": "",  # loose scenes don't have a var zip preview path
-                    "scene_path": "",
-                    "loose_relpath": relp,
-                    "is_girl_looks": None,
-                })
-
-        out.sort(
-            key=lambda e: (
-                str(e.get("source", "")),
-                str(e.get("var_name", "")),
-                str(e.get("scene_name", "")).lower()
-            )
-        )
+                out.append(_loose_scene_entry(relp, scene_name))
+
+        out.sort(key=scene_entry_sort_key)
         return out
 
-    def _start_change_check(self, cache_obj: dict):
+    def _start_change_check(self, cache_obj: dict, full_check: bool = False):
         if not self.addon_dir:
             self._end_busy()
             return
-        self.change_worker = ChangeCheckWorker(self.addon_dir, self.saves_scene_dir, cache_obj)
+        self.change_worker = ChangeCheckWorker(self.addon_dir, self.saves_scene_dir, cache_obj, full_check)
         self.change_worker.finished.connect(self._on_change_check_done)
         self.change_worker.start()
 
-    def _on_change_check_done(self, needs_rescan: bool):
+    def _on_change_check_done(self, needs_rescan: bool, dir_mtimes=None):
         if not self.vam_dir or not self.addon_dir:
             self._end_busy()
             return
 
         if not needs_rescan:
+            if dir_mtimes:
+                cache_obj = self._load_scene_cache()
+                if str(cache_obj.get("addon_dir")) == str(self.addon_dir):
+                    cache_obj["dir_mtimes"] = dir_mtimes
+                    self._start_cache_save(cache_obj)
             self.status.setText(f"VaM Directory:\n{self.vam_dir}")
             self._end_busy()
             return
@@ -3688,7 +4797,7 @@ class MainWindow(QWidget):
     def _start_unused_count_worker(self):
         if not self.addon_dir:
             return
-        scene_vars = {e["var_name"] for e in self.scene_entries if e.get("source") == "var" and e.get("var_name")}
+        scene_vars = self.all_var_names_catalog()
         self._unused_req_id += 1
         req_id = self._unused_req_id
 
@@ -3696,7 +4805,9 @@ class MainWindow(QWidget):
             f"Total VARs: {self.total_vars_count} | Scenes: {self.total_scene_files_found}"
         )
 
-        self._unused_worker = UnusedCountWorker(self.addon_dir, scene_vars, self._var_deps_cache)
+        self._unused_worker = UnusedCountWorker(
+            self.addon_dir, scene_vars, self._var_deps_cache, var_files=self._addon_var_files()
+        )
         self._unused_worker.finished.connect(lambda count, rid=req_id: self._unused_count_done(count, rid))
         self._unused_worker.start()
 
@@ -3712,6 +4823,8 @@ class MainWindow(QWidget):
     # Folder selection
     # ======================
     def select_folder(self):
+        if self._warn_if_renaming():
+            return
         folder = QFileDialog.getExistingDirectory(self, "Select VaM Directory (where VaM.exe is)")
         if not folder:
             return
@@ -3796,7 +4909,6 @@ class MainWindow(QWidget):
         self.chk_select_mode.setEnabled(True)
         self.chk_selected_only.setEnabled(self.is_selection_mode())
 
-        self.populate_scene_cards_from_entries()
         self.apply_filter(self.search.text())
         self.update_selection_ui()
 
@@ -3819,6 +4931,12 @@ class MainWindow(QWidget):
         self._preview_cached_rows.clear()
         self._visible_rows_cache.clear()
         self._stop_preload_all_previews()
+        # thumbnails carried over by set_entries count against the cache limit again
+        carried = self.scene_model.rows_with_preview()
+        if carried:
+            self._preview_cached_rows.update(carried)
+            self._preview_cache_order.extend(carried)
+            self._trim_preview_cache()
         self._schedule_visible_previews()
 
     def _stop_all_preview_loaders(self):
@@ -4184,17 +5302,8 @@ class MainWindow(QWidget):
             return False
 
     
-    def populate_scene_cards_from_entries(self):
-        self.scene_entries = sorted(
-            self.scene_entries,
-            key=lambda e: (
-                str(e.get("source", "")),
-                str(e.get("var_name", "")),
-                str(e.get("scene_name", "")).lower()
-            )
-        )
-
     def clear_scene_cards(self):
+        self._page_entries = []
         self.scene_model.set_entries([])
         self._preview_gen += 1
         self._preview_pending.clear()
@@ -4208,33 +5317,68 @@ class MainWindow(QWidget):
         self._apply_filter_and_pagination(text)
         self._schedule_visible_previews()
 
+    def _on_search_settled(self):
+        # typing back to the query already shown changes nothing
+        text = self.search.text()
+        if (text or "").strip().lower() == self._last_filter_q:
+            return
+        self.apply_filter(text)
+
+    def _scene_search_keys(self) -> list[str]:
+        entries = self.scene_entries
+        if self._search_keys_src is not entries:
+            # a search query never contains a newline, so one substring test covers both names
+            self._search_keys = [
+                f"{e.get('scene_name', '')}\n{e.get('var_name', '')}".lower() for e in entries
+            ]
+            self._search_keys_src = entries
+        return self._search_keys
+
+    def _scene_looks_mask(self) -> bytearray:
+        # precomputed "looks only" test per scene entry: toggling it is one byte read per row
+        entries = self.scene_entries
+        if self._looks_mask_src is not entries:
+            self._looks_mask = bytearray(
+                1 if (e.get("source", "var") == "var" and e.get("is_girl_looks")) else 0 for e in entries
+            )
+            self._looks_mask_src = entries
+        return self._looks_mask
+
     def _apply_filter_and_pagination(self, text: str):
         q = (text or "").strip().lower()
         looks_only = self.chk_girl_looks_only.isChecked()
         selected_only = self.chk_selected_only.isChecked()
+        self._last_filter_q = q
 
         self._stop_preload_all_previews()
 
-        filtered: list[dict] = []
-        for e in self.scene_entries:
-            scene_name = str(e.get("scene_name", ""))
-            var_name = str(e.get("var_name", ""))
-            if q:
-                if q not in scene_name.lower() and q not in var_name.lower():
-                    continue
-            if looks_only:
-                if e.get("source", "var") != "var":
-                    continue
-                looks_val = e.get("is_girl_looks")
-                if looks_val is None or not bool(looks_val):
-                    continue
-            if selected_only:
-                if e.get("source", "var") != "var":
-                    continue
-                vname = str(e.get("var_name", ""))
-                if not vname or (vname not in self.selected_scene_vars):
-                    continue
-            filtered.append(e)
+        entries = self.scene_entries
+        keys = self._scene_search_keys()
+        looks = self._scene_looks_mask() if looks_only else None
+        selected = self.selected_scene_vars
+        plain = not (looks_only or selected_only)
+
+        # typing more characters can only narrow a plain text search: rescan the
+        # previous matches (indexes into scene_entries) instead of every entry
+        prev = self._filter_idx_src
+        if plain and q and prev is not None and prev[0] is entries and q.startswith(prev[1]):
+            candidates = self._filtered_idx
+        else:
+            candidates = range(len(entries))
+
+        # one combined predicate per entry; the toggles are loop invariants
+        idx = [
+            i
+            for i in candidates
+            if (not q or q in keys[i])
+            and (plain or entries[i].get("source", "var") == "var")
+            and (looks is None or looks[i])
+            and (not selected_only or entries[i].get("var_name") in selected)
+        ]
+        self._filtered_idx = idx
+        # looks/selected results depend on state that changes in place; only plain searches are reused
+        self._filter_idx_src = (entries, q) if plain else None
+        filtered: list[dict] = [entries[i] for i in idx]
 
         self._filtered_entries = filtered
         total = len(filtered)
@@ -4253,28 +5397,46 @@ class MainWindow(QWidget):
             self._total_pages = 1
             page_entries = filtered
 
-        self.scene_model.set_entries(page_entries)
+        # same rows as already shown (e.g. a toggle that filters nothing out):
+        # keep the model, its scroll position and preview state as they are
+        shown = self._page_entries
+        same_rows = len(shown) == len(page_entries) and all(a is b for a, b in zip(shown, page_entries))
+        if same_rows:
+            self.scene_model.set_selected_for_vars(self.scene_model.var_names() - selected, False)
+        else:
+            self._page_entries = page_entries
+            self.scene_model.set_entries(page_entries)
         self.scene_model.set_selection_mode(self.is_selection_mode())
         self.scene_model.set_looks_map(self.looks_map)
-        for var_name in self.selected_scene_vars:
-            self.scene_model.set_selected_for_var(var_name, True)
+        self.scene_model.set_selected_for_vars(selected, True)
 
-        self._start_lazy_preview_loader()
+        if not same_rows:
+            self._start_lazy_preview_loader()
         if self._auto_preload_previews:
             self._start_preload_all_previews()
 
         self._update_page_controls()
         self.update_selection_ui()
 
+    def _scene_looks_keys(self) -> list[str]:
+        # "var::scene" per scene entry ("" for loose scenes), rebuilt when scene_entries is replaced
+        entries = self.scene_entries
+        if self._looks_keys_src is not entries:
+            self._looks_keys = [
+                f"{e.get('var_name', '')}::{e.get('scene_name', '')}" if e.get("source", "var") == "var" else ""
+                for e in entries
+            ]
+            self._looks_keys_src = entries
+        return self._looks_keys
+
     def _update_scene_entries_looks(self):
-        if not self.looks_map:
+        looks_map = self.looks_map
+        if not looks_map:
             return
-        for e in self.scene_entries:
-            if e.get("source", "var") != "var":
-                continue
-            k = f"{e.get('var_name', '')}::{e.get('scene_name', '')}"
-            if k in self.looks_map:
-                e["is_girl_looks"] = bool(self.looks_map.get(k, False))
+        for e, k in zip(self.scene_entries, self._scene_looks_keys()):
+            if k and k in looks_map:
+                e["is_girl_looks"] = bool(looks_map[k])
+        self._looks_mask_src = None
 
     def _update_page_controls(self):
         if not self.use_pagination:
@@ -4308,10 +5470,8 @@ class MainWindow(QWidget):
         pairs: list[tuple[str, str, str]] = []
         for row in range(self.scene_model.rowCount()):
             item = self.scene_model.get_item(row)
-            if item.get("source", "var") != "var":
-                continue
-            k = f"{item.get('var_name', '')}::{item.get('scene_name', '')}"
-            if k not in self.looks_map:
+            k = item["looks_key"]
+            if k and k not in self.looks_map:
                 pairs.append((
                     item.get("var_name", ""),
                     item.get("scene_name", ""),
@@ -4346,7 +5506,7 @@ class MainWindow(QWidget):
             old = self._load_scene_cache()
             if isinstance(old, dict):
                 old["looks"] = self.looks_map
-                self._save_scene_cache(old)
+                self._start_cache_save(old)
 
         self.chk_girl_looks_only.setEnabled(True)
         self.apply_filter(self.search.text())
@@ -4369,13 +5529,16 @@ class MainWindow(QWidget):
 
     def _check_selection_dirty(self):
    
-        if not (self.is_vam_running() or self.lean_active):
+        # lean_active first: it's a flag, is_vam_running() probes the process list
+        if not (self.lean_active or self.is_vam_running()):
             self.selection_dirty = False
             self.set_apply_attention(False)
             return
 
-        current = set(self._scene_vars_for_launch())
-        dirty = (current != set(self.session_baseline_scene_vars))
+        # same set as _scene_vars_for_launch(), without the defensive copies;
+        # the baseline is a frozenset so it's compared as-is
+        current = self.selected_scene_vars or self.all_var_names_catalog()
+        dirty = (current != self.session_baseline_scene_vars)
 
         if dirty != self.selection_dirty:
             self.selection_dirty = dirty
@@ -4411,6 +5574,28 @@ class MainWindow(QWidget):
 
 
 
+    def _set_vars_selected(self, var_names: set[str], selected: bool):
+        """
+        Batch form of _set_var_selected for sets of vars (presets).
+        Caller wraps it in _begin/_end_batch_selection for the UI refresh.
+        """
+        if self._syncing_selection_ui:
+            return
+        if selected:
+            changed = var_names - self.selected_scene_vars
+            self.selected_scene_vars |= changed
+        else:
+            changed = var_names & self.selected_scene_vars
+            self.selected_scene_vars -= changed
+        if not changed:
+            return
+
+        self._syncing_selection_ui = True
+        try:
+            self.scene_model.set_selected_for_vars(changed, selected)
+        finally:
+            self._syncing_selection_ui = False
+
     def update_selection_ui(self):
         self.total_scene_label.setText(f"Total Scene: {self.total_scene_files_found} scenes")
         self.selection_info.setText(f"Selected Scene: {len(self.selected_scene_vars)} scenes")
@@ -4436,16 +5621,8 @@ class MainWindow(QWidget):
 
         self._begin_batch_selection()
         try:
-            visible_vars: set[str] = set()
-            for row in range(self.scene_model.rowCount()):
-                item = self.scene_model.get_item(row)
-                if item.get("source") != "var":
-                    continue
-                vname = item.get("var_name") or ""
-                if vname:
-                    visible_vars.add(vname)
-            for var_name in visible_vars:
-                self._set_var_selected(var_name, True)
+            # the model already indexes its var rows by name
+            self._set_vars_selected(self.scene_model.var_names(), True)
         finally:
             self._end_batch_selection()
 
@@ -4456,8 +5633,7 @@ class MainWindow(QWidget):
 
         self._begin_batch_selection()
         try:
-            for var_name in list(self.selected_scene_vars):
-                self._set_var_selected(var_name, False)
+            self._set_vars_selected(set(self.selected_scene_vars), False)
         finally:
             self._end_batch_selection()
         self.apply_filter(self.search.text())
@@ -4494,7 +5670,12 @@ class MainWindow(QWidget):
             self._stop_all_preview_loaders()
         except Exception:
             pass
-        for tname in ("worker", "change_worker", "looks_worker", "_unused_worker"):
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        if self._scan_pool is not None:
+            self._scan_pool.shutdown(wait=False, cancel_futures=True)
+        # let a queued cache write finish; a half-applied cache costs a full rescan
+        self._cache_io.shutdown(wait=True)
+        for tname in ("worker", "change_worker", "looks_worker", "_unused_worker", "vam_state_worker", "rename_worker"):
             t = getattr(self, tname, None)
             if t is None:
                 continue
@@ -4509,33 +5690,37 @@ class MainWindow(QWidget):
             self._preload_timer.stop()
         if hasattr(self, "_preview_schedule_timer") and self._preview_schedule_timer.isActive():
             self._preview_schedule_timer.stop()
-        if hasattr(self, "poll_timer") and self.poll_timer.isActive():
-            self.poll_timer.stop()
         super().closeEvent(event)
 
     # ======================
     # Dependencies panel
     # ======================
+    def _clear_dep_list(self):
+        self.dep_model.set_rows([])
+
+    def _show_dep_message(self, text: str):
+        self.dep_model.set_rows([(text, None)])
+
+    def _show_dep_rows(self, rows: list[tuple[str, bool]]):
+        self.dep_model.set_rows(rows)
+
+    def _copy_selected_deps(self):
+        rows = sorted(i.row() for i in self.dep_view.selectedIndexes())
+        if rows:
+            QApplication.clipboard().setText(
+                "\n".join(self.dep_model.index(r, 0).data() or "" for r in rows)
+            )
+
     def clear_dependencies_panel(self):
         self.dep_selected.setText("Click a card to see dependencies.")
         self.dep_summary.setText("")
-        while self.dep_list_layout.count():
-            item = self.dep_list_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+        self._clear_dep_list()
 
     def show_loose_scene_info(self, item: dict):
         relp = item.get("loose_relpath", "")
         self.dep_selected.setText(f"Selected (Saves/scene):\n{relp}")
         self.dep_summary.setText("Loose scene: dependency graph not available in this app.")
-        while self.dep_list_layout.count():
-            item = self.dep_list_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-        self.dep_list_layout.addWidget(QLabel("—"))
-        self.dep_list_layout.addStretch(1)
+        self._show_dep_message("—")
 
     def show_dependencies(self, scene_name: str, var_name: str):
         if not self.addon_dir:
@@ -4547,53 +5732,49 @@ class MainWindow(QWidget):
         if not var_path:
     
             self.dep_summary.setText("VAR file not found on disk (enabled/disabled).")
-            while self.dep_list_layout.count():
-                item = self.dep_list_layout.takeAt(0)
-                w = item.widget()
-                if w:
-                    w.deleteLater()
-            self.dep_list_layout.addWidget(QLabel("(missing on disk)"))
-            self.dep_list_layout.addStretch(1)
+            self._show_dep_message("(missing on disk)")
             return
 
-        info = scan_var_meta_only(var_path)
-        deps = sorted(info.get("dependencies", []))
-
-        all_vars = set(self.list_var_state_map().keys())
+        info = cached_scan_var_meta(var_path)
+        deps = sorted(info["dependencies"])
 
-        while self.dep_list_layout.count():
-            item = self.dep_list_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+        state_map = self.list_var_state_map()
+        # keys view: O(1) membership for resolve_dependency without copying N names per click
+        all_vars = state_map.keys()
 
         if not deps:
             self.dep_summary.setText("No dependencies found in meta.json")
-            self.dep_list_layout.addWidget(QLabel("—"))
+            self._show_dep_message("—")
             return
 
+        rows, present_count, missing_count = self._dep_rows(deps, all_vars, state_map)
+        self._show_dep_rows(rows)
+        self.dep_summary.setText(f"Total: {len(deps)} | Present: {present_count} | Missing: {missing_count}")
+
+    def _dep_rows(self, deps: list[str], all_vars, state_map: dict[str, str]) -> tuple[list[tuple[str, bool]], int, int]:
+        rows: list[tuple[str, bool]] = []
         present_count = 0
         missing_count = 0
+        index = self._dependency_index()
 
         for dep in deps:
-            matched = resolve_dependency(dep, all_vars)
+            matched = resolve_dependency(dep, all_vars, index)
             present = len(matched) > 0
 
             if present:
                 present_count += 1
-                chosen = sorted(matched)[-1]
+                chosen = max(matched, key=var_version_key)
 
-                state = self.list_var_state_map().get(chosen, "")
+                state = state_map.get(chosen, "")
                 suffix = " (disabled)" if state == "disabled" else ""
                 text = f"{dep}  →  {chosen}{suffix}"
             else:
                 missing_count += 1
                 text = f"{dep}  →  (missing)"
 
-            self.dep_list_layout.addWidget(DependencyRow(text=text, present=present, dark=self._dark))
+            rows.append((text, present))
 
-        self.dep_list_layout.addStretch(1)
-        self.dep_summary.setText(f"Total: {len(deps)} | Present: {present_count} | Missing: {missing_count}")
+        return rows, present_count, missing_count
 
 
     # ======================
@@ -4605,50 +5786,86 @@ class MainWindow(QWidget):
             self.refresh_whitelist_buttons()
             return
         mp = manifest_path_for(self.vam_dir)
-        self.btn_restore.setEnabled(mp.exists())
+        self.btn_restore.setEnabled(mp.exists() and not self._renames_running())
         self.refresh_whitelist_buttons()
 
-    def refresh_apply_button(self):
+    def refresh_apply_button(self, running: bool | None = None):
         """
         Apply button becomes useful if:
         - VaM is running (user wants live apply), OR
         - a manifest exists (lean session active), OR
         - we have a folder selected (we can start live mode even if VaM already running)
+        running: already-probed VaM state (from VamStateWorker), else probed here.
         """
         if not self.vam_dir:
             self.btn_apply_now.setEnabled(False)
             return
+        if self._renames_running():
+            self.btn_apply_now.setEnabled(False)
+            return
         mp_exists = manifest_path_for(self.vam_dir).exists()
-        running = self.is_vam_running()
+        if running is None:
+            running = self.is_vam_running()
         self.btn_apply_now.setEnabled(running or mp_exists)
 
     def _read_manifest(self) -> dict:
+        """
+        Manifest (journal replayed) as last written/read, reparsed only when
+        the manifest or its journal changed (mtime_ns, size). Treat the result
+        as read-only.
+        """
         if not self.vam_dir:
             return {}
         mp = manifest_path_for(self.vam_dir)
-        if not mp.exists():
+        st = manifest_stamp(mp)
+        if st is None:
+            self._manifest_memo = None
             return {}
+        stamp = (os.fspath(mp),) + st
+        memo = self._manifest_memo
+        if memo is not None and memo[0] == stamp:
+            return memo[1]
         try:
-            return json.loads(mp.read_text(encoding="utf-8"))
+            manifest = read_manifest_file(mp)
         except Exception:
             return {}
+        self._manifest_memo = (stamp, manifest)
+        return manifest
+
+    def _remember_manifest(self, mp: Path, manifest: dict):
+        # just written by us: the next _read_manifest can skip the parse
+        st = manifest_stamp(mp)
+        if st is None:
+            self._manifest_memo = None
+            return
+        self._manifest_memo = ((os.fspath(mp),) + st, manifest)
 
     def _write_manifest(self, manifest: dict):
         if not self.vam_dir:
             return
         mp = manifest_path_for(self.vam_dir)
         try:
-            mp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+            write_manifest_file(mp, manifest)
+            self._remember_manifest(mp, manifest)
         except Exception:
             pass
 
-    def restore_offloaded_vars(self):
+    def restore_offloaded_vars(self, after_vam_closed: bool = False):
+        """
+        Rename everything in the manifest back (on a RenameWorker); the manifest and
+        journal are removed in _on_restore_done. after_vam_closed: started by the
+        VaM.exe monitor, reported in the status line.
+        """
         if not self.vam_dir:
             QMessageBox.warning(self, "No folder", "Select VaM directory first.")
             return
+        if self._renames_running():
+            return
 
         addon_dir = self.vam_dir / "AddonPackages"
         mp = manifest_path_for(self.vam_dir)
+        self._invalidate_addon_scan()
+        self._last_applied = None
 
         if not mp.exists():
             QMessageBox.information(self, "Nothing to restore", "No manifest found.")
@@ -4657,162 +5874,151 @@ class MainWindow(QWidget):
             return
 
         try:
-            manifest = json.loads(mp.read_text(encoding="utf-8"))
+            manifest = read_manifest_file(mp)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to read manifest:\n{e}")
             return
 
         renamed = manifest.get("renamed", [])
-        restored = 0
-
-        if isinstance(renamed, list):
-            for item in renamed:
-                if not isinstance(item, dict):
-                    continue
-                src_name = item.get("to_rel") or item.get("to")
-                dst_name = item.get("from_rel") or item.get("from")
-                if not src_name or not dst_name:
-                    continue
-
-                src = addon_dir / str(src_name)
-                dst = addon_dir / str(dst_name)
-                dst.parent.mkdir(parents=True, exist_ok=True)
+        # the session ends either way; no more monitor ticks while the restore runs
+        self._stop_vam_polling()
+        self._restore_after_vam_closed = after_vam_closed
+        self._start_rename_job(
+            "restore", "VaM.exe closed. Restoring VARs..." if after_vam_closed else "Restoring VARs...",
+            self._on_restore_done, restore_renames,
+            addon_dir=addon_dir, items=renamed if isinstance(renamed, list) else [],
+            journal=manifest_journal_path(mp),
+        )
 
-                if src.exists() and not dst.exists():
-                    try:
-                        src.rename(dst)
-                        restored += 1
-                    except Exception:
-                        pass
+    def _on_restore_done(self, result):
+        assert self.vam_dir is not None
+        addon_dir = self.vam_dir / "AddonPackages"
+        mp = manifest_path_for(self.vam_dir)
+        restored = 0 if isinstance(result, Exception) else result[0]
 
         try:
             mp.unlink(missing_ok=True)
+            manifest_journal_path(mp).unlink(missing_ok=True)
         except Exception:
             pass
 
+        self._manifest_memo = None
         self.lean_active = False
         self.vam_seen_running = False
-        self.poll_timer.stop()
+        self._stop_vam_polling()
 
-        self.session_baseline_scene_vars = set()
+        self.session_baseline_scene_vars = frozenset()
         self.selection_dirty = False
         self.set_apply_attention(False)
 
+        if self._restore_after_vam_closed:
+            self.status.setText("Restore done. You can launch again.")
+        else:
+            self.status.setText(f"VaM Directory:\n{self.vam_dir}")
+        self._start_lazy_preview_loader()
         QMessageBox.information(self, "Restored", f"Restored {restored} VARs back to normal in:\n{addon_dir}")
-        self.refresh_restore_button()
-        self.refresh_apply_button()
 
-    def _scene_vars_for_launch(self) -> set[str]:
-        if self.selected_scene_vars:
-            return set(self.selected_scene_vars)
-        return self.all_var_names_catalog()
+    def _scene_vars_for_launch(self) -> frozenset[str]:
+        # one immutable snapshot per click: used for the keep set and kept as the baseline
+        return frozenset(self.selected_scene_vars or self.all_var_names_catalog())
 
     def compute_keep_set_for_scene_vars(self, scene_vars: set[str]) -> set[str]:
         assert self.addon_dir is not None
 
-      
-        all_vars = self.all_var_names_on_disk()
-
-        # Protect assets/plugins by name (same behavior as before, but now sees everything)
-        protected = {v for v in all_vars if is_asset_var(v)}
-        protected |= {v for v in all_vars if "[plugin]" in v.lower()}
-
-        keep = set(protected)
-        keep |= self.whitelist_var_names()
-        queue: list[str] = []
-
-        # Seed selected scene vars
-        for scene_var in scene_vars:
-            if scene_var in all_vars:
-                keep.add(scene_var)
-                queue.extend(self._deps_for_var_name(scene_var))
-
-
-        # Resolve dependencies recursively
-        while queue:
-            dep = queue.pop()
-            for matched_var in resolve_dependency(dep, all_vars):
-                if matched_var not in keep:
-                    keep.add(matched_var)
-                    queue.extend(self._deps_for_var_name(matched_var))
-
-
+        # Same selection, VAR names, deps and whitelist as last time (typically the
+        # empty selection = every scene var, re-applied) -> reuse the closure.
+        # Keyed on names, not the listing object: our own renames only flip
+        # .var/.disabled, which doesn't change the answer. Refresh drops it.
+        scene_vars = frozenset(scene_vars)
+        whitelist = frozenset(self.whitelist_var_names())
+        # one listing stamp check (a folder-tree walk) for the whole pass
+        scan = self._addon_var_files()
+        all_vars = self._addon_enabled | self._addon_disabled
+        memo = self._keep_memo
+        if (memo is not None and memo[2] is self._var_deps_cache
+                and memo[0] == scene_vars and memo[3] == whitelist and memo[1] == all_vars):
+            return set(memo[4])
+
+        keep = set(self._protected_vars(scan))
+        keep |= whitelist
+
+        # Seed selected scene vars (expanded even if protected, as before);
+        # protected/whitelisted vars that aren't reached otherwise are not expanded
+        frontier = {v for v in scene_vars if v in all_vars}
+        keep |= frontier
+
+        # Level-by-level closure as set arithmetic: each var's resolved targets are
+        # memoized, so a level is one union and one difference. Each level's
+        # uncached scans run in parallel first.
+        dep_targets = self._dep_targets_resolver(scan)
+        while frontier:
+            self._prefetch_var_scans([v for v in frontier if v not in self._dep_targets_memo])
+            new = set().union(*map(dep_targets, frontier))
+            new -= keep
+            keep |= new
+            frontier = new
+
+        self._keep_memo = (scene_vars, frozenset(all_vars), self._var_deps_cache, whitelist, frozenset(keep))
         return keep
 
-
-
-    def disable_unrelated_vars_by_rename(self, keep_set: set[str]) -> dict:
+    def _dep_targets_resolver(self, scan: list[tuple[str, str]]):
         """
-        Initial disable pass (used when starting a session).
-        Works with both enabled and disabled state.
-        Only disables currently enabled .var that are not in keep_set.
+        var_name -> frozenset of VAR names its dependencies resolve to, for one
+        keep-set pass over the listing scan. Memoized per AddonPackages listing and
+        deps-cache (either changing resets it), checked once here rather than per
+        var; dependency strings shared by many packages are resolved once.
         """
-        assert self.vam_dir is not None
-        addon_dir = self.vam_dir / "AddonPackages"
-        mp = manifest_path_for(self.vam_dir)
-
-        renamed: list[dict] = []
-        failed: list[str] = []
-
-        for orig_name, actual_path in fast_list_vars_all_states(addon_dir, exclude_dir_names={WHITELIST_DIR_NAME}):
-            if self._is_path_in_whitelist(actual_path):
-                continue
-            if not actual_path.name.lower().endswith(".var"):
-                continue
-            src = actual_path
-            if orig_name in keep_set:
-                continue
-            dst = src.with_name(orig_name + DISABLED_SUFFIX)
-            if dst.exists():
-                continue
-            try:
-                rel_from = src.relative_to(addon_dir)
-                rel_to = dst.relative_to(addon_dir)
-                src.rename(dst)
-                renamed.append({
-                    "from": orig_name,
-                    "to": dst.name,
-                    "from_rel": str(rel_from).replace("\\", "/"),
-                    "to_rel": str(rel_to).replace("\\", "/"),
-                })
-            except Exception:
-                failed.append(orig_name)
-
-        manifest = {
-            "addon_dir": str(addon_dir),
-            "method": "rename_disabled",
-            "disabled_suffix": DISABLED_SUFFIX,
-            "renamed": renamed,
-            "saved_at": time.time(),
-        }
-
-        mp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
-
-        if failed:
-            try:
-                log_path = app_data_dir() / "disable_failures.txt"
-                log_path.write_text("\n".join(failed), encoding="utf-8")
-                QMessageBox.warning(
-                    self,
-                    "Some VARs could not be disabled",
-                    f"{len(failed)} VAR files could not be renamed."
-                )
-            except Exception:
-                pass
-        return manifest
+        src = self._dep_targets_src
+        if src is None or src[0] is not scan or src[1] is not self._var_deps_cache:
+            self._dep_targets_memo = {}
+            self._dep_resolved_memo = {}
+            self._dep_targets_src = (scan, self._var_deps_cache)
+            self._dep_all_vars = self._addon_enabled | self._addon_disabled
+        memo = self._dep_targets_memo
+        resolved = self._dep_resolved_memo
+        all_vars = self._dep_all_vars
+        index = self._dependency_index(scan)
+        deps_for = self._deps_for_var_name
+
+        def dep_targets(var_name: str) -> frozenset[str]:
+            hit = memo.get(var_name)
+            if hit is not None:
+                return hit
+            targets: set[str] = set()
+            for dep in deps_for(var_name):
+                r = resolved.get(dep)
+                if r is None:
+                    r = frozenset(resolve_dependency(dep, all_vars, index))
+                    resolved[dep] = r
+                targets |= r
+            out = frozenset(targets)
+            memo[var_name] = out
+            return out
 
+        return dep_targets
 
-    def _apply_keep_set_live(self, keep_set: set[str]) -> tuple[int, int]:
+    def _prefetch_var_scans(self, var_names: list[str]):
         """
-        LIVE apply:
-        - Restore anything that should now be kept (if currently disabled by our tool)
-        - Disable anything not in keep_set (but only if currently enabled)
-        Returns: (disabled_count, restored_count)
+        Warm cached_scan_var_meta for vars whose deps aren't in the scene cache,
+        so _deps_for_var_name finds them memoized. Zip open + meta.json read is
+        I/O bound, so a small thread pool overlaps the reads.
         """
-        assert self.vam_dir is not None
-        addon_dir = self.vam_dir / "AddonPackages"
-        mp = manifest_path_for(self.vam_dir)
+        paths = [
+            p for v in var_names
+            if v not in self._var_deps_cache and (p := self.get_var_existing_path(v))
+        ]
+        if len(paths) < 2:
+            return
+        if self._scan_pool is None:
+            self._scan_pool = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="vsc-scan"
+            )
+        list(self._scan_pool.map(cached_scan_var_meta, paths))
+
 
+
+    def _tool_items_from_manifest(self) -> list[dict]:
+        # files our tool disabled, as {"from", "from_rel", "to_rel"}
         manifest = self._read_manifest()
         renamed_list = manifest.get("renamed", [])
         if not isinstance(renamed_list, list):
@@ -4833,73 +6039,58 @@ class MainWindow(QWidget):
                 "from_rel": dst_rel,
                 "to_rel": src_rel,
             })
+        return tool_items
 
-        disabled_count = 0
-        restored_count = 0
-        failed: list[str] = []
-
-        # 1) Restore tool-disabled vars that are now in keep_set
-        remaining: list[dict] = []
-        for item in tool_items:
-            orig = item.get("from", "")
-            if orig not in keep_set:
-                remaining.append(item)
-                continue
-            src = addon_dir / item.get("to_rel", "")
-            dst = addon_dir / item.get("from_rel", "")
-            if src.exists() and not dst.exists():
-                try:
-                    dst.parent.mkdir(parents=True, exist_ok=True)
-                    src.rename(dst)
-                    restored_count += 1
-                except Exception:
-                    remaining.append(item)
-            else:
-                remaining.append(item)
-
-        # 2) Disable vars NOT in keep_set (only if currently enabled)
-        disabled_by_tool = {item.get("from") for item in remaining if item.get("from")}
-        for orig, actual_path in fast_list_vars_all_states(addon_dir, exclude_dir_names={WHITELIST_DIR_NAME}):
-            if self._is_path_in_whitelist(actual_path):
-                continue
-            if not actual_path.name.lower().endswith(".var"):
-                continue
-            src = actual_path
-            if orig in keep_set:
-                continue
-            if orig in disabled_by_tool:
-                continue
-            dst = src.with_name(orig + DISABLED_SUFFIX)
-            if dst.exists():
-                continue
-            try:
-                rel_from = src.relative_to(addon_dir)
-                rel_to = dst.relative_to(addon_dir)
-                src.rename(dst)
-                remaining.append({
-                    "from": orig,
-                    "from_rel": str(rel_from).replace("\\", "/"),
-                    "to_rel": str(rel_to).replace("\\", "/"),
-                })
-                disabled_count += 1
-            except Exception:
-                failed.append(orig)
-
-        # 3) Write updated manifest from tool_map (only what tool currently disables)
-        new_manifest = {
-            "addon_dir": str(addon_dir),
-            "method": "rename_disabled",
-            "disabled_suffix": DISABLED_SUFFIX,
-            "renamed": [
-                {"from": i.get("from"), "to": Path(i.get("to_rel", "")).name, "from_rel": i.get("from_rel"), "to_rel": i.get("to_rel")}
-                for i in remaining
-            ],
-            "saved_at": time.time(),
-        }
+    def _finish_live_apply(self, keep_set: set[str], tool_items: list[dict], remaining: list[dict],
+                           failed: list[str], disabled_count: int, restored_count: int,
+                           journaled: bool = False) -> tuple[int, int]:
+        """
+        GUI-thread tail of a live apply: manifest write, failure log, no-op stamp.
+        journaled: the rename pass already appended its delta to the journal.
+        """
+        assert self.vam_dir is not None
+        addon_dir = self.vam_dir / "AddonPackages"
+        mp = manifest_path_for(self.vam_dir)
+        self._invalidate_addon_scan()
+
+        # 3) Record what the tool now disables: append this apply's delta to the
+        # journal (unless the rename pass already did), or rewrite the manifest
+        # when there is none yet or the journal has outgrown it
+        renamed = [
+            {"from": i.get("from"), "to": Path(i.get("to_rel", "")).name, "from_rel": i.get("from_rel"), "to_rel": i.get("to_rel")}
+            for i in remaining
+        ]
+        base = self._read_manifest()
+        before = {_manifest_item_key(i) for i in tool_items}
+        after = {_manifest_item_key(i) for i in renamed}
         try:
-            mp.write_text(json.dumps(new_manifest, indent=2), encoding="utf-8")
+            st = manifest_stamp(mp)
+            if base and st is not None and before == after:
+                # nothing renamed or restored: leave manifest + journal untouched
+                pass
+            elif not base or st is None or st[3] > st[1]:
+                new_manifest = {
+                    "addon_dir": str(addon_dir),
+                    "method": "rename_disabled",
+                    "disabled_suffix": DISABLED_SUFFIX,
+                    "renamed": renamed,
+                    "saved_at": time.time(),
+                }
+                write_manifest_file(mp, new_manifest)
+                self._remember_manifest(mp, new_manifest)
+            else:
+                if not journaled:
+                    # replay is keyed by from_rel, so re-adding records a partial journal holds is harmless
+                    append_manifest_journal(
+                        mp,
+                        [i for i in renamed if _manifest_item_key(i) not in before],
+                        [k for k in before if k not in after],
+                    )
+                new_manifest = dict(base)
+                new_manifest["renamed"] = renamed
+                self._remember_manifest(mp, new_manifest)
         except Exception:
-            pass
+            self._manifest_memo = None
 
         if failed:
             try:
@@ -4913,8 +6104,26 @@ class MainWindow(QWidget):
             except Exception:
                 pass
 
+        # a repeat Apply with the same keep set and untouched files is a no-op
+        self._last_applied = None if failed else (frozenset(keep_set), self._apply_stamp())
         return disabled_count, restored_count
 
+    def _apply_stamp(self) -> tuple | None:
+        """
+        What a live apply depends on besides the keep set: the manifest + journal and the
+        mtime of every folder under AddonPackages (a rename, add or remove anywhere in the
+        tree moves its parent folder's mtime).
+        """
+        if not self.vam_dir:
+            return None
+        st = manifest_stamp(manifest_path_for(self.vam_dir))
+        if st is None:
+            return None
+        mtimes = dir_mtime_map(self.vam_dir / "AddonPackages")
+        if not mtimes:
+            return None
+        return st + (mtimes,)
+
 
     def apply_selection_now_clicked(self):
         """
@@ -4926,9 +6135,10 @@ class MainWindow(QWidget):
             QMessageBox.warning(self, "No folder", "Select VaM directory first.")
             return
 
-        running = self.is_vam_running()
+        running = self.is_vam_running(max_age=0)
         mp = manifest_path_for(self.vam_dir)
         mp_exists = mp.exists()
+        scene_vars = self._scene_vars_for_launch()
 
         if not running and not mp_exists:
             QMessageBox.information(
@@ -4952,39 +6162,159 @@ class MainWindow(QWidget):
             if reply != QMessageBox.Yes:
                 return
             
-            self.session_baseline_scene_vars = set(self._scene_vars_for_launch())
+            self.session_baseline_scene_vars = scene_vars
             self.selection_dirty = False
             self.set_apply_attention(False)
 
         # Apply live changes
         try:
-            scene_vars = self._scene_vars_for_launch()
             keep_set = self.compute_keep_set_for_scene_vars(scene_vars)
 
-            self.progress.setVisible(True)
-            self.progress.setRange(0, 0)
-            self.status.setText("Applying selection (live)...")
+            last = self._last_applied
+            if mp_exists and last is not None and last[1] is not None and last[0] == keep_set and last[1] == self._apply_stamp():
+                self.session_baseline_scene_vars = scene_vars
+                self.selection_dirty = False
+                self.set_apply_attention(False)
+                self.status.setText(f"VaM Directory:\n{self.vam_dir}\nSelection already applied (no changes).")
+                self.refresh_restore_button()
+                self.refresh_apply_button()
+                return
 
-            # If no manifest exists yet, do initial disable to create manifest
-            if not mp_exists:
-                self._stop_all_preview_loaders()
-                self.disable_unrelated_vars_by_rename(keep_set)
+            # no manifest yet: the live pass with no tool items disables everything unrelated
+            self._apply_was_running = running
+            self._start_live_apply("apply", keep_set, scene_vars, "Applying selection (live)...", self._on_apply_done)
+            return
 
-            self._stop_all_preview_loaders()
-            disabled_n, restored_n = self._apply_keep_set_live(keep_set)
+        except Exception as e:
+            self.progress.setVisible(False)
+            self.status.setText(f"VaM Directory:\n{self.vam_dir}")
+            QMessageBox.critical(self, "Apply failed", f"Failed to apply selection:\n{e}")
+
+        self.refresh_restore_button()
+        self.refresh_apply_button()
+
+    def _renames_running(self) -> bool:
+        # from _start_rename_job until its done slot has settled the manifest
+        return bool(getattr(self, "_rename_job", ""))
+
+    _RENAME_JOB_TEXT = {
+        "apply": "Selection is still being applied.",
+        "launch": "VARs are still being disabled for the launch.",
+        "restore": "VARs are still being restored.",
+    }
+
+    def _warn_if_renaming(self) -> bool:
+        if not self._renames_running():
+            return False
+        QMessageBox.information(
+            self, "Please wait",
+            f"{self._RENAME_JOB_TEXT.get(self._rename_job, '')}\nPlease wait until it finishes."
+        )
+        return True
+
+    def _start_rename_job(self, job: str, status: str, on_done, fn, **kwargs):
+        """
+        Run fn(**kwargs) on a RenameWorker (one job at a time; Refresh, folder change,
+        Launch, Apply and Restore are gated while it runs). on_done(result) runs on
+        the GUI thread.
+        """
+        self._stop_all_preview_loaders()
+        self._invalidate_addon_scan()
+        w = RenameWorker(fn, kwargs, self)
+        w.progress.connect(self._on_rename_progress)
+        w.done.connect(self._on_rename_done)
+        w.finished.connect(lambda w=w: self._rename_thread_finished(w))
+        self._rename_job = job
+        self._rename_on_done = on_done
+        self.rename_worker = w
+        self.progress.setVisible(True)
+        self.progress.setRange(0, 0)
+        self.status.setText(status)
+        self.btn_apply_now.setEnabled(False)
+        self.btn_restore.setEnabled(False)
+        self.refresh_refresh_button()
+        w.start()
+
+    def _rename_thread_finished(self, w: RenameWorker):
+        # the reference is held until the thread has really ended (closeEvent waits on it)
+        if self.rename_worker is w:
+            self.rename_worker = None
+        w.deleteLater()
+
+    def _on_rename_progress(self, done: int, total: int):
+        if total <= 0:
+            return
+        if self.progress.maximum() != total:
+            self.progress.setRange(0, total)
+        self.progress.setValue(done)
+
+    def _on_rename_done(self, result):
+        on_done = self._rename_on_done
+        self._rename_on_done = None
+        self._rename_job = ""
+        self.progress.setVisible(False)
+        self.refresh_refresh_button()
+        try:
+            on_done(result)
+        finally:
+            self.refresh_restore_button()
+            self.refresh_apply_button()
+
+    def _start_live_apply(self, job: str, keep_set: set[str], scene_vars: frozenset[str], status: str, on_done):
+        """
+        Live apply renames for Apply and Launch. Without a manifest an empty one is
+        written first so the journal has a base; each rename is then journaled as it
+        happens (a close mid-apply loses nothing) and the manifest is settled by
+        _finish_live_apply in the done slot.
+        """
+        assert self.vam_dir is not None and self.addon_dir is not None
+        mp = manifest_path_for(self.vam_dir)
+        if mp.exists():
+            tool_items = self._tool_items_from_manifest()
+        else:
+            tool_items = []
+            first = {
+                "addon_dir": str(self.addon_dir),
+                "method": "rename_disabled",
+                "disabled_suffix": DISABLED_SUFFIX,
+                "renamed": [],
+                "saved_at": time.time(),
+            }
+            write_manifest_file(mp, first)
+            self._remember_manifest(mp, first)
+        self._apply_keep_set = keep_set
+        self._apply_tool_items = tool_items
+        self._apply_scene_vars = scene_vars
+        self._start_rename_job(
+            job, status, on_done, live_apply_renames,
+            addon_dir=self.addon_dir, keep_set=set(keep_set), tool_items=tool_items,
+            whitelist_dir=self._whitelist_dir(), journal=manifest_journal_path(mp),
+        )
+
+    def _settle_live_apply(self, result) -> tuple[int, int]:
+        # done-slot half of _start_live_apply: (disabled, restored); raises what the pass raised
+        if isinstance(result, Exception):
+            raise result
+        remaining, disabled_count, restored_count, failed, journaled = result
+        return self._finish_live_apply(
+            self._apply_keep_set, self._apply_tool_items, remaining, failed,
+            disabled_count, restored_count, journaled,
+        )
+
+    def _on_apply_done(self, result):
+        try:
+            disabled_n, restored_n = self._settle_live_apply(result)
 
-            # update baseline after successful apply
-            self.session_baseline_scene_vars = set(self._scene_vars_for_launch())
+            # baseline is the selection that was applied (it may have changed while the worker ran)
+            self.session_baseline_scene_vars = self._apply_scene_vars
             self.selection_dirty = False
             self.set_apply_attention(False)
 
-
             # Mark session active and start monitoring (if VaM already running, mark as seen)
             self.lean_active = True
-            self.vam_seen_running = running
-            self.poll_timer.start()
+            self.vam_seen_running = self._apply_was_running
+            self._start_vam_polling()
 
-            self.progress.setVisible(False)
             self.status.setText(f"VaM Directory:\n{self.vam_dir}")
 
             self._start_lazy_preview_loader()
@@ -4996,23 +6326,25 @@ class MainWindow(QWidget):
             )
 
         except Exception as e:
-            self.progress.setVisible(False)
+            self._invalidate_addon_scan()
             self.status.setText(f"VaM Directory:\n{self.vam_dir}")
             QMessageBox.critical(self, "Apply failed", f"Failed to apply selection:\n{e}")
 
-        self.refresh_restore_button()
-        self.refresh_apply_button()
-
-    def _start_lean_session_or_warn(self) -> bool:
+    def _start_lean_session_or_warn(self, launch) -> bool:
         """
         For launching: we still require VaM is NOT running.
         Live mode uses Apply Selection Now instead.
+        The disable renames run on a RenameWorker; launch() is called once they
+        are done and the session is active. False if nothing was started.
         """
         if not self.vam_dir or not self.addon_dir:
             QMessageBox.warning(self, "No folder", "Select VaM directory first.")
             return False
 
-        if self.is_vam_running():
+        if self._warn_if_renaming():
+            return False
+
+        if self.is_vam_running(max_age=0):
             QMessageBox.warning(self, "VaM is running", "Close VaM.exe first, then launch from this app.\n\n(Use Apply Selection Now for live changes.)")
             return False
 
@@ -5042,25 +6374,39 @@ class MainWindow(QWidget):
 
         try:
             keep_set = self.compute_keep_set_for_scene_vars(scene_vars)
-            self._stop_all_preview_loaders()
-            self.disable_unrelated_vars_by_rename(keep_set)
+            self._launch_then = launch
+            self._start_live_apply("launch", keep_set, scene_vars, "Disabling unrelated VARs...", self._on_launch_renames_done)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to disable vars:\n{e}")
             self.refresh_restore_button()
             self.refresh_apply_button()
             return False
+        return True
+
+    def _on_launch_renames_done(self, result):
+        launch = self._launch_then
+        self._launch_then = None
+        try:
+            self._settle_live_apply(result)
+        except Exception as e:
+            self._invalidate_addon_scan()
+            self.status.setText(f"VaM Directory:\n{self.vam_dir}")
+            QMessageBox.critical(self, "Error", f"Failed to disable vars:\n{e}")
+            return
 
         self.lean_active = True
         self.vam_seen_running = False
-        self.poll_timer.start()
+        self._start_vam_polling()
         # baseline selection for this session
-        self.session_baseline_scene_vars = set(self._scene_vars_for_launch())
+        self.session_baseline_scene_vars = self._apply_scene_vars
         self.selection_dirty = False
         self.set_apply_attention(False)
+        self.status.setText(f"VaM Directory:\n{self.vam_dir}")
 
         self.refresh_restore_button()
         self.refresh_apply_button()
-        return True
+        if launch is not None:
+            launch()
     
         # ======================
     # Virtual Desktop Streamer helpers
@@ -5134,10 +6480,10 @@ class MainWindow(QWidget):
             )
             return
 
-        # 3) start lean session (NOW vars can be renamed)
-        if not self._start_lean_session_or_warn():
-            return
+        # 3) start lean session (NOW vars can be renamed); 4) runs once they are
+        self._start_lean_session_or_warn(lambda: self._launch_vam_vd(vd_streamer))
 
+    def _launch_vam_vd(self, vd_streamer: Path):
         # 4) launch VaM via VD
         vam_exe = self.get_vam_exe_path()
         if not vam_exe:
@@ -5156,9 +6502,9 @@ class MainWindow(QWidget):
 
 
     def launch_vam_exe_lean(self):
-        if not self._start_lean_session_or_warn():
-            return
+        self._start_lean_session_or_warn(self._launch_vam_exe)
 
+    def _launch_vam_exe(self):
         vam_exe = self.get_vam_exe_path()
         if not vam_exe:
             QMessageBox.critical(self, "Error", "VaM.exe not found. Please re-select VaM directory.")
@@ -5176,11 +6522,11 @@ class MainWindow(QWidget):
         self.refresh_apply_button()
 
     def launch_vam_launcher_lean(self):
-        if not self._start_lean_session_or_warn():
-            return
+        self._start_lean_session_or_warn(self._launch_vam_launcher)
 
+    def _launch_vam_launcher(self):
         updater = self.get_vam_updater_path()
-        if not updater or not updater.exists():
+        if not updater or not cached_exists(updater):
             QMessageBox.warning(self, "Not found", "VaM_Updater.exe not found in VaM directory.\n\nRestoring now...")
             self.restore_offloaded_vars()
             return
@@ -5195,25 +6541,56 @@ class MainWindow(QWidget):
         self.status.setText("Launched VaM Launcher. Waiting for VaM.exe to start (desktop/VR)...")
         self.refresh_apply_button()
 
-    def check_vam_state(self):
+    def _start_vam_polling(self):
+        w = self.vam_state_worker
+        if w is not None and w.isRunning():
+            if not w.isInterruptionRequested():
+                return
+            # a stopping poller exits within one sleep slice / probe
+            w.wait()
+        w = VamStateWorker(1000, self)
+        w.state.connect(self._on_vam_state)
+        w.finished.connect(lambda w=w: self._vam_poller_finished(w))
+        self.vam_state_worker = w
+        w.start()
+
+    def _stop_vam_polling(self):
+        # the reference stays until finished fires, so closeEvent can still wait() on it
+        w = self.vam_state_worker
+        if w is None:
+            return
+        try:
+            w.state.disconnect(self._on_vam_state)
+        except Exception:
+            pass
+        w.requestInterruption()
+
+    def _vam_poller_finished(self, w: VamStateWorker):
+        if self.vam_state_worker is w:
+            self.vam_state_worker = None
+        w.deleteLater()
 
-        self.refresh_apply_button()
+    def _on_vam_state(self, running: bool):
+        self._vam_running_cache = (time.monotonic(), running)
+        self.refresh_apply_button(running)
 
         if not self.lean_active:
           
             return
 
-        running = self.is_vam_running()
-
         if running and not self.vam_seen_running:
             self.vam_seen_running = True
             self.status.setText("VaM.exe detected running. Monitoring until it closes...")
             return
 
         if self.vam_seen_running and not running:
-            self.status.setText("VaM.exe closed. Restoring VARs...")
-            self.restore_offloaded_vars()
-            self.status.setText("Restore done. You can launch again.")
+            if self._renames_running():
+                # picked up again on the first tick after the running apply finishes
+                if self._rename_job != "restore":
+                    self.status.setText("VaM.exe closed. Restoring VARs once the current apply finishes...")
+                return
+            # "Restore done" is reported by _on_restore_done
+            self.restore_offloaded_vars(after_vam_closed=True)
             return
 
 
@@ -5224,14 +6601,13 @@ if __name__ == "__main__":
         f.setPointSize(10)
         app.setFont(f)
 
-    icon_path = resource_path("icons/app.ico")
-    if icon_path.exists():
-        icon = QIcon(str(icon_path))
+    icon = _icon("icons/app.ico")
+    if icon:
         app.setWindowIcon(icon)
 
     window = MainWindow()
-    if icon_path.exists():
-        window.setWindowIcon(QIcon(str(icon_path)))
+    if icon:
+        window.setWindowIcon(icon)
 
     window.show()
     sys.exit(app.exec())